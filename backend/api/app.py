@@ -10,6 +10,12 @@ from litestar.stores.redis import RedisStore
 
 from backend.api.routes import routes
 from backend.config import settings
+from backend.infrastructure.data_updates import (
+    start_data_update_listener,
+    stop_data_update_listener,
+)
+from backend.infrastructure.http_client import close_http_client, get_http_client
+from backend.infrastructure.redis_client import close_redis_client, get_redis_client
 
 
 def create_app() -> Litestar:
@@ -18,10 +24,12 @@ def create_app() -> Litestar:
     # Configure logging
     logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-    # Configure stores (using RedisStore for production caching)
+    # Configure stores (using RedisStore for production caching), sharing the
+    # process-wide connection pool; it is closed by the shutdown hook, not the stores
+    redis = get_redis_client()
     stores = {
-        "default": RedisStore.with_client(url=settings.redis_url),
-        "rate_limit": RedisStore.with_client(url=settings.redis_url),
+        "default": RedisStore(redis),
+        "rate_limit": RedisStore(redis),
     }
 
     # Configure rate limiting
@@ -47,6 +55,8 @@ def create_app() -> Litestar:
         stores=stores,
         cors_config=cors_config,
         middleware=[rate_limit_config.middleware],
+        on_startup=[get_http_client, get_redis_client, start_data_update_listener],
+        on_shutdown=[stop_data_update_listener, close_http_client, close_redis_client],
         openapi_config=OpenAPIConfig(
             title="BetterForces API",
             version="1.0.0",
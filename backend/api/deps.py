@@ -16,9 +16,9 @@ from backend.infrastructure.task_queue import TaskQueue
 from backend.infrastructure.redis_client import get_redis_client
 
 
-def get_codeforces_data_service() -> CodeforcesDataService:
-    """Dependency provider for CodeforcesDataService."""
-    return CodeforcesDataService()
+def get_codeforces_data_service(redis: Redis) -> CodeforcesDataService:
+    """Dependency provider for CodeforcesDataService (shares the Codeforces rate limit)."""
+    return CodeforcesDataService(redis)
 
 
 def get_abandoned_problems_service() -> AbandonedProblemsService:
@@ -46,15 +46,14 @@ def get_division_problems_service() -> DivisionProblemsService:
     return DivisionProblemsService()
 
 
-async def get_redis() -> Redis:
-    """Dependency provider for Redis client."""
-    return await get_redis_client()
+def get_redis() -> Redis:
+    """Dependency provider for the process-wide Redis client."""
+    return get_redis_client()
 
 
-async def get_task_queue() -> TaskQueue:
-    """Dependency provider for TaskQueue."""
-    redis = await get_redis_client()
-    return TaskQueue(redis)
+def get_task_queue() -> TaskQueue:
+    """Dependency provider for TaskQueue (on the process-wide Redis client)."""
+    return TaskQueue(get_redis_client())
 
 
 def get_request_metadata(request: Request) -> Dict[str, Any]:
@@ -79,5 +78,5 @@ division_problems_service_dependency = Provide(
 )
 tags_service_dependency = Provide(get_tags_service, sync_to_thread=False)
 request_metadata_dependency = Provide(get_request_metadata, sync_to_thread=False)
-redis_dependency = Provide(get_redis)
-task_queue_dependency = Provide(get_task_queue)
+redis_dependency = Provide(get_redis, sync_to_thread=False)
+task_queue_dependency = Provide(get_task_queue, sync_to_thread=False)
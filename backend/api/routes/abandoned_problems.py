@@ -1,7 +1,7 @@
 """Abandoned problems API routes."""
 
-import asyncio
 from datetime import datetime, timezone
+from functools import partial
 from typing import Union
 
 from litestar import get
@@ -21,14 +21,16 @@ from backend.domain.models.time_period import TimePeriod
 from backend.api.schemas.abandoned_problems import (
     AbandonedProblemByRatingsResponse,
     AbandonedProblemByTagsResponse,
-    RatingAbandonedSchema,
-    TagAbandonedSchema,
 )
 from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.services.abandoned_problems_service import AbandonedProblemsService
 from backend.services.codeforces_data_service import CodeforcesDataService
 from backend.infrastructure.codeforces_client import UserNotFoundError
 from backend.infrastructure.task_queue import TaskQueue
+from backend.services.metric_responses import (
+    abandoned_by_ratings_response,
+    abandoned_by_tags_response,
+)
 
 
 class AbandonedProblemsController(BaseMetricController):
@@ -77,69 +79,28 @@ class AbandonedProblemsController(BaseMetricController):
             Abandoned problems analysis grouped by tags
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            tags = [
-                TagAbandonedSchema(
-                    tag=tag_stats.tag,
-                    problem_count=tag_stats.problem_count,
-                    total_failed_attempts=tag_stats.total_failed_attempts,
-                )
-                for tag_stats in analysis.tags_stats
-            ]
-
-            response = AbandonedProblemByTagsResponse(
-                tags=tags,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            tags = [
-                TagAbandonedSchema(
-                    tag=tag_stats.tag,
-                    problem_count=tag_stats.problem_count,
-                    total_failed_attempts=tag_stats.total_failed_attempts,
-                )
-                for tag_stats in analysis.tags_stats
-            ]
-
-            response = AbandonedProblemByTagsResponse(
-                tags=tags,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
+        start_date = period.to_start_date(now=datetime.now(timezone.utc))
+
+        build = partial(abandoned_by_tags_response, abandoned_service, handle)
+
+        # Case 1: Fresh data; Case 2: Stale data and !prefer_fresh (refreshed in the background)
+        response, cached = await self.respond_from_cache(
+            redis,
+            task_queue,
+            handle,
+            start_date,
+            prefer_fresh,
+            endpoint="abandoned-problems/by-tags",
+            params={"period": period},
+            build=build,
+        )
+        if response is not None:
+            return response
 
         # Case 3: No data or prefer_fresh
+        if not cached:
+            await self._ensure_handle_exists(data_service, handle)
+
         try:
             task_id = await task_queue.enqueue(handle)
             return Response(
@@ -157,29 +118,10 @@ class AbandonedProblemsController(BaseMetricController):
                     status_code=404, detail=f"User '{handle}' not found on Codeforces"
                 )
 
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
+            submissions = self._filter_by_date_range(submissions, start_date=start_date)
             self._validate_submissions_exist(submissions, handle)
 
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            tags = [
-                TagAbandonedSchema(
-                    tag=tag_stats.tag,
-                    problem_count=tag_stats.problem_count,
-                    total_failed_attempts=tag_stats.total_failed_attempts,
-                )
-                for tag_stats in analysis.tags_stats
-            ]
-
-            response = AbandonedProblemByTagsResponse(
-                tags=tags,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
+            return Response(build(submissions), headers=self._cache_headers())
 
     @get(
         path="/by-ratings/{handle:str}",
@@ -221,69 +163,28 @@ class AbandonedProblemsController(BaseMetricController):
             Abandoned problems analysis grouped by rating bins
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            ratings = [
-                RatingAbandonedSchema(
-                    rating=rating_stats.rating,
-                    problem_count=rating_stats.problem_count,
-                    total_failed_attempts=rating_stats.total_failed_attempts,
-                )
-                for rating_stats in analysis.ratings_stats
-            ]
-
-            response = AbandonedProblemByRatingsResponse(
-                ratings=ratings,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            ratings = [
-                RatingAbandonedSchema(
-                    rating=rating_stats.rating,
-                    problem_count=rating_stats.problem_count,
-                    total_failed_attempts=rating_stats.total_failed_attempts,
-                )
-                for rating_stats in analysis.ratings_stats
-            ]
-
-            response = AbandonedProblemByRatingsResponse(
-                ratings=ratings,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
+        start_date = period.to_start_date(now=datetime.now(timezone.utc))
+
+        build = partial(abandoned_by_ratings_response, abandoned_service, handle)
+
+        # Case 1: Fresh data; Case 2: Stale data and !prefer_fresh (refreshed in the background)
+        response, cached = await self.respond_from_cache(
+            redis,
+            task_queue,
+            handle,
+            start_date,
+            prefer_fresh,
+            endpoint="abandoned-problems/by-ratings",
+            params={"period": period},
+            build=build,
+        )
+        if response is not None:
+            return response
 
         # Case 3: No data or prefer_fresh
+        if not cached:
+            await self._ensure_handle_exists(data_service, handle)
+
         try:
             task_id = await task_queue.enqueue(handle)
             return Response(
@@ -301,26 +202,7 @@ class AbandonedProblemsController(BaseMetricController):
                     status_code=404, detail=f"User '{handle}' not found on Codeforces"
                 )
 
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
+            submissions = self._filter_by_date_range(submissions, start_date=start_date)
             self._validate_submissions_exist(submissions, handle)
 
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            ratings = [
-                RatingAbandonedSchema(
-                    rating=rating_stats.rating,
-                    problem_count=rating_stats.problem_count,
-                    total_failed_attempts=rating_stats.total_failed_attempts,
-                )
-                for rating_stats in analysis.ratings_stats
-            ]
-
-            response = AbandonedProblemByRatingsResponse(
-                ratings=ratings,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
+            return Response(build(submissions), headers=self._cache_headers())
@@ -1,18 +1,30 @@
-import json
+import asyncio
+import logging
 from datetime import datetime, timezone
+from typing import Any, Callable, Mapping
 
-from litestar import Controller
+from litestar import Controller, MediaType
 from litestar.exceptions import HTTPException
+from litestar.response import Response
 from redis.asyncio import Redis
 
+from backend.api.schemas.base import BaseAPISchema
+from backend.config import settings
 from backend.domain.models.codeforces import Submission
+from backend.infrastructure.codeforces_client import UserNotFoundError
+from backend.infrastructure.popularity import page_views
+from backend.infrastructure.precomputed_responses import load_precomputed_response
+from backend.infrastructure.response_cache import response_cache, response_key
+from backend.infrastructure.submission_cache import load_cached_submissions, read_cache_entry
+from backend.infrastructure.task_queue import TaskPriority, TaskQueue
+from backend.services.codeforces_data_service import CodeforcesDataService
+
+logger = logging.getLogger(__name__)
 
 
 class BaseMetricController(Controller):
     """Base class for all metric controllers with shared functionality."""
 
-    CACHE_HEADERS = {"Cache-Control": "public, max-age=14400"}
-
     @staticmethod
     def _filter_by_date_range(
         submissions: list[Submission],
@@ -60,6 +72,28 @@ class BaseMetricController(Controller):
                 detail=f"No submissions found for user '{handle}' in the specified date range",
             )
 
+    @staticmethod
+    async def _ensure_handle_exists(data_service: CodeforcesDataService, handle: str) -> None:
+        """
+        Reject a handle unknown to Codeforces before a fetch is queued for it.
+
+        Lookup failures other than "not found" do not block the request; the
+        worker reports them when it fetches the handle.
+
+        Args:
+            data_service: Codeforces data service
+            handle: Codeforces handle
+
+        Raises:
+            HTTPException: If the handle does not exist
+        """
+        try:
+            await data_service.validate_handle(handle)
+        except UserNotFoundError:
+            raise HTTPException(status_code=404, detail=f"User '{handle}' not found on Codeforces")
+        except Exception as e:
+            logger.warning(f"Could not validate handle {handle}: {e}")
+
     @staticmethod
     def get_current_timestamp() -> datetime:
         """
@@ -70,57 +104,123 @@ class BaseMetricController(Controller):
         """
         return datetime.now(timezone.utc)
 
-    @staticmethod
-    async def get_submissions_with_staleness(
-        redis: Redis, handle: str
-    ) -> tuple[list[Submission] | None, int, bool]:
+    async def respond_from_cache(
+        self,
+        redis: Redis,
+        task_queue: TaskQueue,
+        handle: str,
+        start_date: datetime | None,
+        prefer_fresh: bool,
+        endpoint: str,
+        params: Mapping[str, Any],
+        build: Callable[[list[Submission]], BaseAPISchema],
+    ) -> tuple[Response | None, bool]:
         """
-        Get submissions from cache with staleness information.
+        Answer from cached submissions: fresh data, or stale data plus a background refresh.
+
+        Serialized responses are kept per (endpoint, handle, params, data
+        version), so a repeated request skips decoding, analysis and schema
+        construction. With ``settings.worker_precompute_metrics``, a miss
+        first looks for the body the worker precomputed for the current data
+        version. While the worker is still backfilling a first load, only
+        the most recent submissions are cached; they are used only if they
+        cover the requested period.
 
         Args:
             redis: Redis client instance
+            task_queue: Task queue for the background refresh of stale data
             handle: Codeforces user handle
+            start_date: Start of the requested period (None for all time)
+            prefer_fresh: Do not answer from stale data
+            endpoint: Endpoint name for the response cache
+            params: Query parameters and other inputs (e.g. the contest division
+                mapping version) that change the response body
+            build: Builds the response from the submissions of the period
 
         Returns:
-            Tuple of (submissions, age_seconds, is_stale)
-            - submissions: List of Submission objects or None if not cached
-            - age_seconds: Age of cache in seconds
-            - is_stale: True if age > 4 hours (14400 seconds)
+            Tuple of (response, cached)
+            - response: JSON response, or None if a fetch has to be queued
+            - cached: True if submissions covering the period are cached
         """
-        from backend.domain.models.codeforces import Problem
-
-        cached = await redis.get(f"submissions:{handle}")
-        if not cached:
-            return None, 0, False
-
-        ttl = await redis.ttl(f"submissions:{handle}")
-        if ttl < 0:  # Key exists but has no TTL or expired
-            return None, 0, False
+        # Counting page views feeds the proactive refresh of popular handles in the worker
+        entry = await read_cache_entry(
+            redis, handle, with_payload=False, count_access=page_views.is_new_view(handle)
+        )
+        if entry is None or not entry.cache_age.covers(start_date):
+            return None, False
+
+        cache_age = entry.cache_age
+        if cache_age.is_stale and prefer_fresh:
+            return None, True
+
+        # Unversioned entries (written before data versions) are not cached
+        key = response_key(endpoint, handle, params, entry.version) if entry.version else None
+        body = response_cache.get(key) if key is not None else None
+        max_age = self._max_response_age(start_date)
+        if body is None and key is not None and settings.worker_precompute_metrics:
+            precomputed = await load_precomputed_response(
+                redis, handle, endpoint, params, entry.version, max_age=max_age
+            )
+            if precomputed is not None:
+                body, age = precomputed
+                # Served locally only for what is left of its drift bound
+                response_cache.put(key, body, ttl=max_age - age if max_age is not None else None)
+        if body is None:
+            submissions = await load_cached_submissions(redis, handle, entry)
+            if submissions is None:  # Expired since the metadata was read
+                return None, False
+            if not submissions:
+                return None, True
+            response = build(self._filter_by_date_range(submissions, start_date=start_date))
+            body = response.model_dump_json().encode()
+            if key is not None:
+                response_cache.put(key, body, ttl=max_age)
+
+        if not cache_age.is_stale:
+            headers = self._cache_headers(cache_age.fresh_for, cache_age.partial)
+        else:
+            # Enqueue background refresh (non-blocking)
+            asyncio.create_task(task_queue.enqueue(handle, priority=TaskPriority.BACKGROUND))
+            headers = {
+                **self._cache_headers(0, cache_age.partial),
+                "X-Data-Stale": "true",
+                "X-Data-Age": str(cache_age.age),
+            }
+        return Response(content=body, media_type=MediaType.JSON, headers=headers), True
 
-        age = 86400 - ttl  # 24h - remaining TTL = age
-        is_stale = age > 14400  # 4 hours
+    @staticmethod
+    def _max_response_age(start_date: datetime | None) -> float | None:
+        """
+        Maximum age of a cached or precomputed response for a period.
 
-        # Deserialize submissions
-        submissions_data = json.loads(cached)
-        submissions = []
-        for s in submissions_data:
-            # Convert nested problem dict to Problem object
-            problem_data = s.pop("problem")
-            problem = Problem(**problem_data)
-            submission = Submission(problem=problem, **s)
-            submissions.append(submission)
+        Args:
+            start_date: Start of the requested period (None for all time)
 
-        return submissions, age, is_stale
+        Returns:
+            ``settings.precomputed_metrics_drift`` of the period's length, or
+            None for all time (which does not move with the clock)
+        """
+        if start_date is None:
+            return None
+        period = (datetime.now(timezone.utc) - start_date).total_seconds()
+        return period * settings.precomputed_metrics_drift
 
     @staticmethod
-    def _cache_headers(max_age: int = 14400) -> dict:
+    def _cache_headers(max_age: int | None = None, partial: bool = False) -> dict:
         """
         Generate cache headers.
 
         Args:
-            max_age: Cache max age in seconds
+            max_age: Cache max age in seconds (defaults to ``settings.cache_fresh_ttl``)
+            partial: Whether the response was computed while older history is
+                still being fetched
 
         Returns:
-            Dictionary with Cache-Control header
+            Dictionary with Cache-Control header (and X-Data-Partial if partial)
         """
-        return {"Cache-Control": f"public, max-age={max_age}"}
+        if max_age is None:
+            max_age = settings.cache_fresh_ttl
+        headers = {"Cache-Control": f"public, max-age={max_age}"}
+        if partial:
+            headers["X-Data-Partial"] = "true"
+        return headers
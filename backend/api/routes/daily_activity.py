@@ -1,7 +1,7 @@
 """Daily activity API routes."""
 
-import asyncio
 from datetime import datetime, timezone
+from functools import partial
 from typing import Union
 
 from litestar import get
@@ -18,15 +18,13 @@ from backend.api.deps import (
 )
 from backend.api.routes.base import BaseMetricController
 from backend.domain.models.time_period import TimePeriod
-from backend.api.schemas.daily_activity import (
-    DailyActivityItemSchema,
-    DailyActivityResponse,
-)
+from backend.api.schemas.daily_activity import DailyActivityResponse
 from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.services.daily_activity_service import DailyActivityService
 from backend.services.codeforces_data_service import CodeforcesDataService
 from backend.infrastructure.codeforces_client import UserNotFoundError
 from backend.infrastructure.task_queue import TaskQueue
+from backend.services.metric_responses import daily_activity_response
 
 
 class DailyActivityController(BaseMetricController):
@@ -73,29 +71,25 @@ class DailyActivityController(BaseMetricController):
         now = datetime.now(timezone.utc)
         start_date = period.to_start_date(now=now)
 
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(submissions, start_date=start_date)
-            analysis = daily_activity_service.analyze(handle, submissions, period=period, now=now)
-            response = self._build_response(analysis)
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        if submissions and is_stale and not prefer_fresh:
-            submissions = self._filter_by_date_range(submissions, start_date=start_date)
-            analysis = daily_activity_service.analyze(handle, submissions, period=period, now=now)
-            response = self._build_response(analysis)
+        build = partial(
+            daily_activity_response, daily_activity_service, handle, period=period, now=now
+        )
 
-            asyncio.create_task(task_queue.enqueue(handle))
+        response, cached = await self.respond_from_cache(
+            redis,
+            task_queue,
+            handle,
+            start_date,
+            prefer_fresh,
+            endpoint="daily-activity",
+            params={"period": period},
+            build=build,
+        )
+        if response is not None:
+            return response
 
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
+        if not cached:
+            await self._ensure_handle_exists(data_service, handle)
 
         try:
             task_id = await task_queue.enqueue(handle)
@@ -116,24 +110,4 @@ class DailyActivityController(BaseMetricController):
             submissions = self._filter_by_date_range(submissions, start_date=start_date)
             self._validate_submissions_exist(submissions, handle)
 
-            analysis = daily_activity_service.analyze(handle, submissions, period=period, now=now)
-            response = self._build_response(analysis)
-            return Response(response, headers=self._cache_headers(14400))
-
-    def _build_response(self, analysis) -> DailyActivityResponse:
-        """Build response schema from analysis result."""
-        days = [
-            DailyActivityItemSchema(
-                date=day.date,
-                solved_count=day.solved_count,
-                attempt_count=day.attempt_count,
-            )
-            for day in analysis.days
-        ]
-        return DailyActivityResponse(
-            days=days,
-            total_solved=analysis.total_solved,
-            total_attempts=analysis.total_attempts,
-            active_days=analysis.active_days,
-            last_updated=self.get_current_timestamp(),
-        )
+            return Response(build(submissions), headers=self._cache_headers())
@@ -1,7 +1,7 @@
 """Difficulty distribution API routes."""
 
-import asyncio
 from datetime import datetime, timezone
+from functools import partial
 from typing import Union
 
 from litestar import get
@@ -20,13 +20,13 @@ from backend.api.routes.base import BaseMetricController
 from backend.domain.models.time_period import TimePeriod
 from backend.api.schemas.difficulty_distribution import (
     DifficultyDistributionResponse,
-    RatingRangeSchema,
 )
 from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.services.difficulty_distribution_service import DifficultyDistributionService
 from backend.services.codeforces_data_service import CodeforcesDataService
 from backend.infrastructure.codeforces_client import UserNotFoundError
 from backend.infrastructure.task_queue import TaskQueue
+from backend.services.metric_responses import difficulty_distribution_response
 
 
 class DifficultyDistributionController(BaseMetricController):
@@ -76,67 +76,28 @@ class DifficultyDistributionController(BaseMetricController):
             Difficulty distribution analysis with rating bins and percentages
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            distribution = difficulty_service.analyze_difficulty_distribution(handle, submissions)
-
-            ranges = [
-                RatingRangeSchema(
-                    rating=range_data.rating,
-                    problem_count=range_data.problem_count,
-                )
-                for range_data in distribution.ranges
-            ]
-
-            response = DifficultyDistributionResponse(
-                ranges=ranges,
-                total_solved=distribution.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            distribution = difficulty_service.analyze_difficulty_distribution(handle, submissions)
-
-            ranges = [
-                RatingRangeSchema(
-                    rating=range_data.rating,
-                    problem_count=range_data.problem_count,
-                )
-                for range_data in distribution.ranges
-            ]
-
-            response = DifficultyDistributionResponse(
-                ranges=ranges,
-                total_solved=distribution.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
+        start_date = period.to_start_date(now=datetime.now(timezone.utc))
+
+        build = partial(difficulty_distribution_response, difficulty_service, handle)
+
+        # Case 1: Fresh data; Case 2: Stale data and !prefer_fresh (refreshed in the background)
+        response, cached = await self.respond_from_cache(
+            redis,
+            task_queue,
+            handle,
+            start_date,
+            prefer_fresh,
+            endpoint="difficulty-distribution",
+            params={"period": period},
+            build=build,
+        )
+        if response is not None:
+            return response
 
         # Case 3: No data or prefer_fresh
+        if not cached:
+            await self._ensure_handle_exists(data_service, handle)
+
         try:
             task_id = await task_queue.enqueue(handle)
             return Response(
@@ -154,25 +115,7 @@ class DifficultyDistributionController(BaseMetricController):
                     status_code=404, detail=f"User '{handle}' not found on Codeforces"
                 )
 
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
+            submissions = self._filter_by_date_range(submissions, start_date=start_date)
             self._validate_submissions_exist(submissions, handle)
 
-            distribution = difficulty_service.analyze_difficulty_distribution(handle, submissions)
-
-            ranges = [
-                RatingRangeSchema(
-                    rating=range_data.rating,
-                    problem_count=range_data.problem_count,
-                )
-                for range_data in distribution.ranges
-            ]
-
-            response = DifficultyDistributionResponse(
-                ranges=ranges,
-                total_solved=distribution.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
+            return Response(build(submissions), headers=self._cache_headers())
@@ -1,7 +1,7 @@
 """Division problems API routes."""
 
-import asyncio
 from datetime import datetime, timezone
+from functools import partial
 from typing import Union
 
 from litestar import get
@@ -20,13 +20,16 @@ from backend.api.routes.base import BaseMetricController
 from backend.domain.models.time_period import TimePeriod
 from backend.api.schemas.division_problems import (
     DivisionProblemsResponse,
-    DivisionStatsSchema,
 )
 from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.services.division_problems_service import DivisionProblemsService
 from backend.services.codeforces_data_service import CodeforcesDataService
 from backend.infrastructure.codeforces_client import UserNotFoundError
 from backend.infrastructure.task_queue import TaskQueue
+from backend.services.metric_responses import (
+    division_problems_params,
+    division_problems_response,
+)
 
 
 class DivisionProblemsController(BaseMetricController):
@@ -79,65 +82,33 @@ class DivisionProblemsController(BaseMetricController):
         # Get contest divisions mapping
         contest_divisions = await data_service.get_contest_divisions()
 
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = division_service.analyze_division_problems(
-                handle, submissions, contest_divisions
-            )
-
-            divisions = [
-                DivisionStatsSchema.model_validate(div) for div in analysis.divisions
-            ]
-
-            response = DivisionProblemsResponse(
-                divisions=divisions,
-                total_contests=analysis.total_contests,
-                total_problems_solved=analysis.total_problems_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = division_service.analyze_division_problems(
-                handle, submissions, contest_divisions
-            )
-
-            divisions = [
-                DivisionStatsSchema.model_validate(div) for div in analysis.divisions
-            ]
-
-            response = DivisionProblemsResponse(
-                divisions=divisions,
-                total_contests=analysis.total_contests,
-                total_problems_solved=analysis.total_problems_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
+        start_date = period.to_start_date(now=datetime.now(timezone.utc))
+
+        build = partial(
+            division_problems_response,
+            division_service,
+            handle,
+            contest_divisions=contest_divisions,
+        )
+
+        # Case 1: Fresh data; Case 2: Stale data and !prefer_fresh (refreshed in the background)
+        response, cached = await self.respond_from_cache(
+            redis,
+            task_queue,
+            handle,
+            start_date,
+            prefer_fresh,
+            endpoint="division-problems",
+            params=division_problems_params(period, data_service.contest_divisions_version),
+            build=build,
+        )
+        if response is not None:
+            return response
 
         # Case 3: No data or prefer_fresh
+        if not cached:
+            await self._ensure_handle_exists(data_service, handle)
+
         try:
             task_id = await task_queue.enqueue(handle)
             return Response(
@@ -155,24 +126,7 @@ class DivisionProblemsController(BaseMetricController):
                     status_code=404, detail=f"User '{handle}' not found on Codeforces"
                 )
 
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
+            submissions = self._filter_by_date_range(submissions, start_date=start_date)
             self._validate_submissions_exist(submissions, handle)
 
-            analysis = division_service.analyze_division_problems(
-                handle, submissions, contest_divisions
-            )
-
-            divisions = [
-                DivisionStatsSchema.model_validate(div) for div in analysis.divisions
-            ]
-
-            response = DivisionProblemsResponse(
-                divisions=divisions,
-                total_contests=analysis.total_contests,
-                total_problems_solved=analysis.total_problems_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
+            return Response(build(submissions), headers=self._cache_headers())
@@ -1,7 +1,7 @@
 """Tags API routes."""
 
-import asyncio
 from datetime import datetime, timezone
+from functools import partial
 from typing import Union
 
 from litestar import get
@@ -18,12 +18,17 @@ from backend.api.deps import (
 )
 from backend.api.routes.base import BaseMetricController
 from backend.domain.models.time_period import TimePeriod
-from backend.api.schemas.tags import SimpleTagInfoSchema, TagsResponse, WeakTagsResponse
+from backend.api.schemas.tags import TagsResponse, WeakTagsResponse
 from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.services.tags_service import TagsService
 from backend.services.codeforces_data_service import CodeforcesDataService
 from backend.infrastructure.codeforces_client import UserNotFoundError
 from backend.infrastructure.task_queue import TaskQueue
+from backend.services.metric_responses import (
+    DEFAULT_WEAK_TAG_THRESHOLD,
+    tag_ratings_response,
+    weak_tags_response,
+)
 
 
 class TagsController(BaseMetricController):
@@ -72,59 +77,28 @@ class TagsController(BaseMetricController):
             Tag ratings with median and average ratings by tag
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in tags_analysis.tags]
-
-            response = TagsResponse(
-                tags=tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in tags_analysis.tags]
-
-            response = TagsResponse(
-                tags=tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
+        start_date = period.to_start_date(now=datetime.now(timezone.utc))
+
+        build = partial(tag_ratings_response, tags_service, handle)
+
+        # Case 1: Fresh data; Case 2: Stale data and !prefer_fresh (refreshed in the background)
+        response, cached = await self.respond_from_cache(
+            redis,
+            task_queue,
+            handle,
+            start_date,
+            prefer_fresh,
+            endpoint="tag-ratings",
+            params={"period": period},
+            build=build,
+        )
+        if response is not None:
+            return response
 
         # Case 3: No data or prefer_fresh
+        if not cached:
+            await self._ensure_handle_exists(data_service, handle)
+
         try:
             task_id = await task_queue.enqueue(handle)
             return Response(
@@ -142,24 +116,10 @@ class TagsController(BaseMetricController):
                     status_code=404, detail=f"User '{handle}' not found on Codeforces"
                 )
 
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
+            submissions = self._filter_by_date_range(submissions, start_date=start_date)
             self._validate_submissions_exist(submissions, handle)
 
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in tags_analysis.tags]
-
-            response = TagsResponse(
-                tags=tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
+            return Response(build(submissions), headers=self._cache_headers())
 
     @get(
         path="/{handle:str}/weak",
@@ -178,7 +138,7 @@ class TagsController(BaseMetricController):
         redis: Redis,
         task_queue: TaskQueue,
         threshold: int = Parameter(
-            default=200,
+            default=DEFAULT_WEAK_TAG_THRESHOLD,
             ge=0,
             le=1000,
             description="Minimum rating difference to consider a tag rating 'weak'",
@@ -207,65 +167,28 @@ class TagsController(BaseMetricController):
             Weak tag ratings analysis
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            weak_tags = tags_analysis.get_weak_tags(threshold)
-
-            weak_tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in weak_tags]
-
-            response = WeakTagsResponse(
-                weak_tags=weak_tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                threshold_used=threshold,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            weak_tags = tags_analysis.get_weak_tags(threshold)
-
-            weak_tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in weak_tags]
-
-            response = WeakTagsResponse(
-                weak_tags=weak_tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                threshold_used=threshold,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
+        start_date = period.to_start_date(now=datetime.now(timezone.utc))
+
+        build = partial(weak_tags_response, tags_service, handle, threshold=threshold)
+
+        # Case 1: Fresh data; Case 2: Stale data and !prefer_fresh (refreshed in the background)
+        response, cached = await self.respond_from_cache(
+            redis,
+            task_queue,
+            handle,
+            start_date,
+            prefer_fresh,
+            endpoint="tag-ratings/weak",
+            params={"period": period, "threshold": threshold},
+            build=build,
+        )
+        if response is not None:
+            return response
 
         # Case 3: No data or prefer_fresh
+        if not cached:
+            await self._ensure_handle_exists(data_service, handle)
+
         try:
             task_id = await task_queue.enqueue(handle)
             return Response(
@@ -283,24 +206,7 @@ class TagsController(BaseMetricController):
                     status_code=404, detail=f"User '{handle}' not found on Codeforces"
                 )
 
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
+            submissions = self._filter_by_date_range(submissions, start_date=start_date)
             self._validate_submissions_exist(submissions, handle)
 
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            weak_tags = tags_analysis.get_weak_tags(threshold)
-
-            weak_tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in weak_tags]
-
-            response = WeakTagsResponse(
-                weak_tags=weak_tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                threshold_used=threshold,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
+            return Response(build(submissions), headers=self._cache_headers())
@@ -7,6 +7,7 @@ from litestar.response import Response
 from redis.asyncio import Redis
 
 from backend.api.deps import redis_dependency, task_queue_dependency
+from backend.infrastructure.submission_cache import read_cache_entry
 from backend.infrastructure.task_queue import TaskQueue
 
 
@@ -73,37 +74,40 @@ class TaskController(Controller):
             )
 
         # Still processing - check if cache was updated by another task
+        partial = False
         if handle:
-            cached = await redis.get(f"submissions:{handle}")
-            if cached:
-                ttl = await redis.ttl(f"submissions:{handle}")
-                if ttl > 0:
-                    age = 86400 - ttl
-
-                    if age < 14400:  # Fresh data available!
-                        # Mark task as completed
-                        await redis.setex(f"task:{task_id}:status", 300, "completed")
-                        await redis.setex(
-                            f"task:{task_id}:result",
-                            300,
-                            json.dumps(
-                                {
-                                    "handle": handle,
-                                    "status": "completed_by_another_task",
-                                }
-                            ),
-                        )
-                        return Response(
-                            content={
-                                "status": "completed",
-                                "message": "Data updated by concurrent request",
-                            },
-                            status_code=200,
-                        )
-
-        # Still processing
+            entry = await read_cache_entry(redis, handle, with_payload=False)
+            cache_age = entry.cache_age if entry is not None else None
+            # Recent submissions of a first load are cached while older ones are backfilled
+            partial = cache_age is not None and cache_age.partial
+            if cache_age is not None and not cache_age.is_stale and not partial:
+                # Fresh data available!
+                # Mark task as completed
+                await redis.setex(f"task:{task_id}:status", 300, "completed")
+                await redis.setex(
+                    f"task:{task_id}:result",
+                    300,
+                    json.dumps(
+                        {
+                            "handle": handle,
+                            "status": "completed_by_another_task",
+                        }
+                    ),
+                )
+                return Response(
+                    content={
+                        "status": "completed",
+                        "message": "Data updated by concurrent request",
+                    },
+                    status_code=200,
+                )
+
+        # Still processing (with partial data, requests for recent periods can be served)
+        content = {"status": "processing"}
+        if partial:
+            content["partial"] = True
         return Response(
-            content={"status": "processing"},
+            content=content,
             status_code=202,
             headers={"Retry-After": "2"},
         )
@@ -11,6 +11,34 @@ class Settings(BaseSettings):
 
     # Redis settings
     redis_url: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
+    redis_max_connections: int = Field(
+        default=50, description="Maximum open Redis connections per process (shared pool)"
+    )
+    redis_pool_timeout: float = Field(
+        default=5.0, description="Seconds a command waits for a free pooled Redis connection"
+    )
+    redis_health_check_interval: int = Field(
+        default=30, description="Seconds a pooled Redis connection may idle before it is pinged"
+    )
+    submissions_local_cache_size: int = Field(
+        default=200_000,
+        description="Submissions kept decoded in memory per API process (LRU over handles)",
+    )
+    response_cache_size: int = Field(
+        default=64 * 1024 * 1024,
+        description="Bytes of serialized metric responses kept per API process",
+    )
+    response_cache_ttl: int = Field(
+        default=300,
+        description="Seconds a cached response is served (periods are relative to now)",
+    )
+    redis_compression: Literal["auto", "zstd", "zlib", "none"] = Field(
+        default="auto",
+        description="Compression of large cached values (auto: zstd if installed, else zlib)",
+    )
+    redis_compression_threshold: int = Field(
+        default=4096, description="Values smaller than this many bytes are stored uncompressed"
+    )
 
     # Development settings
     dev_mode: bool = Field(default=False, description="Enable development mode with hot reload")
@@ -19,23 +47,203 @@ class Settings(BaseSettings):
     codeforces_api_base: str = Field(
         default="https://codeforces.com/api", description="Base URL for Codeforces API"
     )
+    codeforces_timeout: float = Field(
+        default=30.0, description="Default Codeforces API request timeout in seconds"
+    )
+    codeforces_connect_timeout: float = Field(
+        default=5.0, description="Codeforces API connect timeout in seconds"
+    )
+    codeforces_user_status_timeout: float = Field(
+        default=120.0, description="Read timeout for user.status (full histories are large)"
+    )
+    codeforces_contest_list_timeout: float = Field(
+        default=60.0, description="Read timeout for contest.list and problemset.problems"
+    )
+    codeforces_max_connections: int = Field(
+        default=20, description="Maximum open connections to the Codeforces API per process"
+    )
+    codeforces_max_keepalive_connections: int = Field(
+        default=10, description="Maximum idle keep-alive connections kept in the pool"
+    )
+    codeforces_keepalive_expiry: float = Field(
+        default=60.0, description="Seconds an idle keep-alive connection is kept open"
+    )
+    codeforces_http2: bool = Field(
+        default=False, description="Use HTTP/2 for the Codeforces API (requires 'h2')"
+    )
 
     # Cache settings
     cache_ttl: int = Field(
         default=4 * 60 * 60, description="Cache TTL in seconds (4 hours default)"
     )
     cache_fresh_ttl: int = Field(
-        default=4 * 60 * 60, description="Fresh cache TTL in seconds (4 hours)"
+        default=4 * 60 * 60,
+        description="Fresh cache TTL in seconds for entries without cadence metadata (4 hours)",
     )
     cache_stale_ttl: int = Field(
-        default=24 * 60 * 60, description="Stale cache TTL in seconds (24 hours)"
+        default=24 * 60 * 60,
+        description="Minimum lifetime of cached submissions in seconds (24 hours)",
+    )
+    cache_fresh_ttl_min: int = Field(
+        default=60 * 60, description="Lower bound of the adaptive fresh TTL in seconds (1 hour)"
+    )
+    cache_fresh_ttl_max: int = Field(
+        default=7 * 24 * 60 * 60,
+        description="Upper bound of the adaptive fresh TTL in seconds (7 days)",
+    )
+    cache_idle_factor: float = Field(
+        default=0.1,
+        description="Fresh TTL as a fraction of the time since the handle's last submission",
+    )
+    cache_expire_factor: float = Field(
+        default=6.0, description="Lifetime of cached submissions as a multiple of the fresh TTL"
+    )
+    cache_expire_max: int = Field(
+        default=14 * 24 * 60 * 60,
+        description="Upper bound of the lifetime of cached submissions in seconds (14 days)",
+    )
+    popularity_key: str = Field(
+        default="handle_popularity", description="Sorted set of decayed per-handle request counts"
+    )
+    popularity_half_life: int = Field(
+        default=24 * 60 * 60, description="Half-life of a request in the popularity score (1 day)"
+    )
+    popularity_min_score: float = Field(
+        default=3.0, description="Popularity score from which a handle is refreshed proactively"
+    )
+    popularity_view_window: float = Field(
+        default=60.0,
+        description="Seconds during which further requests for a handle belong to the same page "
+        "view (a page loads every metric) and are not counted again",
+    )
+    popularity_top_handles: int = Field(
+        default=200, description="Most popular handles considered for proactive refresh"
+    )
+    problem_catalog_local_ttl: float = Field(
+        default=60 * 60, description="Seconds API processes keep catalog problems in memory"
+    )
+    contest_divisions_local_ttl: float = Field(
+        default=60.0, description="Seconds API processes reuse contest divisions without Redis"
     )
 
     # Worker settings
     worker_rate_limit: int = Field(
-        default=5, description="Worker rate limit (requests per second to Codeforces API)"
+        default=5,
+        description="Cluster-wide rate limit (requests per second to Codeforces API)",
+    )
+    worker_rate_limit_burst: int = Field(
+        default=5, description="Requests allowed back-to-back before the rate limit applies"
+    )
+    worker_rate_limit_key: str = Field(
+        default="rate_limit:codeforces", description="Redis key of the shared rate limiter"
+    )
+    worker_rate_limit_min: float = Field(
+        default=0.5, description="Lowest rate (req/s) the adaptive rate limiter backs off to"
+    )
+    worker_rate_limit_increase: float = Field(
+        default=0.05, description="Rate (req/s) regained after each successful request"
+    )
+    worker_rate_limit_decrease: float = Field(
+        default=0.5, description="Rate multiplier applied on 'Call limit exceeded'"
+    )
+    codeforces_breaker_failure_threshold: int = Field(
+        default=5, description="Consecutive Codeforces failures that open the circuit breaker"
+    )
+    codeforces_breaker_recovery_timeout: float = Field(
+        default=30.0, description="Seconds the circuit breaker stays open before probing"
     )
     worker_queue_key: str = Field(default="fetch_queue", description="Worker queue key")
+    task_queue_backend: Literal["list", "stream"] = Field(
+        default="list",
+        description="Task queue implementation: Redis list (BLPOP) or Redis Streams consumer group",
+    )
+    worker_stream_key: str = Field(
+        default="fetch_stream", description="Stream key used by the 'stream' queue backend"
+    )
+    worker_stream_group: str = Field(
+        default="workers", description="Consumer group shared by all workers"
+    )
+    worker_consumer_name: str = Field(
+        default="", description="Consumer name in the group (defaults to hostname-pid)"
+    )
+    worker_stream_claim_idle: int = Field(
+        default=120,
+        description="Seconds an unacknowledged stream entry may idle before another worker "
+        "claims it",
+    )
+    worker_background_share: float = Field(
+        default=0.25,
+        description="Share of queue reads that prefer background refreshes over interactive tasks",
+    )
+    worker_concurrency: int = Field(
+        default=4, description="Maximum number of tasks a worker processes concurrently"
+    )
+    worker_shutdown_timeout: float = Field(
+        default=20.0,
+        description="Seconds to wait for in-flight tasks on shutdown before requeueing them; "
+        "keep it plus worker_fetch_timeout well below the container's stop grace period (30s)",
+    )
+    worker_fetch_timeout: int = Field(
+        default=5, description="Seconds a queue read blocks while the queue is empty"
+    )
+    worker_page_size: int = Field(
+        default=1000, description="Submissions per user.status page in incremental fetches"
+    )
+    worker_encode_chunk_size: int = Field(
+        default=1000, description="Submissions encoded per Redis write when streaming a history"
+    )
+    worker_stream_write_ttl: int = Field(
+        default=120,
+        description=(
+            "Seconds a partially written submission history survives without a new chunk "
+            "(cleans up after killed workers)"
+        ),
+    )
+    worker_full_refresh_interval: int = Field(
+        default=7 * 24 * 60 * 60,
+        description="Interval in seconds between full user.status refetches (7 days)",
+    )
+    worker_prefetch_interval: int = Field(
+        default=60, description="Seconds between scans for popular handles about to go stale"
+    )
+    worker_prefetch_lead: int = Field(
+        default=15 * 60,
+        description="Refresh popular handles this many seconds before their data turns stale",
+    )
+    worker_precompute_metrics: bool = Field(
+        default=False,
+        description="Precompute every metric response for every period after each fetch",
+    )
+    precomputed_metrics_drift: float = Field(
+        default=0.01,
+        description=(
+            "Share of a period's length a cached or precomputed response may lag behind "
+            "the clock before it is recomputed"
+        ),
+    )
+    contest_refresh_interval: int = Field(
+        default=60 * 60, description="Seconds between contest.list checks for new contests"
+    )
+    contest_full_refresh_interval: int = Field(
+        default=24 * 60 * 60,
+        description="Seconds between rewrites of all contest divisions (renamed rounds)",
+    )
+    problem_catalog_refresh_interval: int = Field(
+        default=24 * 60 * 60,
+        description="Seconds between problemset.problems downloads into the problem catalog",
+    )
+    worker_retry_key: str = Field(
+        default="fetch_retry", description="Sorted set of tasks waiting for a delayed retry"
+    )
+    worker_retry_max_attempts: int = Field(
+        default=5, description="Fetch attempts per task before it is marked as failed"
+    )
+    worker_retry_base_delay: float = Field(
+        default=2.0, description="Backoff before the first retry in seconds (doubles per attempt)"
+    )
+    worker_retry_max_delay: float = Field(
+        default=300.0, description="Upper bound of the retry backoff in seconds"
+    )
 
     # Task settings
     task_status_ttl: int = Field(default=300, description="Task status TTL in seconds (5 minutes)")
@@ -43,6 +251,31 @@ class Settings(BaseSettings):
         default=60, description="Pending task lock TTL in seconds (60 seconds)"
     )
 
+    # Handle validation settings
+    handle_validation_window: float = Field(
+        default=0.2, description="Seconds unknown handles are collected into one user.info call"
+    )
+    handle_validation_batch_size: int = Field(
+        default=100, description="Maximum handles validated per user.info call"
+    )
+    handle_alias_ttl: int = Field(
+        default=7 * 24 * 60 * 60,
+        description="TTL in seconds of validated handles and their canonical spelling (7 days)",
+    )
+    unknown_handle_ttl: int = Field(
+        default=24 * 60 * 60,
+        description="TTL in seconds of the negative cache for handles not found (24 hours)",
+    )
+    unknown_handle_bloom_bits: int = Field(
+        default=1 << 20, description="Size in bits of the Bloom filter over unknown handles"
+    )
+    unknown_handle_bloom_hashes: int = Field(
+        default=7, description="Bit positions per handle in the unknown-handle Bloom filter"
+    )
+    unknown_handle_sync_interval: float = Field(
+        default=30.0, description="Seconds between Bloom filter syncs from Redis per API process"
+    )
+
     # Rate limiting settings
     rate_limit_requests: int = Field(
         default=100, description="Number of requests allowed per period"
@@ -0,0 +1,120 @@
+"""Per-handle cache lifetimes derived from a handle's submission cadence."""
+
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional
+
+from backend.config import settings
+from backend.domain.models.codeforces import Submission
+
+# Window used to measure how often a handle submits
+_RECENT_WINDOW = 28 * 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class CacheTtl:
+    """How long cached submissions of a handle stay fresh and how long they are kept."""
+
+    fresh: int  # Seconds the data is served without triggering a refresh
+    expire: int  # Seconds until the cached data is dropped
+
+
+class SubmissionCadence:
+    """
+    Running summary of a handle's submission times.
+
+    The fresh TTL follows how often the data is expected to change: it is a
+    fraction (``settings.cache_idle_factor``) of the time since the last
+    submission, and at most the average gap between submissions over the last
+    four weeks. Handles that have been idle for months stay fresh for days,
+    daily grinders are refreshed every hour or so. The result is clamped to
+    ``settings.cache_fresh_ttl_min`` / ``settings.cache_fresh_ttl_max``.
+    """
+
+    def __init__(self, now: Optional[int] = None):
+        """
+        Initialize cadence summary.
+
+        Args:
+            now: Reference Unix time (defaults to the current time)
+        """
+        self.now = int(time.time()) if now is None else now
+        self.last_submission: Optional[int] = None
+        self.recent_submissions = 0
+
+    def add(self, submission: Submission) -> None:
+        """Account for one submission."""
+        self.add_time(submission.creation_time_seconds)
+
+    def add_time(self, created: int) -> None:
+        """Account for one submission by its creation time."""
+        if self.last_submission is None or created > self.last_submission:
+            self.last_submission = created
+        if self.now - created <= _RECENT_WINDOW:
+            self.recent_submissions += 1
+
+    async def observe(self, submissions: AsyncIterator[Submission]) -> AsyncIterator[Submission]:
+        """
+        Pass submissions through while accounting for them.
+
+        Args:
+            submissions: Async iterator of submissions
+
+        Yields:
+            The same submissions
+        """
+        async for submission in submissions:
+            self.add(submission)
+            yield submission
+
+    def cache_ttl(self) -> CacheTtl:
+        """
+        Cache lifetimes for the submissions seen so far.
+
+        Returns:
+            Fresh TTL and expiry in seconds
+        """
+        if self.last_submission is None:
+            fresh = float(settings.cache_fresh_ttl_max)
+        else:
+            fresh = max(self.now - self.last_submission, 0) * settings.cache_idle_factor
+            if self.recent_submissions:
+                fresh = min(fresh, _RECENT_WINDOW / self.recent_submissions)
+
+        fresh = min(max(fresh, settings.cache_fresh_ttl_min), settings.cache_fresh_ttl_max)
+        expire = min(
+            max(fresh * settings.cache_expire_factor, settings.cache_stale_ttl),
+            settings.cache_expire_max,
+        )
+        return CacheTtl(fresh=int(fresh), expire=int(expire))
+
+
+def cache_ttl_for(submissions: Iterable[Submission], now: Optional[int] = None) -> CacheTtl:
+    """
+    Cache lifetimes for a handle's submission history.
+
+    Args:
+        submissions: Submissions of the handle
+        now: Reference Unix time (defaults to the current time)
+
+    Returns:
+        Fresh TTL and expiry in seconds
+    """
+    return cache_ttl_for_times((s.creation_time_seconds for s in submissions), now)
+
+
+def cache_ttl_for_times(creation_times: Iterable[int], now: Optional[int] = None) -> CacheTtl:
+    """
+    Cache lifetimes for a handle's submission history, given only its creation times.
+
+    Args:
+        creation_times: Creation times of the handle's submissions
+        now: Reference Unix time (defaults to the current time)
+
+    Returns:
+        Fresh TTL and expiry in seconds
+    """
+    cadence = SubmissionCadence(now)
+    for created in creation_times:
+        cadence.add_time(created)
+    return cadence.cache_ttl()
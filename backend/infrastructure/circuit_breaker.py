@@ -0,0 +1,126 @@
+"""Circuit breaker for calls to an unreliable upstream service."""
+
+import logging
+import time
+from enum import Enum
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Exception raised when a call is rejected because the circuit is open."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state enumeration."""
+
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls are rejected until the recovery timeout passes
+    HALF_OPEN = "half_open"  # A single probe call decides whether to close again
+
+
+class CircuitBreaker:
+    """
+    Classic three-state circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected immediately for ``recovery_timeout`` seconds. Then one
+    probe call is let through: success closes the circuit, failure opens it
+    again for another timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Name used in log messages and errors
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before probing again
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a probe call through (0 if it would now)."""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(self.opened_at + self.recovery_timeout - self.clock(), 0.0)
+
+    @property
+    def is_open(self) -> bool:
+        """Check whether calls are currently being rejected."""
+        if self.state is CircuitState.HALF_OPEN:
+            return self._probe_in_flight
+        return self.state is CircuitState.OPEN and self.retry_after > 0
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is already in flight
+        """
+        if self.state is CircuitState.OPEN:
+            if self.retry_after > 0:
+                raise CircuitOpenError(
+                    f"{self.name} circuit is open, retry in {self.retry_after:.1f}s",
+                    self.retry_after,
+                )
+            self.state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+            logger.info(f"{self.name} circuit half-open, probing")
+
+        if self.state is CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                raise CircuitOpenError(f"{self.name} circuit is probing", self.recovery_timeout)
+            self._probe_in_flight = True
+
+    def release_probe(self) -> None:
+        """
+        End a call that got no verdict (cancelled or abandoned by its consumer).
+
+        In the half-open state the next call becomes the probe, so an
+        unfinished probe can never keep the circuit open.
+        """
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.state is not CircuitState.CLOSED:
+            logger.info(f"{self.name} circuit closed")
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the threshold is reached."""
+        self.failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state is not CircuitState.OPEN:
+                logger.warning(
+                    f"{self.name} circuit opened after {self.failures} failure(s), "
+                    f"rejecting calls for {self.recovery_timeout:.0f}s"
+                )
+            self.state = CircuitState.OPEN
+            self.opened_at = self.clock()
+            self._probe_in_flight = False
@@ -2,10 +2,15 @@
 
 import httpx
 import re
-from typing import List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Any, Protocol
 import json
 from backend.config import settings
 from backend.domain.models.codeforces import Submission, Problem, SubmissionStatus
+from backend.infrastructure.circuit_breaker import CircuitBreaker
+from backend.infrastructure.handles import is_valid_handle
+from backend.infrastructure.http_client import create_http_client, endpoint_timeout
+from backend.infrastructure.json_stream import ResultArrayParser
 
 
 class CodeforcesAPIError(Exception):
@@ -16,22 +21,78 @@ class CodeforcesAPIError(Exception):
         self.status_code = status_code
 
 
+class CodeforcesRateLimitError(CodeforcesAPIError):
+    """Exception raised when Codeforces rejects a call with "Call limit exceeded"."""
+
+    pass
+
+
+class CodeforcesUnavailableError(CodeforcesAPIError):
+    """Exception raised when Codeforces is unreachable or answers with a server error."""
+
+    pass
+
+
 class UserNotFoundError(Exception):
     """Exception raised when user is not found on Codeforces."""
 
-    pass
+    def __init__(self, message: str, handle: str | None = None):
+        super().__init__(message)
+        self.handle = handle
 
 
-# Global cache for contest division mapping
-_contest_division_cache: Dict[int, str | None] = {}
+class RateLimiterProtocol(Protocol):
+    """Anything that can throttle outgoing Codeforces API calls."""
 
+    async def acquire(self) -> Any: ...
+
+    def on_success(self) -> None: ...
+
+    def on_throttled(self) -> None: ...
+
+
+# Matches the handle named in a user.info / user.status "not found" comment
+_USER_NOT_FOUND = re.compile(r"User with handle (\S+) not found")
 
-class CodeforcesClient:
-    """Client for interacting with Codeforces API."""
 
-    def __init__(self):
+def _is_server_error(status_code: Any) -> bool:
+    """Check whether an HTTP status code is a 5xx server error."""
+    return isinstance(status_code, int) and status_code >= 500
+
+
+def _api_error(message: str, comment: str, status_code: Any) -> CodeforcesAPIError:
+    """Build the most specific CodeforcesAPIError for a failed API call."""
+    if "Call limit exceeded" in comment or status_code == 429:
+        return CodeforcesRateLimitError(message, status_code)
+    if _is_server_error(status_code):
+        return CodeforcesUnavailableError(message, status_code)
+    return CodeforcesAPIError(message, status_code)
+
+
+class CodeforcesClient:
+    """
+    Client for interacting with Codeforces API.
+
+    Pass a shared ``http_client`` (see ``backend.infrastructure.http_client``)
+    to reuse pooled keep-alive connections; such a client is owned by the
+    caller and is not closed by this class.
+
+    Every API call is guarded: an optional ``circuit_breaker`` rejects calls
+    while Codeforces is down, and the ``rate_limiter`` is told about throttled
+    and successful calls so it can adapt its rate.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiterProtocol | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ):
         self.base_url = settings.codeforces_api_base.rstrip("/")
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client if http_client is not None else create_http_client()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -39,18 +100,82 @@ class CodeforcesClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.http_client.aclose()
+        await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Close the HTTP client if this instance created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
 
-    async def get_user_submissions(self, handle: str) -> List[Submission]:
+    @asynccontextmanager
+    async def _guarded_call(self) -> AsyncIterator[None]:
         """
-        Fetch all submissions for a user.
+        Wrap a single API call with the circuit breaker and rate limiter.
+
+        Every call admitted by the circuit breaker ends in exactly one of
+        ``record_success``, ``record_failure`` or ``release_probe``, so a
+        half-open probe cannot leak when the call is cancelled, the rate
+        limiter fails or a streaming consumer stops early.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the call
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_call()
+
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+        except BaseException:
+            # Codeforces was not contacted, so there is no verdict
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release_probe()
+            raise
+
+        try:
+            yield
+        except CodeforcesRateLimitError:
+            # Codeforces is up but we are too fast: slow down, not an outage
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_throttled()
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+            raise
+        except CodeforcesUnavailableError:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            raise
+        except (CodeforcesAPIError, UserNotFoundError):
+            # Codeforces answered, so it is reachable
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+            raise
+        except Exception:
+            # Any other error of the call (e.g. unparsable data) counts as an outage
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled, or a streaming consumer closed the generator early
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release_probe()
+            raise
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_success()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+
+    async def get_user_submissions(
+        self, handle: str, from_index: int | None = None, count: int | None = None
+    ) -> List[Submission]:
+        """
+        Fetch submissions for a user, newest first.
 
         Args:
             handle: Codeforces handle
+            from_index: 1-based index of the first submission to return (optional)
+            count: Number of submissions to return (optional, all if omitted)
 
         Returns:
             List of user's submissions
@@ -60,78 +185,286 @@ class CodeforcesClient:
         """
         url = f"{self.base_url}/user.status"
 
-        try:
-            response = await self.http_client.get(url, params={"handle": handle})
-
-            data = response.json()
-
-            # Check API response status
-            status = data.get("status")
-            result = data.get("result", [])
-            comment = data.get("comment", "")
-
-            if status != "OK":
-                # Check for user not found cases
-                if "User with handle" in comment and (
-                    "not found" in comment
-                    or "does not exist" in comment
-                    or "does not have" in comment
-                ):
-                    raise UserNotFoundError(f"User '{handle}' not found on Codeforces")
-                raise CodeforcesAPIError(
-                    f"API returned status: {status}. Comment: {comment}", response.status_code
+        params: Dict[str, Any] = {"handle": handle}
+        if from_index is not None:
+            params["from"] = from_index
+        if count is not None:
+            params["count"] = count
+
+        async with self._guarded_call():
+            response = None
+            try:
+                response = await self.http_client.get(
+                    url, params=params, timeout=endpoint_timeout("user.status")
                 )
 
-            # Empty result means no submissions, but user exists
-            return self._parse_submissions(result)
+                data = response.json()
+                self._check_user_status_response(handle, data, response.status_code)
+
+                # Empty result means no submissions, but user exists
+                return self._parse_submissions(data.get("result", []))
+
+            except httpx.HTTPStatusError as e:
+                raise self._http_status_error(e)
+            except httpx.RequestError as e:
+                raise CodeforcesUnavailableError(f"Request error: {str(e)}")
+            except json.JSONDecodeError as e:
+                raise self._decode_error(e, response)
+
+    async def iter_user_submissions(
+        self, handle: str, from_index: int | None = None, count: int | None = None
+    ) -> AsyncIterator[Submission]:
+        """
+        Stream submissions for a user, newest first, as the response arrives.
+
+        Unlike get_user_submissions, neither the raw JSON tree nor the full list
+        of parsed submissions is ever held in memory: the ``result`` array is
+        parsed incrementally and each submission is yielded as soon as it is
+        complete. API errors are only detected once the body has been read, so
+        consumers must not commit what they received before iteration ends.
+
+        Args:
+            handle: Codeforces handle
+            from_index: 1-based index of the first submission to return (optional)
+            count: Number of submissions to return (optional, all if omitted)
+
+        Yields:
+            User's submissions
+
+        Raises:
+            CodeforcesAPIError: If API request fails
+        """
+        url = f"{self.base_url}/user.status"
+
+        params: Dict[str, Any] = {"handle": handle}
+        if from_index is not None:
+            params["from"] = from_index
+        if count is not None:
+            params["count"] = count
+
+        parser = ResultArrayParser()
+
+        async with self._guarded_call():
+            response = None
+            try:
+                async with self.http_client.stream(
+                    "GET", url, params=params, timeout=endpoint_timeout("user.status")
+                ) as response:
+                    async for chunk in response.aiter_text():
+                        for raw_submission in parser.feed(chunk):
+                            submission = self._parse_submission(raw_submission)
+                            if submission is not None:
+                                yield submission
+
+                    self._check_user_status_response(
+                        handle, parser.envelope(), response.status_code
+                    )
+
+            except httpx.HTTPStatusError as e:
+                raise self._http_status_error(e)
+            except httpx.RequestError as e:
+                raise CodeforcesUnavailableError(f"Request error: {str(e)}")
+            except json.JSONDecodeError as e:
+                raise self._decode_error(e, response)
+
+    @staticmethod
+    def _check_user_status_response(handle: str, data: Dict[str, Any], status_code: int) -> None:
+        """
+        Validate the envelope of a user.status response.
 
-        except httpx.HTTPStatusError as e:
-            raise CodeforcesAPIError(f"HTTP error {e.response.status_code}: {e.response.text}")
-        except httpx.RequestError as e:
-            raise CodeforcesAPIError(f"Request error: {str(e)}")
-        except json.JSONDecodeError as e:
-            raise CodeforcesAPIError(f"JSON decode error: {str(e)}")
+        Raises:
+            UserNotFoundError: If the handle does not exist
+            CodeforcesAPIError: If the API reported any other failure
+        """
+        status = data.get("status")
+        comment = data.get("comment", "")
+
+        if status != "OK":
+            # Check for user not found cases
+            if "User with handle" in comment and (
+                "not found" in comment
+                or "does not exist" in comment
+                or "does not have" in comment
+            ):
+                raise UserNotFoundError(f"User '{handle}' not found on Codeforces", handle)
+            raise _api_error(
+                f"API returned status: {status}. Comment: {comment}", comment, status_code
+            )
+
+    @staticmethod
+    def _http_status_error(error: httpx.HTTPStatusError) -> CodeforcesAPIError:
+        """Translate an httpx status error into a CodeforcesAPIError."""
+        status_code = error.response.status_code
+        return _api_error(
+            f"HTTP error {status_code}: {error.response.text}", error.response.text, status_code
+        )
+
+    @staticmethod
+    def _decode_error(
+        error: json.JSONDecodeError, response: httpx.Response | None
+    ) -> CodeforcesAPIError:
+        """Translate an unparseable body (e.g. an HTML error page) into a CodeforcesAPIError."""
+        status_code = response.status_code if response is not None else None
+        return _api_error(f"JSON decode error: {str(error)}", "", status_code)
+
+    async def get_latest_submission(self, handle: str) -> Submission | None:
+        """
+        Fetch only the most recent submission of a user.
+
+        A cheap probe (``count=1``) to find out whether a cached history is
+        still current.
+
+        Args:
+            handle: Codeforces handle
+
+        Returns:
+            Newest submission, or None if the user has none
+
+        Raises:
+            UserNotFoundError: If user doesn't exist
+            CodeforcesAPIError: If API request fails
+        """
+        submissions = await self.get_user_submissions(handle, from_index=1, count=1)
+        return submissions[0] if submissions else None
+
+    async def get_new_submissions(
+        self, handle: str, since_id: int, page_size: int | None = None
+    ) -> List[Submission]:
+        """
+        Fetch only submissions newer than an already known one.
+
+        Pages through user.status from newest to oldest and stops at the first
+        page that reaches ``since_id`` (or at the end of the history).
+
+        Args:
+            handle: Codeforces handle
+            since_id: Highest submission id already known to the caller
+            page_size: Submissions per request (defaults to settings.worker_page_size)
+
+        Returns:
+            Submissions with id greater than ``since_id``, newest first
+
+        Raises:
+            CodeforcesAPIError: If API request fails
+        """
+        page_size = page_size or settings.worker_page_size
+        new_submissions: List[Submission] = []
+        from_index = 1
+
+        while True:
+            page = await self.get_user_submissions(handle, from_index=from_index, count=page_size)
+            new_submissions.extend(s for s in page if s.id > since_id)
+
+            if len(page) < page_size or any(s.id <= since_id for s in page):
+                return new_submissions
+
+            from_index += page_size
 
     def _parse_submissions(self, raw_submissions: List[Dict[str, Any]]) -> List[Submission]:
         """Parse raw API response into Submission objects."""
         submissions = []
 
         for raw_submission in raw_submissions:
+            submission = self._parse_submission(raw_submission)
+            if submission is not None:
+                submissions.append(submission)
+
+        return submissions
+
+    @staticmethod
+    def _parse_submission(raw_submission: Dict[str, Any]) -> Submission | None:
+        """Parse a single raw submission, returning None if it is malformed."""
+        try:
+            # Parse problem
+            raw_problem = raw_submission.get("problem", {})
+            problem = Problem(
+                contest_id=raw_problem.get("contestId", 0),
+                index=raw_problem.get("index", ""),
+                name=raw_problem.get("name", ""),
+                rating=raw_problem.get("rating"),
+                tags=raw_problem.get("tags", []),
+            )
+
+            # Parse verdict
+            verdict_str = raw_submission.get("verdict", "")
             try:
-                # Parse problem
-                raw_problem = raw_submission.get("problem", {})
-                problem = Problem(
-                    contest_id=raw_problem.get("contestId", 0),
-                    index=raw_problem.get("index", ""),
-                    name=raw_problem.get("name", ""),
-                    rating=raw_problem.get("rating"),
-                    tags=raw_problem.get("tags", []),
-                )
+                verdict = SubmissionStatus(verdict_str)
+            except ValueError:
+                # Unknown verdict, treat as failed
+                verdict = SubmissionStatus.WRONG_ANSWER
+
+            return Submission(
+                id=raw_submission.get("id", 0),
+                contest_id=raw_submission.get("contestId", 0),
+                creation_time_seconds=raw_submission.get("creationTimeSeconds", 0),
+                problem=problem,
+                verdict=verdict,
+                programming_language=raw_submission.get("programmingLanguage", ""),
+            )
+
+        except (KeyError, TypeError, AttributeError):
+            # Skip malformed submissions
+            return None
+
+    async def get_user_info(self, handles: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch profiles of several users in one call.
 
-                # Parse verdict
-                verdict_str = raw_submission.get("verdict", "")
-                try:
-                    verdict = SubmissionStatus(verdict_str)
-                except ValueError:
-                    # Unknown verdict, treat as failed
-                    verdict = SubmissionStatus.WRONG_ANSWER
-
-                submission = Submission(
-                    id=raw_submission.get("id", 0),
-                    contest_id=raw_submission.get("contestId", 0),
-                    creation_time_seconds=raw_submission.get("creationTimeSeconds", 0),
-                    problem=problem,
-                    verdict=verdict,
-                    programming_language=raw_submission.get("programmingLanguage", ""),
-                )
+        Codeforces fails the whole call if any handle does not exist and names
+        that handle in the error comment.
 
-                submissions.append(submission)
+        Args:
+            handles: Codeforces handles (case-insensitive)
 
-            except (KeyError, TypeError):
-                # Skip malformed submissions
-                continue
+        Returns:
+            User data dictionaries; their "handle" field holds the canonical
+            spelling (match them to ``handles`` by it, not by position)
 
-        return submissions
+        Raises:
+            UserNotFoundError: If a handle does not exist or is not a valid
+                handle at all (``handle`` names it)
+            CodeforcesAPIError: If API request fails
+        """
+        url = f"{self.base_url}/user.info"
+
+        # A separator or other foreign character would shift how Codeforces splits the list
+        for handle in handles:
+            if not is_valid_handle(handle):
+                raise UserNotFoundError(f"User '{handle}' not found", handle)
+
+        async with self._guarded_call():
+            response = None
+            try:
+                response = await self.http_client.get(
+                    url,
+                    params={"handles": ";".join(handles)},
+                    timeout=endpoint_timeout("user.info"),
+                )
+                data = response.json()
+
+                status = data.get("status")
+                if status != "OK":
+                    comment = data.get("comment", "")
+                    match = _USER_NOT_FOUND.search(comment)
+                    if match:
+                        missing = match.group(1)
+                        raise UserNotFoundError(
+                            f"User '{missing}' not found on Codeforces", missing
+                        )
+                    raise _api_error(
+                        f"API returned status: {status}. Comment: {comment}",
+                        comment,
+                        response.status_code,
+                    )
+
+                return data.get("result", [])
+
+            except httpx.HTTPStatusError as e:
+                raise self._http_status_error(e)
+            except httpx.RequestError as e:
+                raise CodeforcesUnavailableError(f"Request error: {str(e)}")
+            except json.JSONDecodeError as e:
+                raise self._decode_error(e, response)
 
     async def get_contests(self) -> List[Dict[str, Any]]:
         """
@@ -145,52 +478,101 @@ class CodeforcesClient:
         """
         url = f"{self.base_url}/contest.list"
 
-        try:
-            response = await self.http_client.get(url)
-            data = response.json()
-
-            status = data.get("status")
-            if status != "OK":
-                raise CodeforcesAPIError(
-                    f"API returned status: {status}", response.status_code
+        async with self._guarded_call():
+            response = None
+            try:
+                response = await self.http_client.get(
+                    url, timeout=endpoint_timeout("contest.list")
                 )
+                data = response.json()
+
+                status = data.get("status")
+                if status != "OK":
+                    raise _api_error(
+                        f"API returned status: {status}",
+                        data.get("comment", ""),
+                        response.status_code,
+                    )
+
+                return data.get("result", [])
+
+            except httpx.HTTPStatusError as e:
+                raise self._http_status_error(e)
+            except httpx.RequestError as e:
+                raise CodeforcesUnavailableError(f"Request error: {str(e)}")
+            except json.JSONDecodeError as e:
+                raise self._decode_error(e, response)
+
+    async def get_problemset_problems(self) -> List[Problem]:
+        """
+        Fetch all problems of the problemset.
 
-            return data.get("result", [])
+        Returns:
+            List of problems with their current rating and tags
+
+        Raises:
+            CodeforcesAPIError: If API request fails
+        """
+        url = f"{self.base_url}/problemset.problems"
 
-        except httpx.HTTPStatusError as e:
-            raise CodeforcesAPIError(f"HTTP error {e.response.status_code}: {e.response.text}")
-        except httpx.RequestError as e:
-            raise CodeforcesAPIError(f"Request error: {str(e)}")
-        except json.JSONDecodeError as e:
-            raise CodeforcesAPIError(f"JSON decode error: {str(e)}")
+        async with self._guarded_call():
+            response = None
+            try:
+                response = await self.http_client.get(
+                    url, timeout=endpoint_timeout("problemset.problems")
+                )
+                data = response.json()
+
+                status = data.get("status")
+                if status != "OK":
+                    raise _api_error(
+                        f"API returned status: {status}",
+                        data.get("comment", ""),
+                        response.status_code,
+                    )
+
+                return [
+                    Problem(
+                        contest_id=raw_problem.get("contestId", 0),
+                        index=raw_problem.get("index", ""),
+                        name=raw_problem.get("name", ""),
+                        rating=raw_problem.get("rating"),
+                        tags=raw_problem.get("tags", []),
+                    )
+                    for raw_problem in data.get("result", {}).get("problems", [])
+                ]
+
+            except httpx.HTTPStatusError as e:
+                raise self._http_status_error(e)
+            except httpx.RequestError as e:
+                raise CodeforcesUnavailableError(f"Request error: {str(e)}")
+            except json.JSONDecodeError as e:
+                raise self._decode_error(e, response)
 
     async def get_contest_divisions(self) -> Dict[int, str | None]:
         """
         Fetch all contests and extract their division information.
 
+        Not cached here: the worker keeps the result in Redis (see
+        ``backend.infrastructure.contest_divisions``).
+
         Returns:
             Dictionary mapping contest_id to division string (e.g., "Div. 1", "Div. 2")
 
         Raises:
             CodeforcesAPIError: If API request fails
         """
-        global _contest_division_cache
-
-        # Return cached data if available
-        if _contest_division_cache:
-            return _contest_division_cache
-
         contests = await self.get_contests()
 
+        divisions: Dict[int, str | None] = {}
         for contest in contests:
             contest_id = contest.get("id")
             contest_name = contest.get("name", "")
 
             if contest_id is not None:
-                division = self._extract_division(contest_name)
-                _contest_division_cache[contest_id] = division
+                divisions[contest_id] = self._extract_division(contest_name)
 
-        return _contest_division_cache
+        return divisions
 
     @staticmethod
     def _extract_division(contest_name: str) -> str | None:
@@ -0,0 +1,208 @@
+"""Transparent compression of large Redis values."""
+
+import logging
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from functools import cache
+from importlib.util import find_spec
+from typing import Any, Dict, Optional
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Compressed values start with this header and one algorithm byte. A NUL byte
+# never starts a JSON or columnar payload, so uncompressed values stay readable.
+_HEADER = b"\x00Z"
+ZLIB = 1
+ZSTD = 2
+
+_ZLIB_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+
+@dataclass
+class CompressionStats:
+    """Sizes and timings of compressed values in this process."""
+
+    compressed: int = 0  # Values written compressed
+    bytes_in: int = 0  # Their uncompressed size
+    bytes_out: int = 0  # Their stored size
+    encode_seconds: float = 0.0
+    decompressed: int = 0  # Compressed values read
+    decode_seconds: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        """Uncompressed size divided by stored size (higher is better)."""
+        return self.bytes_in / self.bytes_out if self.bytes_out else 0.0
+
+    def record_encode(self, bytes_in: int, bytes_out: int, seconds: float) -> None:
+        """Count one compressed value."""
+        self.compressed += 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.encode_seconds += seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert counters to a dictionary, including derived values."""
+        return {
+            **asdict(self),
+            "encode_seconds": round(self.encode_seconds, 3),
+            "decode_seconds": round(self.decode_seconds, 3),
+            "ratio": round(self.ratio, 2),
+        }
+
+
+# Process-wide counters
+compression_stats = CompressionStats()
+
+
+def _zstd_available() -> bool:
+    """Check whether the optional zstandard package is installed."""
+    return find_spec("zstandard") is not None
+
+
+@cache
+def compression_algorithm() -> Optional[int]:
+    """
+    Algorithm used for new values, from ``settings.redis_compression``.
+
+    Returns:
+        ``ZSTD``, ``ZLIB``, or None if compression is disabled
+    """
+    if settings.redis_compression == "none":
+        return None
+    if settings.redis_compression == "zlib":
+        return ZLIB
+    if _zstd_available():
+        return ZSTD
+    if settings.redis_compression == "zstd":
+        logger.warning("REDIS_COMPRESSION is zstd but 'zstandard' is not installed, using zlib")
+    return ZLIB
+
+
+def _compressor(algorithm: int):
+    """Create a streaming compressor (``compress``/``flush`` interface)."""
+    if algorithm == ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+    return zlib.compressobj(_ZLIB_LEVEL)
+
+
+def is_compressed(raw: bytes | str) -> bool:
+    """Check whether a stored value carries the compression header."""
+    return isinstance(raw, bytes) and raw[:2] == _HEADER
+
+
+def compress_value(data: bytes) -> bytes:
+    """
+    Compress a value before storing it, if it is large enough to pay off.
+
+    Args:
+        data: Encoded value
+
+    Returns:
+        Header and compressed bytes, or ``data`` itself if compression is
+        disabled, the value is below ``settings.redis_compression_threshold``
+        or it does not shrink
+    """
+    algorithm = compression_algorithm()
+    if algorithm is None or len(data) < settings.redis_compression_threshold:
+        return data
+
+    started = time.perf_counter()
+    compressor = _compressor(algorithm)
+    value = _HEADER + bytes([algorithm]) + compressor.compress(data) + compressor.flush()
+    if len(value) >= len(data):
+        return data
+    compression_stats.record_encode(len(data), len(value), time.perf_counter() - started)
+    return value
+
+
+def decompress_value(raw: bytes | str) -> bytes | str:
+    """
+    Undo ``compress_value`` (or ``StreamCompressor``).
+
+    Args:
+        raw: Stored value, compressed or not
+
+    Returns:
+        Uncompressed value; values without the header are returned unchanged
+
+    Raises:
+        ValueError: If the algorithm is unknown or its library is not installed
+    """
+    if not is_compressed(raw):
+        return raw
+
+    started = time.perf_counter()
+    algorithm, body = raw[2], raw[3:]
+    if algorithm == ZLIB:
+        data = zlib.decompress(body)
+    elif algorithm == ZSTD:
+        if not _zstd_available():
+            raise ValueError("Value is zstd-compressed but 'zstandard' is not installed")
+        import zstandard
+
+        # Streamed values have no content size in the frame header
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    else:
+        raise ValueError(f"Unknown compression algorithm: {algorithm}")
+
+    compression_stats.decompressed += 1
+    compression_stats.decode_seconds += time.perf_counter() - started
+    return data
+
+
+class StreamCompressor:
+    """
+    Compress a value that is written to Redis in appended pieces.
+
+    Used for streamed histories, which are large by construction, so the size
+    threshold does not apply.
+    """
+
+    def __init__(self, algorithm: int):
+        """
+        Initialize compressor.
+
+        Args:
+            algorithm: ``ZSTD`` or ``ZLIB``
+        """
+        self._algorithm = algorithm
+        self._compressor = _compressor(algorithm)
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._seconds = 0.0
+
+    @classmethod
+    def create(cls) -> Optional["StreamCompressor"]:
+        """Create a compressor for the configured algorithm (None if disabled)."""
+        algorithm = compression_algorithm()
+        return cls(algorithm) if algorithm is not None else None
+
+    def _timed(self, produce, bytes_in: int) -> bytes:
+        """Run a compressor call and count its sizes and time."""
+        started = time.perf_counter()
+        out = produce()
+        self._seconds += time.perf_counter() - started
+        self._bytes_in += bytes_in
+        self._bytes_out += len(out)
+        return out
+
+    def start(self, data: bytes) -> bytes:
+        """Header followed by the compressed first piece."""
+        return _HEADER + bytes([self._algorithm]) + self.compress(data)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress the next piece (may return b"" while input is buffered)."""
+        return self._timed(lambda: self._compressor.compress(data), len(data))
+
+    def flush(self) -> bytes:
+        """Remaining compressed bytes; the value is complete once they are appended."""
+        out = self._timed(self._compressor.flush, 0)
+        compression_stats.record_encode(self._bytes_in, self._bytes_out + 3, self._seconds)
+        return out
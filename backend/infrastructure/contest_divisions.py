@@ -0,0 +1,141 @@
+"""Contest division metadata, maintained by the worker in a Redis hash."""
+
+import logging
+import time
+from typing import Dict, Optional
+
+from redis.asyncio import Redis
+
+from backend.config import settings
+from backend.infrastructure.codeforces_client import CodeforcesClient
+
+logger = logging.getLogger(__name__)
+
+
+def contest_divisions_key() -> str:
+    """Redis hash mapping contest id to division ("" for contests without one)."""
+    return "contest_divisions"
+
+
+def max_contest_id_key() -> str:
+    """Redis key holding the highest contest id stored in the hash."""
+    return f"{contest_divisions_key()}:max_id"
+
+
+def version_key() -> str:
+    """Redis counter bumped on every write to the hash."""
+    return f"{contest_divisions_key()}:version"
+
+
+def _refresh_lock_key() -> str:
+    """Redis key ensuring one contest.list download per interval across all workers."""
+    return f"{contest_divisions_key()}:lock"
+
+
+def _full_refresh_key() -> str:
+    """Redis key marking that all contests were rewritten recently."""
+    return f"{contest_divisions_key()}:full"
+
+
+async def refresh_contest_divisions(redis: Redis, client: CodeforcesClient) -> int:
+    """
+    Store the divisions of contests that are not in the hash yet.
+
+    Runs at most once per ``settings.contest_refresh_interval`` across all
+    workers. Only contests above the highest stored id are written, except
+    once per ``settings.contest_full_refresh_interval`` when every contest is
+    rewritten to pick up renamed rounds.
+
+    Args:
+        redis: Redis client instance
+        client: Codeforces client (rate limited like all worker calls)
+
+    Returns:
+        Number of contests written (0 if another worker refreshed recently)
+    """
+    if not await redis.set(
+        _refresh_lock_key(), 1, nx=True, ex=settings.contest_refresh_interval
+    ):
+        return 0
+
+    try:
+        divisions = await client.get_contest_divisions()
+    except Exception:
+        # Let the next scheduler round (on any worker) try again
+        await redis.delete(_refresh_lock_key())
+        raise
+
+    max_id = int(await redis.get(max_contest_id_key()) or 0)
+    full = await redis.set(
+        _full_refresh_key(), 1, nx=True, ex=settings.contest_full_refresh_interval
+    )
+    if not full:
+        divisions = {cid: division for cid, division in divisions.items() if cid > max_id}
+    if not divisions:
+        return 0
+
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            contest_divisions_key(),
+            mapping={cid: division or "" for cid, division in divisions.items()},
+        )
+        pipe.set(max_contest_id_key(), max(max_id, *divisions))
+        pipe.incr(version_key())
+        await pipe.execute()
+
+    logger.info(f"Stored divisions of {len(divisions)} contest(s) ({'full' if full else 'new'})")
+    return len(divisions)
+
+
+class ContestDivisionCache:
+    """
+    Process-local copy of the contest division hash.
+
+    Every ``ttl`` seconds the version counter is checked (one GET); the hash
+    itself is only re-read when the worker wrote to it. Requests never call
+    ``contest.list``: until the worker has filled the hash, no contest has a
+    division.
+    """
+
+    def __init__(self, ttl: float = 60.0, clock=time.monotonic):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds between version checks
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._divisions: Dict[int, str | None] = {}
+        self._version: Optional[bytes] = None
+        self._checked_at: Optional[float] = None
+
+    async def get(self, redis: Redis) -> Dict[int, str | None]:
+        """
+        Get the mapping of contest ids to divisions.
+
+        Args:
+            redis: Redis client instance
+
+        Returns:
+            Dictionary mapping contest_id to division string (or None)
+        """
+        now = self._clock()
+        if self._checked_at is not None and now - self._checked_at < self.ttl:
+            return self._divisions
+
+        self._checked_at = now
+        version = await redis.get(version_key())
+        if version != self._version:
+            raw = await redis.hgetall(contest_divisions_key())
+            self._divisions = {
+                int(cid): division.decode() or None for cid, division in raw.items()
+            }
+            self._version = version
+        return self._divisions
+
+    @property
+    def version(self) -> int:
+        """Version of the mapping last returned by ``get`` (0 before the worker first wrote it)."""
+        return int(self._version or 0)
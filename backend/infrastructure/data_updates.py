@@ -0,0 +1,87 @@
+"""Redis pub/sub notifications about handles whose cached submissions changed."""
+
+import asyncio
+import logging
+from typing import Callable, List, Optional, Sequence
+
+from redis.asyncio import Redis
+
+from backend.infrastructure.handles import canonical_handle
+from backend.infrastructure.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before resubscribing after the pub/sub connection failed
+_RECONNECT_DELAY = 1.0
+
+
+def data_updates_channel() -> str:
+    """Redis pub/sub channel carrying the canonical handle of every data write."""
+    return "submissions_updated"
+
+
+def update_message(handle: str) -> str:
+    """Message published on ``data_updates_channel()`` for a handle."""
+    return canonical_handle(handle)
+
+
+async def listen_for_data_updates(
+    redis: Redis, handlers: Sequence[Callable[[str], None]]
+) -> None:
+    """
+    Call ``handlers`` with the canonical handle of every published update, until cancelled.
+
+    Messages published while the subscription is down are lost, so caches
+    driven by this must also check data versions (this only frees memory and
+    drops superseded entries early).
+
+    Args:
+        redis: Redis client instance
+        handlers: Callbacks taking a canonical handle
+    """
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(data_updates_channel())
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    handle = message["data"].decode()
+                    for handler in handlers:
+                        handler(handle)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Data update subscription failed, resubscribing: {e}")
+            await asyncio.sleep(_RECONNECT_DELAY)
+
+
+# Process-wide listener task of the API
+_listener: Optional[asyncio.Task] = None
+_handlers: List[Callable[[str], None]] = []
+
+
+def on_data_update(handler: Callable[[str], None]) -> None:
+    """Register a callback for updates received by the process-wide listener."""
+    _handlers.append(handler)
+
+
+def start_data_update_listener() -> None:
+    """Start the process-wide listener on the shared Redis client (no-op if running)."""
+    global _listener
+
+    if _listener is None or _listener.done():
+        _listener = asyncio.create_task(listen_for_data_updates(get_redis_client(), _handlers))
+
+
+async def stop_data_update_listener() -> None:
+    """Cancel the process-wide listener."""
+    global _listener
+
+    if _listener is not None:
+        _listener.cancel()
+        try:
+            await _listener
+        except asyncio.CancelledError:
+            pass
+        _listener = None
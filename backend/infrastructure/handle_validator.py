@@ -0,0 +1,169 @@
+"""Batched validation of Codeforces handles through user.info."""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from redis.asyncio import Redis
+
+from backend.config import settings
+from backend.infrastructure.codeforces_client import CodeforcesClient, UserNotFoundError
+from backend.infrastructure.handles import canonical_handle, is_valid_handle
+
+logger = logging.getLogger(__name__)
+
+
+def handle_alias_key(handle: str) -> str:
+    """Redis key mapping a validated handle (any spelling) to its canonical spelling."""
+    return f"handle_alias:{canonical_handle(handle)}"
+
+
+class HandleValidator:
+    """
+    Coalesces handle checks of concurrent requests into batched user.info calls.
+
+    The first unknown handle opens a collection window of ``window`` seconds;
+    every handle requested meanwhile joins the same ``user.info`` call (up to
+    ``batch_size`` handles per call). Codeforces fails such a call as a whole
+    if one handle does not exist, so that handle is rejected and the call is
+    repeated for the rest. Handles outside Codeforces' charset are rejected
+    before batching, and answers are matched to callers by handle, never by
+    position.
+    """
+
+    def __init__(self, window: float = 0.2, batch_size: int = 100):
+        """
+        Initialize validator.
+
+        Args:
+            window: Seconds to collect handles before calling user.info
+            batch_size: Maximum handles per user.info call
+        """
+        self.window = window
+        self.batch_size = max(batch_size, 1)
+        self._pending: Dict[str, Tuple[str, asyncio.Future]] = {}
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def validate(self, client: CodeforcesClient, handle: str) -> str:
+        """
+        Check that a handle exists.
+
+        Args:
+            client: Codeforces client used if this call opens a new batch
+            handle: Codeforces handle (any spelling)
+
+        Returns:
+            Canonical spelling of the handle
+
+        Raises:
+            UserNotFoundError: If the handle does not exist or is not a valid handle
+            CodeforcesAPIError: If the user.info call fails
+        """
+        if not is_valid_handle(handle):
+            raise UserNotFoundError(f"User '{handle}' not found", handle)
+
+        key = canonical_handle(handle)
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = (handle, asyncio.get_running_loop().create_future())
+            self._pending[key] = entry
+            if self._flusher is None:
+                self._flusher = asyncio.create_task(self._flush_later(client))
+
+        # A cancelled caller must not cancel the lookup shared with others
+        return await asyncio.shield(entry[1])
+
+    async def _flush_later(self, client: CodeforcesClient) -> None:
+        """Wait for the collection window, then validate everything collected."""
+        try:
+            await asyncio.sleep(self.window)
+            while self._pending:
+                keys = list(self._pending)[: self.batch_size]
+                batch = {key: self._pending.pop(key) for key in keys}
+                await self._resolve(client, batch)
+        finally:
+            self._flusher = None
+
+    async def _resolve(
+        self, client: CodeforcesClient, batch: Dict[str, Tuple[str, asyncio.Future]]
+    ) -> None:
+        """Resolve the futures of one batch, dropping unknown handles one by one."""
+        while batch:
+            handles: List[str] = [handle for handle, _ in batch.values()]
+            try:
+                users = await client.get_user_info(handles)
+            except UserNotFoundError as e:
+                entry = batch.pop(canonical_handle(e.handle or ""), None)
+                if entry is None:  # Cannot tell which handle failed
+                    self._fail(batch, e)
+                    return
+                _settle(entry[1], error=e)
+                continue
+            except Exception as e:
+                logger.warning(f"Validating {len(handles)} handles failed: {e}")
+                self._fail(batch, e)
+                return
+
+            canonical = {
+                canonical_handle(user["handle"]): user["handle"]
+                for user in users
+                if isinstance(user.get("handle"), str)
+            }
+            for key, (handle, future) in batch.items():
+                if key in canonical:
+                    _settle(future, result=canonical[key])
+                else:  # Not answered, so it is not known to exist
+                    _settle(future, error=UserNotFoundError(f"User '{handle}' not found", handle))
+            return
+
+    @staticmethod
+    def _fail(batch: Dict[str, Tuple[str, asyncio.Future]], error: Exception) -> None:
+        """Fail every future of a batch with the same error."""
+        for _, future in batch.values():
+            _settle(future, error=error)
+
+
+def _settle(
+    future: asyncio.Future, result: Optional[str] = None, error: Optional[Exception] = None
+) -> None:
+    """Complete a future unless it is already done."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+        # Mark the exception retrieved in case every waiter was cancelled
+        future.add_done_callback(lambda f: f.exception())
+    else:
+        future.set_result(result)
+
+
+async def resolve_handle(
+    redis: Redis, client: CodeforcesClient, handle: str, validator: "HandleValidator"
+) -> str:
+    """
+    Validate a handle unless it was validated recently.
+
+    Canonical spellings are remembered in ``handle_alias:{handle}`` for
+    ``settings.handle_alias_ttl`` seconds, so each handle costs at most one
+    (batched) user.info lookup per TTL.
+
+    Args:
+        redis: Redis client instance
+        client: Codeforces client for the user.info call
+        handle: Codeforces handle (any spelling)
+        validator: Batching validator of this process
+
+    Returns:
+        Canonical spelling of the handle
+
+    Raises:
+        UserNotFoundError: If the handle does not exist
+        CodeforcesAPIError: If the user.info call fails
+    """
+    cached = await redis.get(handle_alias_key(handle))
+    if cached:
+        return cached.decode()
+
+    canonical = await validator.validate(client, handle)
+    await redis.setex(handle_alias_key(handle), settings.handle_alias_ttl, canonical)
+    return canonical
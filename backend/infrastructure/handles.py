@@ -0,0 +1,39 @@
+"""Canonical form of Codeforces handles used in cache and queue keys."""
+
+import re
+
+# Characters Codeforces allows in handles (it also caps their length at 24)
+_HANDLE_PATTERN = re.compile(r"[A-Za-z0-9_.-]{1,24}")
+
+
+def canonical_handle(handle: str) -> str:
+    """
+    Canonical form of a handle for Redis keys and task data.
+
+    Codeforces handles are case-insensitive, so "Tourist" and "tourist" must
+    share cache entries, pending-task locks and fetches. Responses keep the
+    spelling the client asked for.
+
+    Args:
+        handle: Codeforces handle (any spelling)
+
+    Returns:
+        Case-folded handle
+    """
+    return handle.strip().lower()
+
+
+def is_valid_handle(handle: str) -> bool:
+    """
+    Check whether a string can be a Codeforces handle at all.
+
+    Anything else (e.g. containing ";", which separates handles in user.info
+    calls) cannot exist and must not be sent to Codeforces.
+
+    Args:
+        handle: Codeforces handle (any spelling)
+
+    Returns:
+        True if the handle only uses characters Codeforces allows
+    """
+    return _HANDLE_PATTERN.fullmatch(handle.strip()) is not None
@@ -0,0 +1,137 @@
+"""Process-wide pooled HTTP client for Codeforces API access."""
+
+import logging
+from dataclasses import asdict, dataclass
+from importlib.util import find_spec
+from typing import Any, Dict
+
+import httpx
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HttpClientStats:
+    """Counters describing how well pooled connections are reused."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def reused_requests(self) -> int:
+        """Requests served over an already open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests that did not need a new connection."""
+        return self.reused_requests / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert counters to a dictionary, including derived values."""
+        return {
+            **asdict(self),
+            "reused_requests": self.reused_requests,
+            "reuse_ratio": round(self.reuse_ratio, 3),
+        }
+
+    async def on_request(self, request: httpx.Request) -> None:
+        """httpx request hook: count the request and trace connection setup."""
+        self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+
+
+# Process-wide client and its counters
+_http_client: httpx.AsyncClient | None = None
+http_client_stats = HttpClientStats()
+
+
+def endpoint_timeout(method: str) -> httpx.Timeout:
+    """
+    Timeout for a Codeforces API method.
+
+    Large responses (a full user.status history, contest and problem lists) get a longer
+    read timeout than the default; connecting is always bounded tightly.
+
+    Args:
+        method: API method name, e.g. "user.status"
+
+    Returns:
+        httpx timeout configuration
+    """
+    read_timeouts = {
+        "user.status": settings.codeforces_user_status_timeout,
+        "contest.list": settings.codeforces_contest_list_timeout,
+        "problemset.problems": settings.codeforces_contest_list_timeout,
+    }
+    return httpx.Timeout(
+        settings.codeforces_timeout,
+        connect=settings.codeforces_connect_timeout,
+        read=read_timeouts.get(method, settings.codeforces_timeout),
+    )
+
+
+def _http2_enabled() -> bool:
+    """Check whether HTTP/2 is requested and the optional h2 package is installed."""
+    if not settings.codeforces_http2:
+        return False
+    if find_spec("h2") is None:
+        logger.warning("CODEFORCES_HTTP2 is enabled but 'h2' is not installed, using HTTP/1.1")
+        return False
+    return True
+
+
+def create_http_client(stats: HttpClientStats | None = None) -> httpx.AsyncClient:
+    """
+    Create an HTTP client tuned for Codeforces API access.
+
+    Args:
+        stats: Counters to update on every request (optional)
+
+    Returns:
+        Async HTTP client with keep-alive connection pooling
+    """
+    return httpx.AsyncClient(
+        timeout=endpoint_timeout(""),
+        limits=httpx.Limits(
+            max_connections=settings.codeforces_max_connections,
+            max_keepalive_connections=settings.codeforces_max_keepalive_connections,
+            keepalive_expiry=settings.codeforces_keepalive_expiry,
+        ),
+        http2=_http2_enabled(),
+        event_hooks={"request": [stats.on_request]} if stats is not None else None,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        Shared async HTTP client
+    """
+    global _http_client
+
+    if _http_client is None:
+        _http_client = create_http_client(http_client_stats)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the process-wide HTTP client and log its connection reuse counters."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info(f"Codeforces HTTP client closed: {http_client_stats.as_dict()}")
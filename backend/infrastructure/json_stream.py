@@ -0,0 +1,104 @@
+"""Incremental parser for large Codeforces API responses."""
+
+import json
+import re
+from typing import Any, List
+
+_WHITESPACE_AND_COMMAS = " \t\r\n,"
+
+
+class ResultArrayParser:
+    """
+    Incrementally extract the items of the top-level ``result`` array.
+
+    Codeforces responses look like ``{"status": "OK", "result": [...]}``. The
+    parser is fed text chunks as they arrive and returns every array item that
+    is complete so far, so only one partially received item is buffered at a
+    time. Everything outside the array is kept to rebuild a small envelope
+    (status, comment) once the body is complete.
+    """
+
+    def __init__(self, key: str = "result"):
+        """
+        Initialize parser.
+
+        Args:
+            key: Name of the array field to stream
+        """
+        self._array_start = re.compile(rf'"{re.escape(key)}"\s*:\s*\[')
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._head = ""
+        self._tail = ""
+        self._in_array = False
+        self._array_done = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        Feed the next chunk of the response body.
+
+        Args:
+            chunk: Decoded text chunk
+
+        Returns:
+            Array items completed by this chunk, in order
+        """
+        if self._array_done:
+            self._tail += chunk
+            return []
+
+        self._buffer += chunk
+
+        if not self._in_array:
+            match = self._array_start.search(self._buffer)
+            if not match:
+                return []
+            self._head = self._buffer[: match.end()]
+            self._buffer = self._buffer[match.end() :]
+            self._in_array = True
+
+        return self._drain()
+
+    def _drain(self) -> List[Any]:
+        """Decode every complete item at the front of the buffer."""
+        items = []
+        buffer = self._buffer
+        pos = 0
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE_AND_COMMAS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._array_done = True
+                self._tail = buffer[pos:]
+                pos = len(buffer)
+                break
+            try:
+                item, pos = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Item is not complete yet, wait for more data
+                break
+            items.append(item)
+
+        self._buffer = buffer[pos:]
+        return items
+
+    def envelope(self) -> dict:
+        """
+        Return the response document without the streamed array items.
+
+        Must be called after the whole body was fed.
+
+        Returns:
+            Parsed top-level object with the streamed array replaced by ``[]``
+
+        Raises:
+            json.JSONDecodeError: If the body is truncated or not valid JSON
+        """
+        if not self._in_array:
+            return json.loads(self._buffer)
+        if not self._array_done:
+            raise json.JSONDecodeError("Unterminated result array", self._buffer, 0)
+        return json.loads(self._head + self._tail)
@@ -0,0 +1,95 @@
+"""Process-local LRU cache bounded by the total size of its values."""
+
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SizedLRUCache(Generic[K, V]):
+    """
+    Least-recently-used cache whose capacity is a total size, not an entry count.
+
+    Callers state each value's size in whatever unit the cache was created
+    with (bytes, submissions, ...). Values larger than the whole capacity are
+    not cached. Not thread-safe; meant for one event loop.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum total size of cached values (0 disables the cache)
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, Tuple[V, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Look up a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: K, value: V, size: int) -> None:
+        """
+        Cache a value, evicting least recently used ones to stay within ``max_size``.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Size of the value
+        """
+        self.remove(key)
+        if size > self.max_size:
+            return
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+    def discard(self, matches: Callable[[K], bool]) -> int:
+        """
+        Remove all entries whose key matches.
+
+        Args:
+            matches: Predicate on keys
+
+        Returns:
+            Number of removed entries
+        """
+        keys = [key for key in self._entries if matches(key)]
+        for key in keys:
+            self.remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size = 0
+
+    def remove(self, key: K) -> None:
+        """Remove an entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
@@ -0,0 +1,129 @@
+"""Per-handle request popularity with exponential decay, kept in a Redis sorted set."""
+
+import time
+from collections import OrderedDict
+from typing import List
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from backend.config import settings
+from backend.infrastructure.handles import canonical_handle
+
+# Interval between decay steps in seconds; each step runs once cluster-wide
+DECAY_INTERVAL = 60 * 60
+
+# Scores below this after decay are dropped to keep the set small
+_PRUNE_BELOW = 0.1
+
+
+def decay_lock_key() -> str:
+    """Redis key ensuring one decay step per interval across all workers."""
+    return f"{settings.popularity_key}:decay"
+
+
+class PageViews:
+    """
+    Tells which requests for a handle start a new page view, per process.
+
+    The frontend requests every metric of a handle at once, so counting each
+    request would score one visit several times. A handle is counted again
+    only after ``window`` seconds without being counted.
+    """
+
+    def __init__(self, window: float, clock=time.monotonic):
+        """
+        Initialize page view tracking.
+
+        Args:
+            window: Seconds a page view lasts
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.window = window
+        self._clock = clock
+        # Canonical handle -> clock time it was last counted, oldest first
+        self._counted: OrderedDict[str, float] = OrderedDict()
+
+    def is_new_view(self, handle: str) -> bool:
+        """
+        Check whether a request for a handle starts a new page view, and remember it if so.
+
+        Args:
+            handle: Codeforces handle
+
+        Returns:
+            True if the handle was not counted within the window
+        """
+        now = self._clock()
+        # Forget views that ended (the oldest come first)
+        while self._counted and next(iter(self._counted.values())) <= now - self.window:
+            self._counted.popitem(last=False)
+
+        handle = canonical_handle(handle)
+        if handle in self._counted:
+            return False
+        self._counted[handle] = now
+        return True
+
+
+# Process-wide, shared by all metric controllers
+page_views = PageViews(window=settings.popularity_view_window)
+
+
+def record_access(pipe: Pipeline, handle: str) -> None:
+    """
+    Count one request for a handle as part of a pipeline.
+
+    Requests are counted alongside the cache read they trigger (see
+    ``read_cache_entry``), so counting costs no extra round trip. Callers
+    count one request per page view (see ``PageViews``).
+
+    Args:
+        pipe: Redis pipeline the command is queued on
+        handle: Codeforces handle
+    """
+    pipe.zincrby(settings.popularity_key, 1, canonical_handle(handle))
+
+
+async def decay_popularity(redis: Redis) -> bool:
+    """
+    Apply one decay step to all scores, unless another process already did.
+
+    Scores are multiplied by ``0.5 ** (DECAY_INTERVAL / popularity_half_life)``
+    so a request weighs half as much after one half-life, and handles nobody
+    asks for anymore fade out of the set.
+
+    Args:
+        redis: Redis client instance
+
+    Returns:
+        True if this call performed the decay step
+    """
+    if not await redis.set(decay_lock_key(), 1, nx=True, ex=DECAY_INTERVAL):
+        return False
+
+    factor = 0.5 ** (DECAY_INTERVAL / settings.popularity_half_life)
+    key = settings.popularity_key
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.zunionstore(key, {key: factor})
+        pipe.zremrangebyscore(key, "-inf", f"({_PRUNE_BELOW}")
+        await pipe.execute()
+    return True
+
+
+async def popular_handles(redis: Redis, limit: int, min_score: float) -> List[str]:
+    """
+    Most requested handles, most popular first.
+
+    Args:
+        redis: Redis client instance
+        limit: Maximum number of handles
+        min_score: Minimum decayed request count
+
+    Returns:
+        Handles ordered by descending popularity
+    """
+    handles = await redis.zrevrangebyscore(
+        settings.popularity_key, "+inf", min_score, start=0, num=limit
+    )
+    return [h.decode() if isinstance(h, bytes) else h for h in handles]
@@ -0,0 +1,93 @@
+"""Metric responses precomputed by the worker for every period, stored in Redis."""
+
+import time
+from typing import Any, Iterable, Mapping, Optional, Tuple
+
+from redis.asyncio import Redis
+
+from backend.infrastructure.compression import compress_value, decompress_value
+from backend.infrastructure.handles import canonical_handle
+from backend.infrastructure.response_cache import encode_params
+
+# Hash fields next to the responses
+_VERSION_FIELD = "version"
+_COMPUTED_AT_FIELD = "computed_at"
+
+
+def precomputed_responses_key(handle: str) -> str:
+    """Redis hash holding the precomputed metric responses of a handle."""
+    return f"precomputed_responses:{canonical_handle(handle)}"
+
+
+def response_field(endpoint: str, params: Mapping[str, Any]) -> str:
+    """Hash field of the response of an endpoint for some query parameters."""
+    return f"{endpoint}?{encode_params(params)}"
+
+
+async def store_precomputed_responses(
+    redis: Redis,
+    handle: str,
+    version: int,
+    responses: Iterable[Tuple[str, Mapping[str, Any], bytes]],
+    computed_at: float,
+    expire: int,
+) -> None:
+    """
+    Replace the precomputed responses of a handle.
+
+    Args:
+        redis: Redis client instance
+        handle: Codeforces handle
+        version: Data version the responses were computed from
+        responses: Endpoint name, query parameters and serialized body of each response
+        computed_at: Unix time the responses were computed at
+        expire: Seconds until the hash expires (the remaining TTL of the submissions)
+    """
+    key = precomputed_responses_key(handle)
+    mapping = {
+        response_field(endpoint, params): compress_value(body)
+        for endpoint, params, body in responses
+    }
+    mapping[_VERSION_FIELD] = str(version)
+    mapping[_COMPUTED_AT_FIELD] = str(computed_at)
+
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.delete(key)
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, expire)
+        await pipe.execute()
+
+
+async def load_precomputed_response(
+    redis: Redis,
+    handle: str,
+    endpoint: str,
+    params: Mapping[str, Any],
+    version: int,
+    max_age: Optional[float] = None,
+) -> Optional[Tuple[bytes, float]]:
+    """
+    Read a precomputed response.
+
+    Args:
+        redis: Redis client instance
+        handle: Codeforces handle
+        endpoint: Endpoint name, e.g. "tag-ratings"
+        params: Query parameters and other inputs of the response
+        version: Current data version of the handle
+        max_age: Maximum seconds since the response was computed (None: no limit)
+
+    Returns:
+        Serialized body and its age in seconds, or None if it was not
+        precomputed, was computed from another data version or is too old
+    """
+    stored_version, computed_at, body = await redis.hmget(
+        precomputed_responses_key(handle),
+        [_VERSION_FIELD, _COMPUTED_AT_FIELD, response_field(endpoint, params)],
+    )
+    if body is None or stored_version is None or int(stored_version) != version:
+        return None
+    age = max(time.time() - float(computed_at), 0.0)
+    if max_age is not None and age > max_age:
+        return None
+    return decompress_value(body), age
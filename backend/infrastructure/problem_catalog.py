@@ -0,0 +1,158 @@
+"""Shared catalog of Codeforces problems, referenced from cached submissions."""
+
+import json
+import logging
+import time
+from typing import Dict, Iterable, Optional
+
+from redis.asyncio import Redis
+
+from backend.config import settings
+from backend.domain.models.codeforces import Problem
+from backend.infrastructure.codeforces_client import CodeforcesClient
+
+logger = logging.getLogger(__name__)
+
+
+def problem_catalog_key() -> str:
+    """Redis hash mapping a problem reference to the problem's name, rating and tags."""
+    return "problem_catalog"
+
+
+def _refresh_lock_key() -> str:
+    """Redis key ensuring one problemset.problems download per interval across all workers."""
+    return f"{problem_catalog_key()}:lock"
+
+
+def problem_ref(problem: Problem) -> str:
+    """Compact reference to a problem, e.g. "1000/A"."""
+    return f"{problem.contest_id}/{problem.index}"
+
+
+def placeholder_problem(ref: str) -> Problem:
+    """Problem known only by its reference (name, rating and tags unknown)."""
+    contest_id, _, index = ref.partition("/")
+    return Problem(contest_id=int(contest_id or 0), index=index, name="")
+
+
+def _encode(problem: Problem) -> str:
+    """Encode the catalog entry of a problem."""
+    return json.dumps({"name": problem.name, "rating": problem.rating, "tags": problem.tags})
+
+
+def _decode(ref: str, raw: bytes | str) -> Problem:
+    """Build a problem from its reference and catalog entry."""
+    data = json.loads(raw)
+    contest_id, _, index = ref.partition("/")
+    return Problem(
+        contest_id=int(contest_id or 0),
+        index=index,
+        name=data.get("name", ""),
+        rating=data.get("rating"),
+        tags=data.get("tags", []),
+    )
+
+
+async def add_problems(redis: Redis, problems: Iterable[Problem]) -> None:
+    """
+    Add problems seen in fetched submissions to the catalog.
+
+    Existing entries are kept: the problemset refresh is authoritative (a
+    problem's rating is only published some time after its contest).
+
+    Args:
+        redis: Redis client instance
+        problems: Problems as parsed from user.status
+    """
+    unique = {problem_ref(problem): problem for problem in problems if problem.name}
+    if not unique:
+        return
+    async with redis.pipeline(transaction=False) as pipe:
+        for ref, problem in unique.items():
+            pipe.hsetnx(problem_catalog_key(), ref, _encode(problem))
+        await pipe.execute()
+
+
+async def refresh_problem_catalog(redis: Redis, client: CodeforcesClient) -> int:
+    """
+    Rewrite the catalog from problemset.problems.
+
+    Runs at most once per ``settings.problem_catalog_refresh_interval``
+    across all workers and picks up newly published ratings.
+
+    Args:
+        redis: Redis client instance
+        client: Codeforces client (rate limited like all worker calls)
+
+    Returns:
+        Number of problems written (0 if another worker refreshed recently)
+    """
+    if not await redis.set(
+        _refresh_lock_key(), 1, nx=True, ex=settings.problem_catalog_refresh_interval
+    ):
+        return 0
+
+    try:
+        problems = await client.get_problemset_problems()
+    except Exception:
+        # Let the next round (on any worker) try again
+        await redis.delete(_refresh_lock_key())
+        raise
+
+    if problems:
+        await redis.hset(
+            problem_catalog_key(),
+            mapping={problem_ref(problem): _encode(problem) for problem in problems},
+        )
+    logger.info(f"Stored {len(problems)} problems in the problem catalog")
+    return len(problems)
+
+
+class ProblemCatalog:
+    """
+    Process-local view of the problem catalog.
+
+    Problems are looked up in Redis once and then kept in memory, so repeated
+    attempts and other handles share the same ``Problem`` objects. The local
+    copy is dropped every ``ttl`` seconds to pick up new ratings.
+    """
+
+    def __init__(self, ttl: float = 3600.0, clock=time.monotonic):
+        """
+        Initialize catalog.
+
+        Args:
+            ttl: Seconds problems are kept in memory
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._problems: Dict[str, Problem] = {}
+        self._loaded_at: Optional[float] = None
+
+    async def resolve(self, redis: Redis, refs: Iterable[str]) -> Dict[str, Problem]:
+        """
+        Look up problems by reference.
+
+        Args:
+            redis: Redis client instance
+            refs: Problem references
+
+        Returns:
+            Problems by reference; references missing from the catalog map to
+            placeholder problems without name, rating and tags
+        """
+        now = self._clock()
+        if self._loaded_at is None or now - self._loaded_at >= self.ttl:
+            self._problems = {}
+            self._loaded_at = now
+
+        refs = set(refs)
+        missing = [ref for ref in refs if ref not in self._problems]
+        if missing:
+            raw = await redis.hmget(problem_catalog_key(), missing)
+            for ref, value in zip(missing, raw):
+                if value is not None:
+                    self._problems[ref] = _decode(ref, value)
+
+        return {ref: self._problems.get(ref) or placeholder_problem(ref) for ref in refs}
@@ -0,0 +1,218 @@
+"""Rate limiters for outgoing Codeforces API requests."""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters describing how long callers waited for the rate limiter."""
+
+    acquisitions: int = 0
+    waited_acquisitions: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    fallbacks: int = 0
+    throttled: int = 0
+
+    @property
+    def average_wait(self) -> float:
+        """Average wait per acquisition in seconds."""
+        return self.total_wait / self.acquisitions if self.acquisitions else 0.0
+
+    def record(self, wait: float) -> None:
+        """Record one acquisition that waited ``wait`` seconds."""
+        self.acquisitions += 1
+        if wait > 0:
+            self.waited_acquisitions += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert counters to a dictionary, including derived values."""
+        return {**asdict(self), "average_wait": round(self.average_wait, 4)}
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter.
+
+    Limits requests made by the current process only.
+    """
+
+    def __init__(self, max_requests: int = 5, time_window: float = 1.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_requests: Maximum requests allowed per time window
+            time_window: Time window in seconds
+        """
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.tokens = max_requests
+        self.last_update = time.time()
+        self.lock = asyncio.Lock()
+        self.stats = RateLimiterStats()
+
+    async def acquire(self) -> float:
+        """
+        Acquire a token, blocking if necessary.
+
+        This method will block until a token is available.
+
+        Returns:
+            Seconds spent waiting for the token
+        """
+        started = time.monotonic()
+
+        async with self.lock:
+            while True:
+                now = time.time()
+                elapsed = now - self.last_update
+
+                # Refill tokens based on elapsed time
+                self.tokens = min(
+                    self.max_requests,
+                    self.tokens + (elapsed * self.max_requests / self.time_window),
+                )
+                self.last_update = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    logger.debug(f"Token acquired. Remaining tokens: {self.tokens:.2f}")
+                    waited = time.monotonic() - started
+                    self.stats.record(waited)
+                    return waited
+
+                # Wait for next token
+                wait_time = (1 - self.tokens) * self.time_window / self.max_requests
+                logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+
+    def on_success(self) -> None:
+        """Feedback hook for a successful request (the local bucket has a fixed rate)."""
+
+    def on_throttled(self) -> None:
+        """Feedback hook for a throttled request (the local bucket has a fixed rate)."""
+
+
+# GCRA with reservations: every caller atomically books the next free emission
+# slot and is told how long to sleep until it. Times are in microseconds from
+# the Redis server clock, so all replicas share a single timeline.
+_GCRA_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000000 + tonumber(now_parts[2])
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+
+local wait = tat - tolerance - now
+if wait < 0 then
+    wait = 0
+end
+
+local new_tat = tat + interval
+local ttl_ms = math.ceil((new_tat - now) / 1000) + 1000
+redis.call('SET', KEYS[1], string.format('%d', new_tat), 'PX', ttl_ms)
+return wait
+"""
+
+
+class RedisRateLimiter:
+    """
+    Cluster-wide rate limiter backed by Redis (GCRA).
+
+    Every process drawing from the same ``key`` shares one request budget, so
+    adding worker replicas or API processes does not multiply the request rate
+    towards Codeforces. If Redis is unavailable, the limiter falls back to an
+    in-process token bucket with the same rate.
+
+    The rate adapts AIMD-style to feedback from the caller: it is cut by
+    ``decrease_factor`` whenever Codeforces reports "Call limit exceeded" and
+    grows back by ``increase_step`` per successful request, up to ``max_rate``.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        rate: float,
+        burst: int = 1,
+        key: str = "rate_limit:codeforces",
+        min_rate: float = 0.5,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            redis: Async Redis client instance
+            rate: Allowed requests per second across all processes (upper bound)
+            burst: Requests allowed back-to-back before spacing kicks in
+            key: Redis key holding the shared state
+            min_rate: Lower bound for the adaptive rate
+            increase_step: Requests/second added after each successful request
+            decrease_factor: Multiplier applied to the rate when throttled
+        """
+        self.redis = redis
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.burst = max(burst, 1)
+        self.key = key
+        self.stats = RateLimiterStats()
+        self._script = redis.register_script(_GCRA_SCRIPT)
+        self._fallback = RateLimiter(max_requests=max(int(rate), 1), time_window=1.0)
+
+    async def acquire(self) -> float:
+        """
+        Reserve the next request slot and wait for it.
+
+        Returns:
+            Seconds spent waiting for the slot
+        """
+        interval_us = int(1_000_000 / self.rate)
+        tolerance_us = (self.burst - 1) * interval_us
+
+        try:
+            wait_us = await self._script(keys=[self.key], args=[interval_us, tolerance_us])
+        except RedisError as e:
+            logger.warning(f"Redis rate limiter unavailable, using local limiter: {e}")
+            self.stats.fallbacks += 1
+            waited = await self._fallback.acquire()
+            self.stats.record(waited)
+            return waited
+
+        waited = int(wait_us) / 1_000_000
+        if waited > 0:
+            logger.debug(f"Rate limit reached. Waiting {waited:.3f}s")
+            await asyncio.sleep(waited)
+
+        self.stats.record(waited)
+        return waited
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful request."""
+        self.rate = min(self.rate + self.increase_step, self.max_rate)
+
+    def on_throttled(self) -> None:
+        """Multiplicatively decrease the rate after Codeforces throttled a request."""
+        previous = self.rate
+        self.rate = max(self.rate * self.decrease_factor, self.min_rate)
+        self.stats.throttled += 1
+        logger.warning(f"Codeforces call limit hit, rate {previous:.2f} -> {self.rate:.2f} req/s")
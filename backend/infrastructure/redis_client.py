@@ -1,27 +1,57 @@
-"""Redis client utilities for direct Redis access."""
+"""Process-wide pooled Redis client."""
 
-from redis.asyncio import Redis
+import logging
+
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from backend.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Process-wide client shared by DI providers, stores, the task queue and the worker
+_redis_client: Redis | None = None
+
 
-async def create_redis_client() -> Redis:
+def create_redis_client() -> Redis:
     """
-    Create a Redis client instance.
+    Create a Redis client backed by a bounded connection pool.
+
+    Commands wait up to ``settings.redis_pool_timeout`` seconds for a free
+    connection instead of opening more than ``settings.redis_max_connections``.
 
     Returns:
         Redis: Async Redis client
     """
-    return Redis.from_url(settings.redis_url, decode_responses=False)
+    pool = BlockingConnectionPool.from_url(
+        settings.redis_url,
+        decode_responses=False,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+    )
+    return Redis(connection_pool=pool)
 
 
-async def get_redis_client() -> Redis:
+def get_redis_client() -> Redis:
     """
-    Get Redis client for dependency injection.
-
-    This is a convenience function for DI in route handlers.
+    Get the process-wide Redis client, creating it on first use.
 
     Returns:
-        Redis: Async Redis client instance
+        Redis: Shared async Redis client
     """
-    return await create_redis_client()
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = create_redis_client()
+    return _redis_client
+
+
+async def close_redis_client() -> None:
+    """Close the process-wide Redis client and disconnect its pool."""
+    global _redis_client
+
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        await _redis_client.connection_pool.disconnect()
+        _redis_client = None
+        logger.info("Redis connection pool closed")
@@ -0,0 +1,107 @@
+"""Process-local cache of serialized metric responses, keyed by data version."""
+
+import json
+import time
+from typing import Any, Mapping, Optional, Tuple
+
+from backend.config import settings
+from backend.infrastructure.data_updates import on_data_update
+from backend.infrastructure.handles import canonical_handle
+from backend.infrastructure.lru_cache import SizedLRUCache
+
+# (endpoint, canonical handle, encoded query parameters, data version)
+ResponseKey = Tuple[str, str, str, int]
+
+
+def encode_params(params: Mapping[str, Any]) -> str:
+    """Canonical string form of the query parameters of a response."""
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def response_key(
+    endpoint: str, handle: str, params: Mapping[str, Any], version: int
+) -> ResponseKey:
+    """
+    Cache key of a response.
+
+    Args:
+        endpoint: Endpoint name, e.g. "tag-ratings"
+        handle: Codeforces handle (case-insensitive)
+        params: Query parameters and other inputs that change the response body
+        version: Data version of the submissions the response is computed from
+
+    Returns:
+        Hashable cache key
+    """
+    return endpoint, canonical_handle(handle), encode_params(params), version
+
+
+class ResponseCache:
+    """
+    Serialized response bodies of one API process.
+
+    A new data version of a handle makes its entries unreachable (and the
+    data update listener drops them). Bodies are kept at most ``ttl``
+    seconds, because periods like "month" are relative to the current time;
+    callers pass a shorter TTL for bodies of short periods.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float, clock=time.monotonic):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Maximum total size of cached bodies (0 disables the cache)
+            ttl: Maximum seconds a body is served
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl = ttl
+        self._clock = clock
+        # Body and the clock time it expires at
+        self._bodies: SizedLRUCache[ResponseKey, Tuple[bytes, float]] = SizedLRUCache(max_bytes)
+
+    def get(self, key: ResponseKey) -> Optional[bytes]:
+        """
+        Look up a response body.
+
+        Args:
+            key: Key from ``response_key``
+
+        Returns:
+            Serialized body, or None if not cached or expired
+        """
+        entry = self._bodies.get(key)
+        if entry is None:
+            return None
+        body, expires_at = entry
+        if self._clock() >= expires_at:
+            self._bodies.remove(key)
+            return None
+        return body
+
+    def put(self, key: ResponseKey, body: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Cache a response body.
+
+        Args:
+            key: Key from ``response_key``
+            body: Serialized body
+            ttl: Seconds the body may be served (capped at the cache's ``ttl``;
+                nothing is cached if not positive)
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        self._bodies.put(key, (body, self._clock() + ttl), size=len(body))
+
+    def evict_handle(self, handle: str) -> None:
+        """Drop all responses computed for a handle."""
+        handle = canonical_handle(handle)
+        self._bodies.discard(lambda key: key[1] == handle)
+
+
+# Process-wide, shared by all metric controllers
+response_cache = ResponseCache(
+    max_bytes=settings.response_cache_size, ttl=settings.response_cache_ttl
+)
+on_data_update(response_cache.evict_handle)
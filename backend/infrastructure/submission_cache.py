@@ -0,0 +1,506 @@
+"""Redis cache of parsed Codeforces submissions."""
+
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from redis.asyncio import Redis
+
+from backend.config import settings
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+from backend.infrastructure.cache_policy import CacheTtl
+from backend.infrastructure.compression import (
+    StreamCompressor,
+    compress_value,
+    decompress_value,
+)
+from backend.infrastructure.data_updates import (
+    data_updates_channel,
+    on_data_update,
+    update_message,
+)
+from backend.infrastructure.handles import canonical_handle
+from backend.infrastructure.lru_cache import SizedLRUCache
+from backend.infrastructure.popularity import record_access
+from backend.infrastructure.problem_catalog import (
+    ProblemCatalog,
+    add_problems,
+    placeholder_problem,
+)
+from backend.infrastructure.submission_codec import (
+    MAGIC,
+    SubmissionSummary,
+    decode_columns,
+    decode_summary,
+    encode_block,
+    encode_submissions,
+    is_columnar,
+)
+
+
+def submissions_key(handle: str) -> str:
+    """Redis key holding the cached submissions of a handle."""
+    return f"submissions:{canonical_handle(handle)}"
+
+
+def full_sync_key(handle: str) -> str:
+    """Redis key marking that a full user.status refetch happened recently."""
+    return f"submissions_full_sync:{canonical_handle(handle)}"
+
+
+def meta_key(handle: str) -> str:
+    """Redis key holding when a handle's submissions were fetched and how long they stay fresh."""
+    return f"submissions_meta:{canonical_handle(handle)}"
+
+
+@dataclass(frozen=True)
+class CacheAge:
+    """Age of a handle's cached submissions relative to their fresh TTL."""
+
+    age: int  # Seconds since the data was fetched
+    fresh_ttl: int  # Seconds the data counts as fresh
+    covers_from: Optional[int] = None  # Set while only recent history is cached (Unix time)
+
+    @property
+    def partial(self) -> bool:
+        """Check whether only the most recent part of the history is cached."""
+        return self.covers_from is not None
+
+    def covers(self, start_date: datetime | None) -> bool:
+        """
+        Check whether the cached data is complete from ``start_date`` on.
+
+        Args:
+            start_date: Start of the requested period (None for all time)
+
+        Returns:
+            True if no submission made since ``start_date`` is missing
+        """
+        if self.covers_from is None:
+            return True
+        return start_date is not None and start_date.timestamp() >= self.covers_from
+
+    @property
+    def is_stale(self) -> bool:
+        """Check whether the data is past its fresh TTL."""
+        return self.age > self.fresh_ttl
+
+    @property
+    def fresh_for(self) -> int:
+        """Seconds left until the data turns stale (0 if already stale)."""
+        return max(self.fresh_ttl - self.age, 0)
+
+
+def new_data_version() -> int:
+    """
+    Version identifying one write of a handle's submissions.
+
+    Nanosecond timestamps never repeat for a handle in practice, also across
+    workers and after the cached entry expired and was fetched again.
+    """
+    return time.time_ns()
+
+
+async def save_cache_meta(
+    redis: Redis,
+    handle: str,
+    ttl: CacheTtl,
+    fetched_at: Optional[int] = None,
+    covers_from: Optional[int] = None,
+    payload: Optional[bytes] = None,
+    version: Optional[int] = None,
+) -> None:
+    """
+    Record fetch time and fresh TTL of a handle's cached submissions.
+
+    Also sets the expiry of the cached submissions, so both keys live equally long.
+    With ``payload``, the submissions themselves are written in the same
+    transaction, so readers never see new data with old metadata. Whenever
+    the data version changes, API processes are notified (see
+    ``data_updates``) in the same transaction.
+
+    Args:
+        redis: Redis client instance
+        handle: Codeforces handle
+        ttl: Cache lifetimes computed for the handle
+        fetched_at: Unix time of the fetch (defaults to now)
+        covers_from: For a partial history, the creation time of its oldest
+            submission; None once the full history is cached
+        payload: Encoded submissions to cache (optional)
+        version: Data version of submissions cached by the caller; a new one
+            is assigned with ``payload``, and the current one is kept if neither
+            is given (the data did not change)
+    """
+    fetched_at = int(time.time()) if fetched_at is None else fetched_at
+    if payload is not None and version is None:
+        version = new_data_version()
+    fields = {"fetched_at": fetched_at, "fresh_ttl": ttl.fresh}
+    if version is not None:
+        fields["version"] = version
+
+    async with redis.pipeline(transaction=True) as pipe:
+        if payload is not None:
+            pipe.set(submissions_key(handle), payload, ex=ttl.expire)
+        pipe.hset(meta_key(handle), mapping=fields)
+        if covers_from is None:
+            pipe.hdel(meta_key(handle), "covers_from")
+        else:
+            pipe.hset(meta_key(handle), "covers_from", covers_from)
+        pipe.expire(meta_key(handle), ttl.expire)
+        pipe.expire(submissions_key(handle), ttl.expire)
+        if version is not None:
+            pipe.publish(data_updates_channel(), update_message(handle))
+        await pipe.execute()
+
+
+def parse_cache_meta(
+    fetched_at: Optional[bytes], fresh_ttl: Optional[bytes], covers_from: Optional[bytes] = None
+) -> Optional[CacheAge]:
+    """
+    Build the cache age from raw ``submissions_meta`` hash fields.
+
+    Args:
+        fetched_at: Raw "fetched_at" field
+        fresh_ttl: Raw "fresh_ttl" field
+        covers_from: Raw "covers_from" field (partial histories only)
+
+    Returns:
+        Cache age, or None if the metadata is missing
+    """
+    if fetched_at is None or fresh_ttl is None:
+        return None
+    return CacheAge(
+        age=max(int(time.time()) - int(fetched_at), 0),
+        fresh_ttl=int(fresh_ttl),
+        covers_from=int(covers_from) if covers_from is not None else None,
+    )
+
+
+def _legacy_cache_age(ttl: int) -> Optional[CacheAge]:
+    """
+    Derive the cache age from the remaining TTL of an entry without metadata.
+
+    Entries written before cadence metadata existed used the fixed
+    ``settings.cache_stale_ttl`` and ``settings.cache_fresh_ttl``.
+    """
+    if ttl < 0:  # Key missing or without TTL
+        return None
+    return CacheAge(age=max(settings.cache_stale_ttl - ttl, 0), fresh_ttl=settings.cache_fresh_ttl)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A handle's cached submissions with their metadata."""
+
+    payload: Optional[bytes]  # Encoded submissions (None if read without payload)
+    cache_age: CacheAge
+    version: Optional[int] = None  # Data version (None for entries written before versions)
+
+
+async def read_cache_entry(
+    redis: Redis, handle: str, with_payload: bool = True, count_access: bool = False
+) -> Optional[CacheEntry]:
+    """
+    Read a handle's cached submissions and metadata in one atomic round trip.
+
+    Args:
+        redis: Redis client instance
+        handle: Codeforces handle
+        with_payload: Also return the encoded submissions (else only check
+            that they exist)
+        count_access: Also count the request towards the handle's popularity
+            (see ``record_access``) in the same round trip
+
+    Returns:
+        Cache entry, or None if nothing is cached
+    """
+    key = submissions_key(handle)
+    async with redis.pipeline(transaction=True) as pipe:
+        if with_payload:
+            pipe.get(key)
+        else:
+            pipe.exists(key)
+        pipe.hmget(meta_key(handle), "fetched_at", "fresh_ttl", "covers_from", "version")
+        pipe.ttl(key)
+        if count_access:
+            record_access(pipe, handle)
+        results = await pipe.execute()
+    payload, (fetched_at, fresh_ttl, covers_from, version), ttl = results[:3]
+
+    if not payload:
+        return None
+    cache_age = parse_cache_meta(fetched_at, fresh_ttl, covers_from) or _legacy_cache_age(ttl)
+    if cache_age is None:
+        return None
+    return CacheEntry(
+        payload=payload if with_payload else None,
+        cache_age=cache_age,
+        version=int(version) if version is not None else None,
+    )
+
+
+def serialize_submissions(submissions: Iterable[Submission]) -> bytes:
+    """
+    Encode submissions for caching in the columnar format (see ``submission_codec``).
+
+    Problems are stored as references into the shared problem catalog (see
+    ``add_problems``), not inline. Large payloads are compressed.
+
+    Args:
+        submissions: Submissions to encode
+
+    Returns:
+        Encoded payload
+    """
+    return compress_value(encode_submissions(list(submissions)))
+
+
+async def store_submissions_stream(
+    redis: Redis,
+    handle: str,
+    submissions: AsyncIterator[Submission],
+    ttl: int,
+    chunk_size: int,
+) -> int:
+    """
+    Cache submissions from an async stream without materializing the list.
+
+    Submissions are encoded ``chunk_size`` at a time, one columnar block per
+    chunk, and appended to a temporary key, which atomically replaces the
+    cached value once the stream is exhausted. If the stream raises, the
+    previous cache entry is untouched. The temporary key expires
+    ``settings.worker_stream_write_ttl`` seconds after the last chunk, so a
+    killed worker leaves no long-lived partial history; ``ttl`` is applied
+    only when it replaces the cached value. Their problems are added to the
+    problem catalog chunk by chunk. Unless compression is disabled, the
+    blocks are compressed as one stream.
+
+    Args:
+        redis: Redis client instance
+        handle: Codeforces handle
+        submissions: Async iterator of submissions, newest first
+        ttl: Expiry of the cached value in seconds
+        chunk_size: Number of submissions encoded per Redis write
+
+    Returns:
+        Number of cached submissions
+    """
+    key = submissions_key(handle)
+    tmp_key = f"{key}:writing:{uuid.uuid4().hex}"
+    count = 0
+    chunk: List[Submission] = []
+    compressor = StreamCompressor.create()
+
+    write_ttl = settings.worker_stream_write_ttl
+
+    async def append(data: bytes) -> None:
+        # Keep the temporary key alive only while the stream makes progress
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.append(tmp_key, data)
+            pipe.expire(tmp_key, write_ttl)
+            await pipe.execute()
+
+    async def flush() -> None:
+        nonlocal count
+        await add_problems(redis, (s.problem for s in chunk))
+        block = encode_block(chunk)
+        await append(compressor.compress(block) if compressor else block)
+        count += len(chunk)
+        chunk.clear()
+
+    await redis.set(tmp_key, compressor.start(MAGIC) if compressor else MAGIC, ex=write_ttl)
+
+    try:
+        async for submission in submissions:
+            chunk.append(submission)
+            if len(chunk) >= chunk_size:
+                await flush()
+
+        if chunk:
+            await flush()
+        if compressor:
+            await append(compressor.flush())
+    except BaseException:
+        await redis.delete(tmp_key)
+        raise
+
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.rename(tmp_key, key)
+        pipe.expire(key, ttl)
+        await pipe.execute()
+
+    return count
+
+
+def _build_submissions(
+    records: List[Dict[str, Any]], problems: Mapping[str, Problem]
+) -> List[Submission]:
+    """Build submissions from cache records, resolving problem references via ``problems``."""
+    submissions = []
+    for s in records:
+        problem = s.pop("problem")
+        if isinstance(problem, dict):  # Entries cached before the problem catalog
+            problem = Problem(**problem)
+        else:
+            problem = problems.get(problem) or placeholder_problem(problem)
+        s["verdict"] = SubmissionStatus(s["verdict"])
+        submissions.append(Submission(problem=problem, **s))
+    return submissions
+
+
+def deserialize_submissions(
+    raw: bytes | str, problems: Optional[Mapping[str, Problem]] = None
+) -> List[Submission]:
+    """
+    Decode a cached payload back into Submission objects.
+
+    Accepts both the columnar format and JSON arrays written by earlier
+    versions, which stay readable until they expire, compressed or not.
+
+    Without ``problems``, referenced problems only carry their contest id and
+    index, which is enough to merge and re-encode a history.
+
+    Args:
+        raw: Cached payload
+        problems: Catalog problems by reference (optional)
+
+    Returns:
+        List of submissions
+
+    Raises:
+        ValueError: If a columnar payload has an unsupported format version
+    """
+    raw = decompress_value(raw)
+    if is_columnar(raw):
+        return decode_columns(raw).to_submissions(problems or {})
+    return _build_submissions(json.loads(raw), problems or {})
+
+
+def summarize_submissions(raw: bytes | str) -> SubmissionSummary:
+    """
+    Summarize a cached payload (count, newest submission, creation times).
+
+    Columnar payloads are summarized from their id, time and verdict columns
+    alone, which is much cheaper than ``deserialize_submissions``.
+
+    Args:
+        raw: Cached payload
+
+    Returns:
+        Summary of the cached history
+
+    Raises:
+        ValueError: If a columnar payload has an unsupported format version
+    """
+    raw = decompress_value(raw)
+    if is_columnar(raw):
+        return decode_summary(raw)
+
+    submissions = _build_submissions(json.loads(raw), {})
+    newest = max(submissions, key=lambda s: s.id, default=None)
+    return SubmissionSummary(
+        count=len(submissions),
+        newest_id=newest.id if newest else None,
+        newest_verdict=newest.verdict if newest else None,
+        creation_times=[s.creation_time_seconds for s in submissions],
+    )
+
+
+# Process-wide so that all requests share the problems looked up so far
+_problem_catalog = ProblemCatalog(ttl=settings.problem_catalog_local_ttl)
+
+
+async def load_submissions(redis: Redis, raw: bytes | str) -> List[Submission]:
+    """
+    Decode cached submissions with full problem details from the problem catalog.
+
+    Args:
+        redis: Redis client instance
+        raw: Cached payload (columnar or legacy JSON)
+
+    Returns:
+        List of submissions
+    """
+    raw = decompress_value(raw)
+    if is_columnar(raw):
+        columns = decode_columns(raw)
+        problems = await _problem_catalog.resolve(redis, columns.refs) if columns.refs else {}
+        return columns.to_submissions(problems)
+
+    records = json.loads(raw)
+    refs = {s["problem"] for s in records if isinstance(s["problem"], str)}
+    problems = await _problem_catalog.resolve(redis, refs) if refs else {}
+    return _build_submissions(records, problems)
+
+
+# Decoded submissions by (canonical handle, data version), per API process
+_decoded_submissions: SizedLRUCache[Tuple[str, int], List[Submission]] = SizedLRUCache(
+    max_size=settings.submissions_local_cache_size
+)
+
+
+def evict_local_submissions(handle: str) -> None:
+    """Drop a handle's decoded submissions from the process-local cache."""
+    handle = canonical_handle(handle)
+    _decoded_submissions.discard(lambda key: key[0] == handle)
+
+
+on_data_update(evict_local_submissions)
+
+
+async def load_cached_submissions(
+    redis: Redis, handle: str, entry: CacheEntry
+) -> Optional[List[Submission]]:
+    """
+    Decoded submissions of a cache entry read without its payload.
+
+    Submission sets are kept decoded per process, keyed by handle and data
+    version, so concurrent chart requests for one handle download and decode
+    its blob once. The returned list is shared and must not be modified.
+
+    Args:
+        redis: Redis client instance
+        handle: Codeforces handle
+        entry: Cache entry from ``read_cache_entry(..., with_payload=False)``
+
+    Returns:
+        List of submissions, or None if the entry expired in the meantime
+    """
+    handle = canonical_handle(handle)
+    if entry.version is not None:
+        submissions = _decoded_submissions.get((handle, entry.version))
+        if submissions is not None:
+            return submissions
+
+    # Payload and version are read together: the worker may have written in between
+    entry = await read_cache_entry(redis, handle)
+    if entry is None:
+        return None
+    submissions = await load_submissions(redis, entry.payload)
+    if entry.version is not None:  # Unversioned entries cannot be told apart
+        _decoded_submissions.put((handle, entry.version), submissions, size=len(submissions))
+    return submissions
+
+
+def merge_submissions(
+    new_submissions: List[Submission], cached_submissions: List[Submission]
+) -> List[Submission]:
+    """
+    Merge freshly fetched submissions into a cached history.
+
+    Rows are keyed by submission id; fresh rows win over cached ones so that
+    verdicts that changed since the last fetch are picked up.
+
+    Args:
+        new_submissions: Recently fetched submissions
+        cached_submissions: Previously cached submissions
+
+    Returns:
+        Merged submissions ordered newest first, like user.status
+    """
+    merged = {s.id: s for s in cached_submissions}
+    merged.update((s.id, s) for s in new_submissions)
+    return sorted(merged.values(), key=lambda s: s.id, reverse=True)
@@ -0,0 +1,328 @@
+"""Versioned columnar binary encoding of cached submissions.
+
+A payload is ``MAGIC`` followed by one or more blocks, so that a history can
+be written chunk by chunk with ``APPEND``. Each block stores its rows as
+parallel little-endian arrays::
+
+    <IIIII>  row count, entry count and byte length of the problem table,
+             entry count and byte length of the language table
+    bytes    problem references ("contestId/index"), NUL-separated
+    bytes    programming languages, NUL-separated
+    <n q>    submission ids
+    <n i>    contest ids
+    <n q>    creation times
+    <n B>    verdict codes (index into ``VERDICTS``)
+    <n I>    problem table indices
+    <n H>    language table indices
+
+Version 1 payloads lack the entry counts; they are still decoded.
+"""
+
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+from backend.infrastructure.problem_catalog import placeholder_problem, problem_ref
+
+# "CFS" + format version; bump the version byte for incompatible layout changes
+MAGIC = b"CFS\x02"
+_MAGIC_V1 = b"CFS\x01"
+
+_BLOCK_HEADER = struct.Struct("<IIIII")
+_BLOCK_HEADER_V1 = struct.Struct("<III")
+_SEPARATOR = "\0"
+
+# Verdict codes are part of the format: append new verdicts, never reorder
+VERDICTS = (
+    SubmissionStatus.OK,
+    SubmissionStatus.WRONG_ANSWER,
+    SubmissionStatus.TIME_LIMIT_EXCEEDED,
+    SubmissionStatus.MEMORY_LIMIT_EXCEEDED,
+    SubmissionStatus.RUNTIME_ERROR,
+    SubmissionStatus.COMPILATION_ERROR,
+    SubmissionStatus.IDLENESS_LIMIT_EXCEEDED,
+)
+_VERDICT_CODES = {verdict: code for code, verdict in enumerate(VERDICTS)}
+
+
+def is_columnar(raw: bytes | str) -> bool:
+    """Check whether a cached payload uses the columnar format (else it is JSON)."""
+    return isinstance(raw, bytes) and raw[:3] == MAGIC[:3]
+
+
+def _table(values: Dict[str, int]) -> bytes:
+    """Encode a string table (values in index order)."""
+    return _SEPARATOR.join(values).encode()
+
+
+def encode_block(submissions: Sequence[Submission]) -> bytes:
+    """
+    Encode submissions as one columnar block.
+
+    Args:
+        submissions: Submissions to encode (at least one)
+
+    Returns:
+        Encoded block, to be appended after ``MAGIC``
+    """
+    n = len(submissions)
+    refs: Dict[str, int] = {}
+    languages: Dict[str, int] = {}
+    problem_indices = [refs.setdefault(problem_ref(s.problem), len(refs)) for s in submissions]
+    language_indices = [
+        languages.setdefault(s.programming_language, len(languages)) for s in submissions
+    ]
+    ref_table = _table(refs)
+    language_table = _table(languages)
+
+    return b"".join(
+        (
+            _BLOCK_HEADER.pack(
+                n, len(refs), len(ref_table), len(languages), len(language_table)
+            ),
+            ref_table,
+            language_table,
+            struct.pack(f"<{n}q", *(s.id for s in submissions)),
+            struct.pack(f"<{n}i", *(s.contest_id for s in submissions)),
+            struct.pack(f"<{n}q", *(s.creation_time_seconds for s in submissions)),
+            struct.pack(f"<{n}B", *(_VERDICT_CODES[s.verdict] for s in submissions)),
+            struct.pack(f"<{n}I", *problem_indices),
+            struct.pack(f"<{n}H", *language_indices),
+        )
+    )
+
+
+def encode_submissions(submissions: Sequence[Submission]) -> bytes:
+    """
+    Encode submissions as a complete columnar payload.
+
+    Args:
+        submissions: Submissions to encode
+
+    Returns:
+        Encoded payload
+    """
+    return MAGIC + encode_block(submissions) if submissions else MAGIC
+
+
+@dataclass
+class SubmissionColumns:
+    """Decoded columns of a payload; string tables are merged across blocks."""
+
+    ids: List[int] = field(default_factory=list)
+    contest_ids: List[int] = field(default_factory=list)
+    creation_times: List[int] = field(default_factory=list)
+    verdicts: List[int] = field(default_factory=list)
+    problems: List[int] = field(default_factory=list)
+    languages: List[int] = field(default_factory=list)
+    refs: List[str] = field(default_factory=list)
+    language_names: List[str] = field(default_factory=list)
+
+    def to_submissions(self, problems: Mapping[str, Problem]) -> List[Submission]:
+        """
+        Build submission objects.
+
+        Args:
+            problems: Catalog problems by reference; missing ones become placeholders
+
+        Returns:
+            Submissions in payload order
+        """
+        resolved = [problems.get(ref) or placeholder_problem(ref) for ref in self.refs]
+        return [
+            Submission(
+                id=submission_id,
+                contest_id=contest_id,
+                creation_time_seconds=created,
+                problem=resolved[problem],
+                verdict=VERDICTS[verdict],
+                programming_language=self.language_names[language],
+            )
+            for submission_id, contest_id, created, verdict, problem, language in zip(
+                self.ids,
+                self.contest_ids,
+                self.creation_times,
+                self.verdicts,
+                self.problems,
+                self.languages,
+            )
+        ]
+
+
+def _merge_table(
+    raw: bytes, count: int, table: List[str], index: Dict[str, int]
+) -> List[int]:
+    """
+    Add a block's string table to a merged table.
+
+    A table of one empty string encodes to no bytes, just like an empty
+    table, so the entry count decides which one it is.
+
+    Returns:
+        Block index → merged index
+
+    Raises:
+        ValueError: If the table does not hold ``count`` entries
+    """
+    values = raw.decode().split(_SEPARATOR) if count else []
+    if len(values) != count:
+        raise ValueError(f"Corrupt string table: {len(values)} entries, expected {count}")
+    remap = []
+    for value in values:
+        if value not in index:
+            index[value] = len(table)
+            table.append(value)
+        remap.append(index[value])
+    return remap
+
+
+def _read_block_header(raw: bytes, offset: int, version: bytes) -> Tuple[int, ...]:
+    """
+    Read a block header.
+
+    Returns:
+        Row count, problem table entry count and byte length, language table
+        entry count and byte length, offset of the problem table
+    """
+    if version == MAGIC:
+        header = _BLOCK_HEADER.unpack_from(raw, offset)
+        return (*header, offset + _BLOCK_HEADER.size)
+
+    # Version 1 blocks have at least one row, so each table has at least one entry
+    n, ref_len, language_len = _BLOCK_HEADER_V1.unpack_from(raw, offset)
+    offset += _BLOCK_HEADER_V1.size
+    ref_count = raw.count(b"\0", offset, offset + ref_len) + 1 if n else 0
+    language_start = offset + ref_len
+    language_count = (
+        raw.count(b"\0", language_start, language_start + language_len) + 1 if n else 0
+    )
+    return n, ref_count, ref_len, language_count, language_len, offset
+
+
+def _format_version(raw: bytes) -> bytes:
+    """
+    Check the format version of a payload.
+
+    Raises:
+        ValueError: If the payload has an unknown format version
+    """
+    version = raw[: len(MAGIC)]
+    if version not in (MAGIC, _MAGIC_V1):
+        raise ValueError(f"Unsupported submission cache format: {version!r}")
+    return version
+
+
+def decode_columns(raw: bytes) -> SubmissionColumns:
+    """
+    Decode a columnar payload.
+
+    Args:
+        raw: Payload starting with ``MAGIC``
+
+    Returns:
+        Decoded columns
+
+    Raises:
+        ValueError: If the payload has an unknown format version or is truncated
+    """
+    version = _format_version(raw)
+
+    columns = SubmissionColumns()
+    ref_index: Dict[str, int] = {}
+    language_index: Dict[str, int] = {}
+    offset = len(MAGIC)
+
+    try:
+        while offset < len(raw):
+            n, ref_count, ref_len, language_count, language_len, offset = _read_block_header(
+                raw, offset, version
+            )
+            ref_map = _merge_table(
+                raw[offset : offset + ref_len], ref_count, columns.refs, ref_index
+            )
+            offset += ref_len
+            language_map = _merge_table(
+                raw[offset : offset + language_len],
+                language_count,
+                columns.language_names,
+                language_index,
+            )
+            offset += language_len
+
+            for target, code, size in (
+                (columns.ids, "q", 8),
+                (columns.contest_ids, "i", 4),
+                (columns.creation_times, "q", 8),
+                (columns.verdicts, "B", 1),
+            ):
+                target.extend(struct.unpack_from(f"<{n}{code}", raw, offset))
+                offset += n * size
+
+            problems = struct.unpack_from(f"<{n}I", raw, offset)
+            offset += n * 4
+            columns.problems.extend(ref_map[i] for i in problems)
+            languages = struct.unpack_from(f"<{n}H", raw, offset)
+            offset += n * 2
+            columns.languages.extend(language_map[i] for i in languages)
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Truncated submission cache payload: {e}") from e
+
+    return columns
+
+
+@dataclass
+class SubmissionSummary:
+    """What a freshness check needs to know about a cached history."""
+
+    count: int = 0
+    newest_id: Optional[int] = None
+    newest_verdict: Optional[SubmissionStatus] = None
+    creation_times: List[int] = field(default_factory=list)
+
+
+def decode_summary(raw: bytes) -> SubmissionSummary:
+    """
+    Summarize a columnar payload without building submissions.
+
+    Only the id, creation time and verdict columns are unpacked; string
+    tables and the other columns are skipped.
+
+    Args:
+        raw: Payload starting with ``MAGIC``
+
+    Returns:
+        Row count, newest submission and creation times
+
+    Raises:
+        ValueError: If the payload has an unknown format version or is truncated
+    """
+    version = _format_version(raw)
+
+    summary = SubmissionSummary()
+    offset = len(MAGIC)
+
+    try:
+        while offset < len(raw):
+            n, _, ref_len, _, language_len, offset = _read_block_header(raw, offset, version)
+            offset += ref_len + language_len
+            ids = struct.unpack_from(f"<{n}q", raw, offset)
+            offset += n * (8 + 4)  # Ids, contest ids
+            creation_times = struct.unpack_from(f"<{n}q", raw, offset)
+            offset += n * 8
+            verdicts = struct.unpack_from(f"<{n}B", raw, offset)
+            offset += n * (1 + 4 + 2)  # Verdicts, problem and language indices
+            if offset > len(raw):
+                raise ValueError(f"Truncated submission cache payload: block ends at {offset}")
+
+            summary.count += n
+            summary.creation_times.extend(creation_times)
+            if n:
+                newest = max(range(n), key=ids.__getitem__)
+                if summary.newest_id is None or ids[newest] > summary.newest_id:
+                    summary.newest_id = ids[newest]
+                    summary.newest_verdict = VERDICTS[verdicts[newest]]
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Truncated submission cache payload: {e}") from e
+
+    return summary
@@ -1,11 +1,91 @@
 """Task queue service for asynchronous job processing."""
 
 import json
+import logging
+import os
+import random
+import socket
 import time
 import uuid
-from typing import Optional
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional
 
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from backend.config import settings
+from backend.infrastructure.handles import canonical_handle
+
+logger = logging.getLogger(__name__)
+
+# Move due retries from the sorted set to their lane in one step, so that
+# several workers running the scheduler never enqueue the same task twice.
+_PROMOTE_RETRIES_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, task in ipairs(due) do
+    redis.call('ZREM', KEYS[1], task)
+    local lane = KEYS[2]
+    local ok, data = pcall(cjson.decode, task)
+    if ok and type(data) == 'table' and data['priority'] == 'background' then
+        lane = KEYS[3]
+    end
+    if ARGV[3] == 'stream' then
+        redis.call('XADD', lane, '*', 'task', task)
+    else
+        redis.call('RPUSH', lane, task)
+    end
+end
+return #due
+"""
+
+
+def pending_task_key(handle: str) -> str:
+    """Redis key holding the id of the task currently fetching a handle."""
+    return f"pending_task:{canonical_handle(handle)}"
+
+
+def _decode(value: bytes | str) -> str:
+    """Decode a Redis reply value to str."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class TaskPriority(str, Enum):
+    """Queue lane of a task."""
+
+    INTERACTIVE = "interactive"  # A user is waiting for the result
+    BACKGROUND = "background"  # Refresh of data that is already served (stale-while-revalidate)
+
+
+@dataclass
+class QueuedTask:
+    """A task taken off the queue."""
+
+    data: dict
+    key: str  # Lane (list or stream key) the task was taken from
+    message_id: Optional[str] = None  # Stream entry id ('stream' backend only)
+
+
+def retry_backoff(attempt: int) -> float:
+    """
+    Delay before retrying a task that failed ``attempt`` times.
+
+    Exponential backoff capped at ``settings.worker_retry_max_delay`` with
+    "equal jitter": the delay is drawn from the upper half of the backoff
+    window, so retries of tasks that failed together spread out while still
+    growing with every attempt.
+
+    Args:
+        attempt: Number of failed attempts so far (1 for the first retry)
+
+    Returns:
+        Delay in seconds
+    """
+    window = min(
+        settings.worker_retry_base_delay * 2 ** max(attempt - 1, 0),
+        settings.worker_retry_max_delay,
+    )
+    return random.uniform(window / 2, window)
 
 
 class TaskQueue:
@@ -14,19 +94,101 @@ class TaskQueue:
 
     Provides atomic deduplication using SETNX to prevent duplicate tasks
     for the same handle, with support for task status tracking.
+
+    Two backends are available (``settings.task_queue_backend``):
+
+    - ``list``: a Redis list consumed with BLPOP. A task popped by a worker
+      that crashes is lost.
+    - ``stream``: a Redis stream read through a consumer group. Tasks stay
+      pending until acknowledged; entries idle for longer than
+      ``settings.worker_stream_claim_idle`` (their worker died) are claimed by
+      another worker with XAUTOCLAIM.
+
+    Tasks go to one of two lanes by ``TaskPriority``. Workers take interactive
+    tasks first, except that a ``settings.worker_background_share`` of reads
+    prefers the background lane, so refreshes are not starved under load.
     """
 
-    def __init__(self, redis: Redis):
+    def __init__(self, redis: Redis, backend: Optional[str] = None, consumer: Optional[str] = None):
         """
         Initialize task queue.
 
         Args:
             redis: Async Redis client instance
+            backend: "list" or "stream" (defaults to ``settings.task_queue_backend``)
+            consumer: Consumer name in the stream group (defaults to hostname-pid)
         """
         self.redis = redis
-        self.queue_key = "fetch_queue"
+        self.backend = backend or settings.task_queue_backend
+        self.queue_key = (
+            settings.worker_stream_key if self.backend == "stream" else settings.worker_queue_key
+        )
+        self.lanes: Dict[TaskPriority, str] = {
+            TaskPriority.INTERACTIVE: self.queue_key,
+            TaskPriority.BACKGROUND: f"{self.queue_key}:background",
+        }
+        self.retry_key = settings.worker_retry_key
+        self.group = settings.worker_stream_group
+        self.consumer = (
+            consumer or settings.worker_consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+        )
+        self._next_claim = 0.0
+        self._background_credit = 0.0
+        self._promote_retries = redis.register_script(_PROMOTE_RETRIES_SCRIPT)
 
-    async def enqueue(self, handle: str) -> str:
+    async def setup(self) -> None:
+        """Create the consumer groups if the stream backend is used (idempotent)."""
+        if self.backend != "stream":
+            return
+
+        for key in self.lanes.values():
+            try:
+                # Start from "0" so tasks enqueued before the group existed are delivered
+                await self.redis.xgroup_create(key, self.group, id="0", mkstream=True)
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    async def push(self, task_data: dict) -> None:
+        """
+        Append a task to the lane given by its ``priority`` field.
+
+        Args:
+            task_data: Task data
+        """
+        key = self.lanes[TaskPriority(task_data.get("priority", TaskPriority.INTERACTIVE))]
+        payload = json.dumps(task_data)
+        if self.backend == "stream":
+            await self.redis.xadd(key, {"task": payload})
+        else:
+            await self.redis.rpush(key, payload)  # type: ignore[misc]
+
+    async def _escalate(self, task_id: str, handle: str) -> None:
+        """
+        Make sure a pending task reaches the interactive lane.
+
+        If the handle's pending task was queued as a background refresh, a copy
+        is pushed to the interactive lane; whichever copy runs second is
+        skipped by the worker because the task is already finished.
+
+        Args:
+            task_id: UUID of the pending task
+            handle: Codeforces user handle
+        """
+        previous = await self.redis.set(
+            f"task:{task_id}:priority", TaskPriority.INTERACTIVE.value, ex=300, get=True
+        )
+        if previous is not None and previous.decode() == TaskPriority.BACKGROUND.value:
+            await self.push(
+                {
+                    "task_id": task_id,
+                    "handle": handle,
+                    "timestamp": time.time(),
+                    "priority": TaskPriority.INTERACTIVE.value,
+                }
+            )
+
+    async def enqueue(self, handle: str, priority: TaskPriority = TaskPriority.INTERACTIVE) -> str:
         """
         Enqueue task with atomic deduplication using SETNX.
 
@@ -35,21 +197,28 @@ class TaskQueue:
         conditions when multiple clients request the same handle simultaneously.
 
         Args:
-            handle: Codeforces user handle
+            handle: Codeforces user handle (any spelling; queued in canonical form)
+            priority: Queue lane; background refreshes of already served
+                data should not delay users waiting for a first fetch
 
         Returns:
             task_id: UUID of the task (new or existing)
 
         Flow:
-            1. Quick check for existing pending task
+            1. Quick check for existing pending task (escalated to the
+               interactive lane if needed)
             2. Generate new task_id
             3. Atomically try to claim handle using SETNX
             4. If successful, create task in queue
             5. If failed (race condition), return existing task_id
         """
+        handle = canonical_handle(handle)
+
         # Step 1: Quick check for existing pending task
-        existing_task_id = await self.redis.get(f"pending_task:{handle}")
+        existing_task_id = await self.redis.get(pending_task_key(handle))
         if existing_task_id:
+            if priority is TaskPriority.INTERACTIVE:
+                await self._escalate(existing_task_id.decode(), handle)
             return existing_task_id.decode()
 
         # Step 2: Generate new task_id
@@ -57,7 +226,7 @@ class TaskQueue:
 
         # Step 3: Atomically try to "claim" the handle (SETNX)
         was_set = await self.redis.set(
-            f"pending_task:{handle}",
+            pending_task_key(handle),
             task_id,
             ex=60,  # Expire after 60 seconds
             nx=True,  # Set only if Not eXists (atomic!)
@@ -66,14 +235,23 @@ class TaskQueue:
         # Step 4: Check if we won the race
         if not was_set:
             # Race condition: someone else created task between step 1 and 3
-            existing_task_id = await self.redis.get(f"pending_task:{handle}")
-            return existing_task_id.decode() if existing_task_id else task_id
+            existing_task_id = await self.redis.get(pending_task_key(handle))
+            if not existing_task_id:
+                return task_id
+            if priority is TaskPriority.INTERACTIVE:
+                await self._escalate(existing_task_id.decode(), handle)
+            return existing_task_id.decode()
 
         # Step 5: We successfully claimed handle - create the task
-        task_data = {"task_id": task_id, "handle": handle, "timestamp": time.time()}
+        task_data = {
+            "task_id": task_id,
+            "handle": handle,
+            "timestamp": time.time(),
+            "priority": priority.value,
+        }
 
         # Add to queue
-        await self.redis.rpush(self.queue_key, json.dumps(task_data))  # type: ignore[misc]
+        await self.push(task_data)
 
         # Set initial status
         await self.redis.setex(f"task:{task_id}:status", 300, "processing")
@@ -81,6 +259,9 @@ class TaskQueue:
         # Store handle for reverse lookup (task_id → handle)
         await self.redis.setex(f"task:{task_id}:handle", 300, handle)
 
+        # Remember the lane so interactive requests can escalate a background task
+        await self.redis.setex(f"task:{task_id}:priority", 300, priority.value)
+
         return task_id
 
     async def get_task_info(self, task_id: str) -> Optional[dict]:
@@ -129,3 +310,203 @@ class TaskQueue:
             return {"status": "failed", "error": error.decode() if error else "Unknown error"}
         else:
             return {"status": "processing"}
+
+    async def schedule_retry(self, task_data: dict, delay: float) -> None:
+        """
+        Put a task into the delayed-retry set.
+
+        The task keeps its "processing" status and the handle's pending lock is
+        extended past the retry, so polling clients keep waiting and new
+        requests for the handle join this task instead of enqueueing another.
+
+        Args:
+            task_data: Task data as popped from the queue
+            delay: Seconds until the task becomes due
+        """
+        task_id = task_data["task_id"]
+        handle = task_data["handle"]
+        hold = int(delay) + 1
+
+        await self.redis.zadd(self.retry_key, {json.dumps(task_data): time.time() + delay})
+        await self.redis.setex(f"task:{task_id}:status", hold + 300, "processing")
+        await self.redis.expire(f"task:{task_id}:handle", hold + 300)
+        await self.redis.expire(pending_task_key(handle), hold + settings.pending_task_ttl)
+
+    async def promote_due_retries(self, limit: int = 100) -> int:
+        """
+        Move retries whose delay has passed back onto the fetch queue.
+
+        Args:
+            limit: Maximum number of tasks moved per call
+
+        Returns:
+            Number of tasks moved
+        """
+        moved = await self._promote_retries(
+            keys=[
+                self.retry_key,
+                self.lanes[TaskPriority.INTERACTIVE],
+                self.lanes[TaskPriority.BACKGROUND],
+            ],
+            args=[time.time(), limit, self.backend],
+        )
+        return int(moved)
+
+    async def backlog(self) -> int:
+        """
+        Number of tasks waiting in all lanes (not yet taken by a worker).
+
+        Returns:
+            Queue length
+        """
+        waiting = 0
+        for key in self.lanes.values():
+            if self.backend == "stream":
+                length = await self.redis.xlen(key)
+                pending = await self.redis.xpending(key, self.group) if length else None
+                waiting += length - (pending["pending"] if pending else 0)
+            else:
+                waiting += await self.redis.llen(key)  # type: ignore[misc]
+        return waiting
+
+    def _lane_order(self) -> List[str]:
+        """
+        Lanes in the order the next read should try them.
+
+        Interactive first, except for every ``1 / worker_background_share``-th
+        read, which prefers the background lane.
+        """
+        self._background_credit += settings.worker_background_share
+        if self._background_credit >= 1:
+            self._background_credit -= 1
+            return [self.lanes[TaskPriority.BACKGROUND], self.lanes[TaskPriority.INTERACTIVE]]
+        return [self.lanes[TaskPriority.INTERACTIVE], self.lanes[TaskPriority.BACKGROUND]]
+
+    async def fetch(self, count: int = 1, timeout: int = 5) -> List[QueuedTask]:
+        """
+        Take up to ``count`` tasks off the queue, blocking until one arrives.
+
+        Args:
+            count: Maximum number of tasks to return
+            timeout: Seconds to block while the queue is empty
+
+        Returns:
+            Tasks taken (empty on timeout)
+        """
+        lanes = self._lane_order()
+        if self.backend == "stream":
+            return await self._fetch_stream(lanes, count, timeout)
+
+        result = await self.redis.blpop(lanes, timeout=timeout)  # type: ignore[misc]
+        if not result:
+            return []
+
+        popped = [(_decode(result[0]), result[1])]
+        for key in lanes:
+            remaining = count - len(popped)
+            if remaining <= 0:
+                break
+            payloads = await self.redis.lpop(key, remaining) or []  # type: ignore[misc]
+            popped.extend((key, payload) for payload in payloads)
+
+        tasks = []
+        for key, payload in popped:
+            try:
+                tasks.append(QueuedTask(json.loads(payload), key))
+            except json.JSONDecodeError:
+                logger.error(f"Dropping malformed task: {payload!r}")
+        return tasks
+
+    async def _fetch_stream(self, lanes: List[str], count: int, timeout: int) -> List[QueuedTask]:
+        """Read tasks for this consumer, reclaiming stuck entries of dead consumers first."""
+        tasks: List[QueuedTask] = []
+
+        if time.monotonic() >= self._next_claim:
+            self._next_claim = time.monotonic() + settings.worker_stream_claim_idle / 4
+            for key in lanes:
+                claimed = await self.redis.xautoclaim(
+                    key,
+                    self.group,
+                    self.consumer,
+                    min_idle_time=settings.worker_stream_claim_idle * 1000,
+                    start_id="0-0",
+                    count=count - len(tasks),
+                )
+                tasks.extend(await self._parse_entries(key, claimed[1]))
+                if len(tasks) >= count:
+                    break
+            if tasks:
+                logger.warning(f"Claimed {len(tasks)} stuck task(s) from other consumers")
+                return tasks
+
+        # Non-blocking reads in lane order
+        for key in lanes:
+            response = await self.redis.xreadgroup(
+                self.group, self.consumer, {key: ">"}, count=count - len(tasks)
+            )
+            if response:
+                tasks.extend(await self._parse_entries(key, response[0][1]))
+            if len(tasks) >= count:
+                break
+        if tasks:
+            return tasks
+
+        # Both lanes empty: block on both
+        response = await self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {key: ">" for key in lanes},
+            count=1,
+            block=timeout * 1000,
+        )
+        delivered = {_decode(key): entries for key, entries in response or []}
+        for key in lanes:
+            tasks.extend(await self._parse_entries(key, delivered.get(key, [])))
+
+        # Each lane may deliver an entry at once; hand back what does not fit
+        for extra in tasks[count:]:
+            await self.push(extra.data)
+            await self.ack(extra)
+        return tasks[:count]
+
+    async def _parse_entries(self, key: str, entries: Iterable[Any]) -> List[QueuedTask]:
+        """Decode stream entries, acknowledging ones that cannot be processed."""
+        tasks = []
+        for message_id, fields in entries:
+            message_id = _decode(message_id)
+            try:
+                tasks.append(QueuedTask(json.loads(fields[b"task"]), key, message_id))
+            except (TypeError, KeyError, json.JSONDecodeError):
+                logger.error(f"Dropping malformed stream entry {message_id}: {fields!r}")
+                await self.ack(QueuedTask({}, key, message_id))
+        return tasks
+
+    async def ack(self, task: QueuedTask) -> None:
+        """
+        Acknowledge a processed task so it is not delivered again.
+
+        Args:
+            task: Task returned by ``fetch``
+        """
+        if task.message_id is None:
+            return
+
+        await self.redis.xack(task.key, self.group, task.message_id)
+        await self.redis.xdel(task.key, task.message_id)
+
+    async def touch(self, tasks: Iterable[QueuedTask]) -> None:
+        """
+        Reset the idle time of tasks still being processed.
+
+        Keeps long-running tasks from being claimed by other workers.
+
+        Args:
+            tasks: Tasks in progress on this consumer
+        """
+        by_lane: Dict[str, List[str]] = {}
+        for task in tasks:
+            if task.message_id is not None:
+                by_lane.setdefault(task.key, []).append(task.message_id)
+
+        for key, message_ids in by_lane.items():
+            await self.redis.xclaim(key, self.group, self.consumer, 0, message_ids, justid=True)
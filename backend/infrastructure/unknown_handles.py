@@ -0,0 +1,174 @@
+"""Negative cache of handles that do not exist on Codeforces, fronted by a Bloom filter."""
+
+import hashlib
+import time
+from typing import List, Optional
+
+from redis.asyncio import Redis
+
+from backend.config import settings
+from backend.infrastructure.handles import canonical_handle
+
+
+def unknown_handle_key(handle: str) -> str:
+    """Redis key marking a handle as not found on Codeforces."""
+    return f"unknown_handle:{canonical_handle(handle)}"
+
+
+def bloom_generation(now: Optional[float] = None) -> int:
+    """
+    Generation of the Bloom filter bitmap handles are marked in.
+
+    Each generation spans ``settings.unknown_handle_ttl`` seconds and its
+    bitmap expires at the end of the next one, so a bit always outlives the
+    negative entry it was set with.
+
+    Args:
+        now: Unix time (defaults to the current time)
+
+    Returns:
+        Generation number
+    """
+    if now is None:
+        now = time.time()
+    return int(now // settings.unknown_handle_ttl)
+
+
+def bloom_key(generation: int) -> str:
+    """Redis key of the Bloom filter bitmap of one generation of unknown handles."""
+    return f"unknown_handles:bloom:{generation}"
+
+
+def bloom_offsets(handle: str, bits: int, hashes: int) -> List[int]:
+    """
+    Bit positions of a handle in the Bloom filter (double hashing).
+
+    Args:
+        handle: Codeforces handle (case-insensitive)
+        bits: Size of the filter in bits
+        hashes: Number of bit positions per handle
+
+    Returns:
+        ``hashes`` bit offsets in ``[0, bits)``
+    """
+    digest = hashlib.blake2b(canonical_handle(handle).encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+async def mark_unknown_handle(redis: Redis, handle: str) -> None:
+    """
+    Record that a handle does not exist.
+
+    The negative entry expires after ``settings.unknown_handle_ttl`` (the
+    handle may be registered later). Bloom filter bits cannot be removed, so
+    they are set in the current generation's bitmap, which expires as a
+    whole at the end of the following generation (see ``bloom_generation``).
+
+    Args:
+        redis: Redis client instance
+        handle: Codeforces handle
+    """
+    offsets = bloom_offsets(
+        handle, settings.unknown_handle_bloom_bits, settings.unknown_handle_bloom_hashes
+    )
+    generation = bloom_generation()
+    key = bloom_key(generation)
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.setex(unknown_handle_key(handle), settings.unknown_handle_ttl, 1)
+        for offset in offsets:
+            pipe.setbit(key, offset, 1)
+        pipe.expireat(key, (generation + 2) * settings.unknown_handle_ttl)
+        await pipe.execute()
+
+
+class UnknownHandleFilter:
+    """
+    In-process copy of the unknown-handle Bloom filter.
+
+    The bitmap is fetched from Redis at most every ``sync_interval`` seconds.
+    A negative answer from the filter needs no Redis round trip; only
+    possible matches are confirmed against the negative cache, so false
+    positives never reject a valid handle. Handles marked by other processes
+    become visible after the next sync.
+    """
+
+    def __init__(
+        self,
+        bits: int = 1 << 20,
+        hashes: int = 7,
+        sync_interval: float = 30.0,
+        clock=time.monotonic,
+    ):
+        """
+        Initialize filter.
+
+        Args:
+            bits: Size of the filter in bits (must match all other processes)
+            hashes: Number of bit positions per handle
+            sync_interval: Seconds between bitmap syncs from Redis
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.bits = bits
+        self.hashes = hashes
+        self.sync_interval = sync_interval
+        self._clock = clock
+        self._bitmap = bytearray()
+        self._synced_at: Optional[float] = None
+
+    async def sync(self, redis: Redis) -> None:
+        """Replace the local bitmap with the union of the two live generations in Redis."""
+        generation = bloom_generation()
+        current, previous = await redis.mget(bloom_key(generation), bloom_key(generation - 1))
+        bitmap = bytearray(current or b"")
+        for i, byte in enumerate((previous or b"")[: len(bitmap)]):
+            bitmap[i] |= byte
+        bitmap.extend((previous or b"")[len(bitmap) :])
+        self._bitmap = bitmap
+        self._synced_at = self._clock()
+
+    def might_contain(self, handle: str) -> bool:
+        """Check the local bitmap (false positives possible, no false negatives)."""
+        for offset in bloom_offsets(handle, self.bits, self.hashes):
+            byte = offset >> 3
+            # Redis numbers bits from the most significant bit of each byte
+            if byte >= len(self._bitmap) or not self._bitmap[byte] & (0x80 >> (offset & 7)):
+                return False
+        return True
+
+    def _add_local(self, handle: str) -> None:
+        """Set a handle's bits in the local bitmap."""
+        for offset in bloom_offsets(handle, self.bits, self.hashes):
+            byte = offset >> 3
+            if byte >= len(self._bitmap):
+                self._bitmap.extend(bytes(byte + 1 - len(self._bitmap)))
+            self._bitmap[byte] |= 0x80 >> (offset & 7)
+
+    async def contains(self, redis: Redis, handle: str) -> bool:
+        """
+        Check whether a handle is known not to exist.
+
+        Args:
+            redis: Redis client instance
+            handle: Codeforces handle
+
+        Returns:
+            True if the handle is in the negative cache
+        """
+        if self._synced_at is None or self._clock() - self._synced_at >= self.sync_interval:
+            await self.sync(redis)
+        if not self.might_contain(handle):
+            return False
+        return bool(await redis.exists(unknown_handle_key(handle)))
+
+    async def add(self, redis: Redis, handle: str) -> None:
+        """
+        Mark a handle as unknown in Redis and in the local bitmap.
+
+        Args:
+            redis: Redis client instance
+            handle: Codeforces handle
+        """
+        await mark_unknown_handle(redis, handle)
+        self._add_local(handle)
@@ -1,16 +1,83 @@
 """Codeforces data service for BetterForces."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from redis.asyncio import Redis
+
+from backend.config import settings
+from backend.infrastructure.circuit_breaker import CircuitBreaker
 from backend.infrastructure.codeforces_client import CodeforcesClient, UserNotFoundError
+from backend.infrastructure.contest_divisions import ContestDivisionCache
+from backend.infrastructure.handle_validator import HandleValidator, resolve_handle
+from backend.infrastructure.http_client import get_http_client
+from backend.infrastructure.rate_limiter import RedisRateLimiter
+from backend.infrastructure.unknown_handles import UnknownHandleFilter
 from backend.domain.models.codeforces import Submission
 
+# Process-wide breaker so that every request sees Codeforces outages detected by others
+_circuit_breaker = CircuitBreaker(
+    "Codeforces",
+    failure_threshold=settings.codeforces_breaker_failure_threshold,
+    recovery_timeout=settings.codeforces_breaker_recovery_timeout,
+)
+
+# Process-wide so that concurrent requests share user.info batches
+_handle_validator = HandleValidator(
+    window=settings.handle_validation_window,
+    batch_size=settings.handle_validation_batch_size,
+)
+
+# Process-wide copy of the unknown-handle Bloom filter, synced from Redis
+_unknown_handles = UnknownHandleFilter(
+    bits=settings.unknown_handle_bloom_bits,
+    hashes=settings.unknown_handle_bloom_hashes,
+    sync_interval=settings.unknown_handle_sync_interval,
+)
+
+# Process-wide copy of the contest divisions the worker keeps in Redis
+_contest_divisions = ContestDivisionCache(ttl=settings.contest_divisions_local_ttl)
+
+# Process-wide so that the adaptive rate learned from throttling replies carries over
+_rate_limiter: Optional[RedisRateLimiter] = None
+
+
+def _get_rate_limiter(redis: Redis) -> RedisRateLimiter:
+    """Get the process-wide cluster rate limiter, creating it on first use."""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        _rate_limiter = RedisRateLimiter(
+            redis,
+            rate=settings.worker_rate_limit,
+            burst=settings.worker_rate_limit_burst,
+            key=settings.worker_rate_limit_key,
+            min_rate=settings.worker_rate_limit_min,
+            increase_step=settings.worker_rate_limit_increase,
+            decrease_factor=settings.worker_rate_limit_decrease,
+        )
+    return _rate_limiter
+
 
 class CodeforcesDataService:
     """Service for fetching user data from Codeforces API."""
 
-    def __init__(self):
-        self.codeforces_client = CodeforcesClient()
+    def __init__(self, redis: Redis | None = None):
+        """
+        Initialize service.
+
+        Args:
+            redis: Redis client; when given, requests draw from the cluster-wide
+                rate limit shared with the workers
+        """
+        self.redis = redis
+        rate_limiter = _get_rate_limiter(redis) if redis is not None else None
+
+        # Reuse the process-wide pooled HTTP client instead of opening a new one per request
+        self.codeforces_client = CodeforcesClient(
+            http_client=get_http_client(),
+            rate_limiter=rate_limiter,
+            circuit_breaker=_circuit_breaker,
+        )
 
     async def get_user_submissions(self, handle: str) -> List[Submission]:
         """
@@ -22,19 +89,57 @@ class CodeforcesDataService:
         Returns:
             List of user's submissions
         """
-        async with self.codeforces_client as client:
-            try:
-                return await client.get_user_submissions(handle)
-            except UserNotFoundError:
-                # Re-raise to be caught by controllers
-                raise
+        try:
+            return await self.codeforces_client.get_user_submissions(handle)
+        except UserNotFoundError:
+            # Re-raise to be caught by controllers
+            raise
+
+    async def validate_handle(self, handle: str) -> str:
+        """
+        Check that a handle exists on Codeforces.
+
+        Handles in the negative cache are rejected without calling Codeforces.
+        Other unknown handles of concurrent requests are checked together in
+        one batched user.info call; the outcome is remembered in Redis.
+
+        Args:
+            handle: Codeforces handle (any spelling)
+
+        Returns:
+            Canonical spelling of the handle
+
+        Raises:
+            UserNotFoundError: If the handle does not exist
+        """
+        if self.redis is None:
+            return await _handle_validator.validate(self.codeforces_client, handle)
+
+        if await _unknown_handles.contains(self.redis, handle):
+            raise UserNotFoundError(f"User '{handle}' not found on Codeforces", handle)
+        try:
+            return await resolve_handle(
+                self.redis, self.codeforces_client, handle, _handle_validator
+            )
+        except UserNotFoundError:
+            await _unknown_handles.add(self.redis, handle)
+            raise
 
     async def get_contest_divisions(self) -> Dict[int, str | None]:
         """
         Get mapping of contest IDs to their division.
 
+        Read from the Redis hash maintained by the worker (through a short
+        process-local cache), so requests never wait for contest.list.
+
         Returns:
             Dictionary mapping contest_id to division string
         """
-        async with self.codeforces_client as client:
-            return await client.get_contest_divisions()
+        if self.redis is None:
+            return await self.codeforces_client.get_contest_divisions()
+        return await _contest_divisions.get(self.redis)
+
+    @property
+    def contest_divisions_version(self) -> int:
+        """Version of the mapping last returned by ``get_contest_divisions`` (0 without Redis)."""
+        return _contest_divisions.version if self.redis is not None else 0
@@ -0,0 +1,298 @@
+"""Response bodies of the metric endpoints, shared by the API and the worker."""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+from backend.api.schemas.abandoned_problems import (
+    AbandonedProblemByRatingsResponse,
+    AbandonedProblemByTagsResponse,
+    RatingAbandonedSchema,
+    TagAbandonedSchema,
+)
+from backend.api.schemas.base import BaseAPISchema
+from backend.api.schemas.daily_activity import DailyActivityItemSchema, DailyActivityResponse
+from backend.api.schemas.difficulty_distribution import (
+    DifficultyDistributionResponse,
+    RatingRangeSchema,
+)
+from backend.api.schemas.division_problems import DivisionProblemsResponse, DivisionStatsSchema
+from backend.api.schemas.tags import SimpleTagInfoSchema, TagsResponse, WeakTagsResponse
+from backend.domain.models.codeforces import Submission
+from backend.domain.models.time_period import TimePeriod
+from backend.domain.services.abandoned_problems_service import AbandonedProblemsService
+from backend.domain.services.daily_activity_service import DailyActivityService
+from backend.domain.services.difficulty_distribution_service import (
+    DifficultyDistributionService,
+)
+from backend.domain.services.division_problems_service import DivisionProblemsService
+from backend.domain.services.tags_service import TagsService
+
+# Default of the ``threshold`` query parameter of /tag-ratings/{handle}/weak
+DEFAULT_WEAK_TAG_THRESHOLD = 200
+
+
+def division_problems_params(period: TimePeriod, divisions_version: int) -> Dict[str, Any]:
+    """
+    Cache parameters of a /division-problems response.
+
+    The body also depends on the contest division mapping, so its version is
+    part of the parameters: a refreshed mapping makes cached and precomputed
+    bodies unreachable even for periods that never expire (all time).
+
+    Args:
+        period: Requested period
+        divisions_version: Version of the contest division mapping used
+
+    Returns:
+        Parameters for ``respond_from_cache`` and the precomputed responses
+    """
+    return {"period": period, "divisions_version": divisions_version}
+
+
+def tag_ratings_response(
+    tags_service: TagsService, handle: str, submissions: List[Submission]
+) -> TagsResponse:
+    """Build the /tag-ratings response from the submissions of a period."""
+    tags_analysis = tags_service.analyze_tags(handle, submissions)
+
+    tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in tags_analysis.tags]
+
+    return TagsResponse(
+        tags=tags_info,
+        overall_average_rating=tags_analysis.overall_average_rating,
+        overall_median_rating=tags_analysis.overall_median_rating,
+        total_solved=tags_analysis.total_solved,
+        last_updated=datetime.now(timezone.utc),
+    )
+
+
+def weak_tags_response(
+    tags_service: TagsService, handle: str, submissions: List[Submission], threshold: int
+) -> WeakTagsResponse:
+    """Build the /tag-ratings/weak response from the submissions of a period."""
+    tags_analysis = tags_service.analyze_tags(handle, submissions)
+
+    weak_tags = tags_analysis.get_weak_tags(threshold)
+
+    weak_tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in weak_tags]
+
+    return WeakTagsResponse(
+        weak_tags=weak_tags_info,
+        overall_average_rating=tags_analysis.overall_average_rating,
+        overall_median_rating=tags_analysis.overall_median_rating,
+        total_solved=tags_analysis.total_solved,
+        threshold_used=threshold,
+        last_updated=datetime.now(timezone.utc),
+    )
+
+
+def difficulty_distribution_response(
+    difficulty_service: DifficultyDistributionService,
+    handle: str,
+    submissions: List[Submission],
+) -> DifficultyDistributionResponse:
+    """Build the /difficulty-distribution response from the submissions of a period."""
+    distribution = difficulty_service.analyze_difficulty_distribution(handle, submissions)
+
+    ranges = [
+        RatingRangeSchema(
+            rating=range_data.rating,
+            problem_count=range_data.problem_count,
+        )
+        for range_data in distribution.ranges
+    ]
+
+    return DifficultyDistributionResponse(
+        ranges=ranges,
+        total_solved=distribution.total_solved,
+        last_updated=datetime.now(timezone.utc),
+    )
+
+
+def division_problems_response(
+    division_service: DivisionProblemsService,
+    handle: str,
+    submissions: List[Submission],
+    contest_divisions: Dict[int, str | None],
+) -> DivisionProblemsResponse:
+    """Build the /division-problems response from the submissions of a period."""
+    analysis = division_service.analyze_division_problems(handle, submissions, contest_divisions)
+
+    divisions = [DivisionStatsSchema.model_validate(div) for div in analysis.divisions]
+
+    return DivisionProblemsResponse(
+        divisions=divisions,
+        total_contests=analysis.total_contests,
+        total_problems_solved=analysis.total_problems_solved,
+        last_updated=datetime.now(timezone.utc),
+    )
+
+
+def abandoned_by_tags_response(
+    abandoned_service: AbandonedProblemsService, handle: str, submissions: List[Submission]
+) -> AbandonedProblemByTagsResponse:
+    """Build the /abandoned-problems/by-tags response from the submissions of a period."""
+    analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
+
+    tags = [
+        TagAbandonedSchema(
+            tag=tag_stats.tag,
+            problem_count=tag_stats.problem_count,
+            total_failed_attempts=tag_stats.total_failed_attempts,
+        )
+        for tag_stats in analysis.tags_stats
+    ]
+
+    return AbandonedProblemByTagsResponse(
+        tags=tags,
+        total_abandoned_problems=analysis.total_abandoned,
+        last_updated=datetime.now(timezone.utc),
+    )
+
+
+def abandoned_by_ratings_response(
+    abandoned_service: AbandonedProblemsService, handle: str, submissions: List[Submission]
+) -> AbandonedProblemByRatingsResponse:
+    """Build the /abandoned-problems/by-ratings response from the submissions of a period."""
+    analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
+
+    ratings = [
+        RatingAbandonedSchema(
+            rating=rating_stats.rating,
+            problem_count=rating_stats.problem_count,
+            total_failed_attempts=rating_stats.total_failed_attempts,
+        )
+        for rating_stats in analysis.ratings_stats
+    ]
+
+    return AbandonedProblemByRatingsResponse(
+        ratings=ratings,
+        total_abandoned_problems=analysis.total_abandoned,
+        last_updated=datetime.now(timezone.utc),
+    )
+
+
+def daily_activity_response(
+    daily_activity_service: DailyActivityService,
+    handle: str,
+    submissions: List[Submission],
+    period: TimePeriod,
+    now: datetime,
+) -> DailyActivityResponse:
+    """Build the /daily-activity response from the submissions of a period."""
+    analysis = daily_activity_service.analyze(handle, submissions, period=period, now=now)
+
+    days = [
+        DailyActivityItemSchema(
+            date=day.date,
+            solved_count=day.solved_count,
+            attempt_count=day.attempt_count,
+        )
+        for day in analysis.days
+    ]
+    return DailyActivityResponse(
+        days=days,
+        total_solved=analysis.total_solved,
+        total_attempts=analysis.total_attempts,
+        active_days=analysis.active_days,
+        last_updated=datetime.now(timezone.utc),
+    )
+
+
+# (endpoint name, query parameters, serialized body)
+PrecomputedResponse = Tuple[str, Dict[str, Any], bytes]
+
+
+def precompute_responses(
+    handle: str,
+    submissions: List[Submission],
+    contest_divisions: Dict[int, str | None],
+    divisions_version: int,
+    now: datetime,
+    covers: Callable[[datetime | None], bool],
+) -> List[PrecomputedResponse]:
+    """
+    Build the default-parameter responses of every metric endpoint for every period.
+
+    Endpoint names and parameters are the ones the controllers pass to
+    ``respond_from_cache``, so the bodies can be served in their place.
+
+    Args:
+        handle: Codeforces handle
+        submissions: All cached submissions of the handle
+        contest_divisions: Mapping of contest ids to divisions
+        divisions_version: Version of ``contest_divisions`` (see ``division_problems_params``)
+        now: Reference time of the periods
+        covers: Whether the cached submissions are complete from a start date on
+            (see ``CacheAge.covers``); periods they do not cover are skipped
+
+    Returns:
+        Endpoint name, query parameters and serialized body of each response
+    """
+    tags_service = TagsService()
+    difficulty_service = DifficultyDistributionService()
+    division_service = DivisionProblemsService()
+    abandoned_service = AbandonedProblemsService()
+    daily_activity_service = DailyActivityService()
+
+    bodies: List[PrecomputedResponse] = []
+    for period in TimePeriod:
+        start_date = period.to_start_date(now=now)
+        if not covers(start_date):
+            continue
+
+        period_submissions = submissions
+        if start_date is not None:
+            start_timestamp = int(start_date.timestamp())
+            period_submissions = [
+                s for s in submissions if s.creation_time_seconds >= start_timestamp
+            ]
+        params = {"period": period}
+        responses: List[Tuple[str, Dict[str, Any], BaseAPISchema]] = [
+            (
+                "tag-ratings",
+                params,
+                tag_ratings_response(tags_service, handle, period_submissions),
+            ),
+            (
+                "tag-ratings/weak",
+                {**params, "threshold": DEFAULT_WEAK_TAG_THRESHOLD},
+                weak_tags_response(
+                    tags_service, handle, period_submissions, DEFAULT_WEAK_TAG_THRESHOLD
+                ),
+            ),
+            (
+                "difficulty-distribution",
+                params,
+                difficulty_distribution_response(
+                    difficulty_service, handle, period_submissions
+                ),
+            ),
+            (
+                "division-problems",
+                division_problems_params(period, divisions_version),
+                division_problems_response(
+                    division_service, handle, period_submissions, contest_divisions
+                ),
+            ),
+            (
+                "abandoned-problems/by-tags",
+                params,
+                abandoned_by_tags_response(abandoned_service, handle, period_submissions),
+            ),
+            (
+                "abandoned-problems/by-ratings",
+                params,
+                abandoned_by_ratings_response(abandoned_service, handle, period_submissions),
+            ),
+            (
+                "daily-activity",
+                params,
+                daily_activity_response(
+                    daily_activity_service, handle, period_submissions, period, now
+                ),
+            ),
+        ]
+        for endpoint, endpoint_params, response in responses:
+            bodies.append((endpoint, endpoint_params, response.model_dump_json().encode()))
+    return bodies
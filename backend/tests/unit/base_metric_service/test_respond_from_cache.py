@@ -0,0 +1,267 @@
+"""Tests for BaseMetricController.respond_from_cache()."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.api.routes import base
+from backend.api.routes.base import BaseMetricController
+from backend.api.schemas.base import BaseAPISchema
+from backend.infrastructure.popularity import PageViews
+from backend.infrastructure.response_cache import ResponseCache
+from backend.infrastructure.submission_cache import CacheAge, CacheEntry
+
+
+class CountSchema(BaseAPISchema):
+    count: int
+
+
+@pytest.fixture
+def controller() -> BaseMetricController:
+    return BaseMetricController(owner=MagicMock())
+
+
+@pytest.fixture
+def clock():
+    return MagicMock(return_value=0.0)
+
+
+@pytest.fixture
+def cache(monkeypatch, clock) -> ResponseCache:
+    cache = ResponseCache(max_bytes=1000, ttl=300, clock=clock)
+    monkeypatch.setattr(base, "response_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def cached_data(monkeypatch):
+    """Patch the cache reads; returns (read_cache_entry, load_cached_submissions) mocks."""
+    monkeypatch.setattr(base, "page_views", PageViews(window=60))
+    read = AsyncMock()
+    load = AsyncMock(return_value=[MagicMock(creation_time_seconds=1)] * 3)
+    monkeypatch.setattr(base, "read_cache_entry", read)
+    monkeypatch.setattr(base, "load_cached_submissions", load)
+    return read, load
+
+
+def _entry(age=0, version=7, covers_from=None):
+    return CacheEntry(
+        payload=None,
+        cache_age=CacheAge(age=age, fresh_ttl=600, covers_from=covers_from),
+        version=version,
+    )
+
+
+async def _respond(controller, task_queue=None, prefer_fresh=False, params=None, start_date=None):
+    return await controller.respond_from_cache(
+        MagicMock(),
+        task_queue or MagicMock(),
+        "tourist",
+        start_date,
+        prefer_fresh,
+        endpoint="count",
+        params=params or {},
+        build=lambda submissions: CountSchema(count=len(submissions)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fresh_response_is_built_once_per_version(controller, cache, cached_data):
+    read, load = cached_data
+    read.return_value = _entry()
+
+    first, cached = await _respond(controller)
+    second, _ = await _respond(controller)
+
+    assert cached
+    assert first.content == second.content == b'{"count":3}'
+    assert first.headers["Cache-Control"] == "public, max-age=600"
+    load.assert_awaited_once()
+    # One page view is counted once, in the same round trip as the cache read
+    assert [call.kwargs for call in read.await_args_list] == [
+        {"with_payload": False, "count_access": True},
+        {"with_payload": False, "count_access": False},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_new_version_is_rebuilt(controller, cache, cached_data):
+    read, load = cached_data
+    read.return_value = _entry(version=7)
+    await _respond(controller)
+
+    read.return_value = _entry(version=8)
+    await _respond(controller)
+
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_params_are_part_of_the_key(controller, cache, cached_data):
+    read, load = cached_data
+    read.return_value = _entry()
+
+    await _respond(controller, params={"period": "month"})
+    await _respond(controller, params={"period": "year"})
+
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unversioned_entries_are_not_cached(controller, cache, cached_data):
+    read, load = cached_data
+    read.return_value = _entry(version=None)
+
+    await _respond(controller)
+    await _respond(controller)
+
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_response_schedules_refresh(controller, cache, cached_data):
+    read, _ = cached_data
+    read.return_value = _entry(age=900)
+    task_queue = MagicMock()
+    task_queue.enqueue = AsyncMock()
+
+    response, cached = await _respond(controller, task_queue=task_queue)
+    await base.asyncio.sleep(0)
+
+    assert cached
+    assert response.headers["X-Data-Stale"] == "true"
+    assert response.headers["X-Data-Age"] == "900"
+    task_queue.enqueue.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stale_data_with_prefer_fresh(controller, cache, cached_data):
+    read, load = cached_data
+    read.return_value = _entry(age=900)
+
+    assert await _respond(controller, prefer_fresh=True) == (None, True)
+    load.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_no_data(controller, cache, cached_data):
+    read, _ = cached_data
+    read.return_value = None
+
+    assert await _respond(controller) == (None, False)
+
+
+@pytest.mark.asyncio
+async def test_partial_data_not_covering_the_period(controller, cache, cached_data):
+    read, _ = cached_data
+    read.return_value = _entry(covers_from=1)
+
+    # start_date None means all time, which a partial load never covers
+    assert await _respond(controller) == (None, False)
+
+
+@pytest.mark.asyncio
+async def test_expired_since_metadata_read(controller, cache, cached_data):
+    read, load = cached_data
+    read.return_value = _entry()
+    load.return_value = None
+
+    assert await _respond(controller) == (None, False)
+
+
+@pytest.mark.asyncio
+async def test_cached_empty_history(controller, cache, cached_data):
+    read, load = cached_data
+    read.return_value = _entry()
+    load.return_value = []
+
+    assert await _respond(controller) == (None, True)
+
+
+@pytest.fixture
+def precomputed(monkeypatch):
+    monkeypatch.setattr(base.settings, "worker_precompute_metrics", True)
+    load = AsyncMock(return_value=(b'{"count":42}', 0.0))
+    monkeypatch.setattr(base, "load_precomputed_response", load)
+    return load
+
+
+@pytest.mark.asyncio
+async def test_precomputed_response_is_served(controller, cache, cached_data, precomputed):
+    read, load = cached_data
+    read.return_value = _entry()
+
+    first, _ = await _respond(controller)
+    second, _ = await _respond(controller)
+
+    assert first.content == second.content == b'{"count":42}'
+    precomputed.assert_awaited_once()
+    assert precomputed.await_args.kwargs["max_age"] is None
+    load.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_missing_precomputed_response_is_built(
+    controller, cache, cached_data, precomputed
+):
+    read, load = cached_data
+    read.return_value = _entry()
+    precomputed.return_value = None
+
+    response, _ = await _respond(controller)
+
+    assert response.content == b'{"count":3}'
+    load.assert_awaited_once()
+
+
+def test_max_response_age_scales_with_the_period(monkeypatch):
+    monkeypatch.setattr(base.settings, "precomputed_metrics_drift", 0.01)
+    start_date = datetime.now(timezone.utc) - timedelta(days=30)
+
+    max_age = BaseMetricController._max_response_age(start_date)
+
+    assert max_age == pytest.approx(30 * 24 * 60 * 60 * 0.01, rel=1e-3)
+    assert BaseMetricController._max_response_age(None) is None
+
+
+def _hour_ago():
+    return datetime.now(timezone.utc) - timedelta(hours=1)
+
+
+@pytest.mark.asyncio
+async def test_short_period_bodies_expire_within_the_drift_bound(
+    controller, cache, cached_data, clock, monkeypatch
+):
+    monkeypatch.setattr(base.settings, "precomputed_metrics_drift", 0.01)
+    read, load = cached_data
+    read.return_value = _entry()
+
+    await _respond(controller, start_date=_hour_ago())
+    clock.return_value = 35.0
+    await _respond(controller, start_date=_hour_ago())
+    assert load.await_count == 1
+
+    # 1% of an hour is 36s, far below response_cache_ttl
+    clock.return_value = 37.0
+    await _respond(controller, start_date=_hour_ago())
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_precomputed_body_keeps_only_its_remaining_age(
+    controller, cache, cached_data, precomputed, clock, monkeypatch
+):
+    monkeypatch.setattr(base.settings, "precomputed_metrics_drift", 0.01)
+    read, _ = cached_data
+    read.return_value = _entry()
+    precomputed.return_value = (b'{"count":42}', 30.0)
+
+    await _respond(controller, start_date=_hour_ago())
+    clock.return_value = 5.0
+    await _respond(controller, start_date=_hour_ago())
+    assert precomputed.await_count == 1
+
+    clock.return_value = 7.0
+    await _respond(controller, start_date=_hour_ago())
+    assert precomputed.await_count == 2
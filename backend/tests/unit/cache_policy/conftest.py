@@ -0,0 +1,29 @@
+"""Fixtures for cache policy unit tests."""
+
+from typing import Callable
+
+import pytest
+
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+
+@pytest.fixture
+def now() -> int:
+    """Reference Unix time for cadence calculations."""
+    return 1_700_000_000
+
+
+@pytest.fixture
+def submitted_at(now) -> Callable[..., Submission]:
+    """Create a submission made ``seconds_ago`` before ``now``."""
+
+    def _create(seconds_ago: int, submission_id: int = 1) -> Submission:
+        return Submission(
+            id=submission_id,
+            contest_id=1000,
+            creation_time_seconds=now - seconds_ago,
+            problem=Problem(contest_id=1000, index="A", name="Test", rating=1500, tags=[]),
+            verdict=SubmissionStatus.OK,
+            programming_language="C++17",
+        )
+
+    return _create
@@ -0,0 +1,82 @@
+"""Unit tests for cadence-based cache lifetimes."""
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.cache_policy import (
+    CacheTtl,
+    SubmissionCadence,
+    cache_ttl_for,
+    cache_ttl_for_times,
+)
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+
+def test_no_submissions_uses_longest_ttl(now):
+    ttl = cache_ttl_for([], now=now)
+
+    assert ttl == CacheTtl(fresh=settings.cache_fresh_ttl_max, expire=settings.cache_expire_max)
+
+
+def test_long_idle_handle_stays_fresh_for_days(submitted_at, now):
+    ttl = cache_ttl_for([submitted_at(365 * DAY)], now=now)
+
+    assert ttl.fresh == settings.cache_fresh_ttl_max
+    assert ttl.expire == settings.cache_expire_max
+
+
+def test_fresh_ttl_scales_with_idle_time(submitted_at, now):
+    ttl = cache_ttl_for([submitted_at(60 * DAY)], now=now)
+
+    # Not submitted within four weeks: only the idle time counts
+    assert ttl.fresh == int(60 * DAY * settings.cache_idle_factor)
+    assert ttl.expire == settings.cache_expire_max
+
+
+def test_frequent_submitter_capped_by_submission_gap(submitted_at, now):
+    # 56 submissions over the last four weeks: one every 12 hours
+    submissions = [submitted_at(10 * DAY + i * HOUR, i) for i in range(56)]
+
+    ttl = cache_ttl_for(submissions, now=now)
+
+    assert ttl.fresh == 12 * HOUR
+    assert ttl.expire == int(12 * HOUR * settings.cache_expire_factor)
+
+
+def test_active_handle_uses_minimum_fresh_ttl(submitted_at, now):
+    ttl = cache_ttl_for([submitted_at(60), submitted_at(120, 2)], now=now)
+
+    assert ttl.fresh == settings.cache_fresh_ttl_min
+    assert ttl.expire == settings.cache_stale_ttl
+
+
+def test_order_of_submissions_does_not_matter(submitted_at, now):
+    submissions = [submitted_at(5 * DAY, 1), submitted_at(2 * DAY, 2), submitted_at(40 * DAY, 3)]
+
+    assert cache_ttl_for(submissions, now=now) == cache_ttl_for(submissions[::-1], now=now)
+
+
+def test_creation_times_give_same_ttl(submitted_at, now):
+    submissions = [submitted_at(5 * DAY, 1), submitted_at(2 * DAY, 2), submitted_at(40 * DAY, 3)]
+    times = [s.creation_time_seconds for s in submissions]
+
+    assert cache_ttl_for_times(times, now=now) == cache_ttl_for(submissions, now=now)
+
+
+@pytest.mark.asyncio
+async def test_observe_passes_submissions_through(submitted_at, now):
+    submissions = [submitted_at(3 * DAY, 1), submitted_at(9 * DAY, 2)]
+
+    async def stream():
+        for s in submissions:
+            yield s
+
+    cadence = SubmissionCadence(now=now)
+    seen = [s async for s in cadence.observe(stream())]
+
+    assert seen == submissions
+    assert cadence.last_submission == now - 3 * DAY
+    assert cadence.recent_submissions == 2
+    assert cadence.cache_ttl() == cache_ttl_for(submissions, now=now)
@@ -0,0 +1,26 @@
+"""Fixtures for circuit breaker unit tests."""
+
+import pytest
+
+from backend.infrastructure.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock) -> CircuitBreaker:
+    return CircuitBreaker("Test", failure_threshold=3, recovery_timeout=10.0, clock=clock)
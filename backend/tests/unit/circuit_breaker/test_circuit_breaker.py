@@ -0,0 +1,92 @@
+"""Unit tests for CircuitBreaker state transitions."""
+
+import pytest
+
+from backend.infrastructure.circuit_breaker import CircuitOpenError, CircuitState
+
+
+def _fail(breaker, times):
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_starts_closed(breaker):
+    breaker.before_call()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert not breaker.is_open
+    assert breaker.retry_after == 0
+
+
+def test_opens_after_threshold(breaker):
+    _fail(breaker, 3)
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == 10.0
+
+
+def test_success_resets_failure_count(breaker):
+    _fail(breaker, 2)
+    breaker.record_success()
+    _fail(breaker, 2)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_after_timeout_allows_single_probe(breaker, clock):
+    _fail(breaker, 3)
+    clock.advance(10.0)
+
+    assert not breaker.is_open
+    breaker.before_call()
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_successful_probe_closes(breaker, clock):
+    _fail(breaker, 3)
+    clock.advance(10.0)
+    breaker.before_call()
+
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens(breaker, clock):
+    _fail(breaker, 3)
+    clock.advance(10.0)
+    breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_after == 10.0
+
+
+def test_retry_after_counts_down(breaker, clock):
+    _fail(breaker, 3)
+    clock.advance(4.0)
+
+    assert breaker.retry_after == 6.0
+
+
+def test_released_probe_lets_the_next_call_probe(breaker, clock):
+    _fail(breaker, 3)
+    clock.advance(10.0)
+    breaker.before_call()
+    assert breaker.is_open
+
+    breaker.release_probe()
+
+    assert not breaker.is_open
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_call()
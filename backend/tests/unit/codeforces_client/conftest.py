@@ -142,3 +142,30 @@ def sample_malformed_submission() -> List[Dict[str, Any]]:
             "random_field": "value",
         },
     ]
+
+
+class _StreamResponse:
+    def __init__(self, chunks: List[str], status_code: int):
+        self._chunks = chunks
+        self.status_code = status_code
+
+    async def aiter_text(self):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+@pytest.fixture
+def make_stream_response():
+    """Factory for objects mimicking ``httpx.AsyncClient.stream(...)`` results."""
+
+    def _create(body: str, chunk_size: int = 16, status_code: int = 200) -> _StreamResponse:
+        chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+        return _StreamResponse(chunks, status_code)
+
+    return _create
@@ -0,0 +1,26 @@
+"""Unit tests for CodeforcesClient HTTP client ownership."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.infrastructure.codeforces_client import CodeforcesClient
+
+
+@pytest.mark.asyncio
+async def test_owned_client_is_closed(codeforces_client, mock_httpx_client):
+    async with codeforces_client:
+        pass
+
+    mock_httpx_client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_not_closed():
+    shared = AsyncMock()
+
+    async with CodeforcesClient(http_client=shared) as client:
+        assert client.http_client is shared
+    await client.close()
+
+    shared.aclose.assert_not_awaited()
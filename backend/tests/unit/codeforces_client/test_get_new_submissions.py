@@ -0,0 +1,107 @@
+"""Unit tests for CodeforcesClient.get_new_submissions method."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.infrastructure.http_client import endpoint_timeout
+
+
+def _page(ids):
+    return [
+        {
+            "id": submission_id,
+            "contestId": 1000,
+            "creationTimeSeconds": 1609459200 + submission_id,
+            "programmingLanguage": "C++17",
+            "verdict": "OK",
+            "problem": {"contestId": 1000, "index": "A", "name": "P", "rating": 800, "tags": []},
+        }
+        for submission_id in ids
+    ]
+
+
+def _responses(*pages):
+    responses = []
+    for page in pages:
+        response = MagicMock()
+        response.json.return_value = {"status": "OK", "result": _page(page)}
+        response.status_code = 200
+        responses.append(response)
+    return responses
+
+
+@pytest.mark.asyncio
+async def test_stops_at_first_page_containing_known_id(codeforces_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(side_effect=_responses([10, 9, 8]))
+
+    result = await codeforces_client.get_new_submissions("tourist", since_id=8, page_size=3)
+
+    assert [s.id for s in result] == [10, 9]
+    mock_httpx_client.get.assert_called_once_with(
+        "https://codeforces.com/api/user.status",
+        params={"handle": "tourist", "from": 1, "count": 3},
+        timeout=endpoint_timeout("user.status"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_pages_until_known_id(codeforces_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(side_effect=_responses([10, 9], [8, 7], [6, 5]))
+
+    result = await codeforces_client.get_new_submissions("tourist", since_id=6, page_size=2)
+
+    assert [s.id for s in result] == [10, 9, 8, 7]
+    assert mock_httpx_client.get.call_count == 3
+    assert mock_httpx_client.get.call_args_list[1][1]["params"]["from"] == 3
+    assert mock_httpx_client.get.call_args_list[2][1]["params"]["from"] == 5
+
+
+@pytest.mark.asyncio
+async def test_stops_at_end_of_history(codeforces_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(side_effect=_responses([3, 2], [1]))
+
+    result = await codeforces_client.get_new_submissions("tourist", since_id=0, page_size=2)
+
+    assert [s.id for s in result] == [3, 2, 1]
+    assert mock_httpx_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_nothing_new(codeforces_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(side_effect=_responses([5, 4]))
+
+    result = await codeforces_client.get_new_submissions("tourist", since_id=5, page_size=2)
+
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_acquires_rate_limiter_per_page(codeforces_client, mock_httpx_client):
+    codeforces_client.rate_limiter = MagicMock()
+    codeforces_client.rate_limiter.acquire = AsyncMock()
+    mock_httpx_client.get = AsyncMock(side_effect=_responses([4, 3], [2, 1], []))
+
+    await codeforces_client.get_new_submissions("tourist", since_id=0, page_size=2)
+
+    assert codeforces_client.rate_limiter.acquire.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_latest_submission_probes_one_row(codeforces_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(side_effect=_responses([42]))
+
+    latest = await codeforces_client.get_latest_submission("tourist")
+
+    assert latest.id == 42
+    assert mock_httpx_client.get.call_args[1]["params"] == {
+        "handle": "tourist",
+        "from": 1,
+        "count": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_latest_submission_without_history(codeforces_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(side_effect=_responses([]))
+
+    assert await codeforces_client.get_latest_submission("newbie") is None
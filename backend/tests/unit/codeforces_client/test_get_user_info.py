@@ -0,0 +1,58 @@
+"""Unit tests for CodeforcesClient.get_user_info method."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.infrastructure.codeforces_client import CodeforcesAPIError, UserNotFoundError
+from backend.infrastructure.http_client import endpoint_timeout
+
+
+def _response(payload, status_code=200):
+    response = MagicMock()
+    response.json.return_value = payload
+    response.status_code = status_code
+    return response
+
+
+@pytest.mark.asyncio
+async def test_get_user_info_joins_handles(codeforces_client, mock_httpx_client):
+    users = [{"handle": "tourist"}, {"handle": "Petr"}]
+    mock_httpx_client.get = AsyncMock(return_value=_response({"status": "OK", "result": users}))
+
+    assert await codeforces_client.get_user_info(["tourist", "petr"]) == users
+    mock_httpx_client.get.assert_called_once_with(
+        "https://codeforces.com/api/user.info",
+        params={"handles": "tourist;petr"},
+        timeout=endpoint_timeout("user.info"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_user_info_names_missing_handle(codeforces_client, mock_httpx_client):
+    payload = {"status": "FAILED", "comment": "handles: User with handle nobody42 not found"}
+    mock_httpx_client.get = AsyncMock(return_value=_response(payload, 400))
+
+    with pytest.raises(UserNotFoundError) as exc_info:
+        await codeforces_client.get_user_info(["tourist", "nobody42"])
+
+    assert exc_info.value.handle == "nobody42"
+
+
+@pytest.mark.asyncio
+async def test_get_user_info_api_error(codeforces_client, mock_httpx_client):
+    payload = {"status": "FAILED", "comment": "Internal server error"}
+    mock_httpx_client.get = AsyncMock(return_value=_response(payload, 400))
+
+    with pytest.raises(CodeforcesAPIError):
+        await codeforces_client.get_user_info(["tourist"])
+
+
+@pytest.mark.asyncio
+async def test_get_user_info_rejects_invalid_handle(codeforces_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock()
+
+    with pytest.raises(UserNotFoundError) as exc_info:
+        await codeforces_client.get_user_info(["tourist", "petr;jiangly"])
+
+    assert exc_info.value.handle == "petr;jiangly"
+    mock_httpx_client.get.assert_not_called()
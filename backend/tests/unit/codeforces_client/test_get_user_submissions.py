@@ -9,6 +9,7 @@ from backend.infrastructure.codeforces_client import (
     CodeforcesAPIError,
     UserNotFoundError,
 )
+from backend.infrastructure.http_client import endpoint_timeout
 from backend.domain.models.codeforces import Submission, SubmissionStatus
 
 
@@ -31,7 +32,9 @@ async def test_get_user_submissions_success(
     assert result[0].problem.name == "Test Problem"
     assert result[1].verdict == SubmissionStatus.WRONG_ANSWER
     mock_httpx_client.get.assert_called_once_with(
-        "https://codeforces.com/api/user.status", params={"handle": "tourist"}
+        "https://codeforces.com/api/user.status",
+        params={"handle": "tourist"},
+        timeout=endpoint_timeout("user.status"),
     )
 
 
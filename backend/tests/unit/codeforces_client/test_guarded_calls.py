@@ -0,0 +1,229 @@
+"""Unit tests for CodeforcesClient error classification, rate feedback and circuit breaking."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from backend.infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from backend.infrastructure.codeforces_client import (
+    CodeforcesAPIError,
+    CodeforcesRateLimitError,
+    CodeforcesUnavailableError,
+    UserNotFoundError,
+)
+
+
+def _response(body, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    if isinstance(body, dict):
+        response.json.return_value = body
+    else:
+        response.json.side_effect = json.JSONDecodeError("Expecting value", body, 0)
+    return response
+
+
+@pytest.fixture
+def rate_limiter():
+    limiter = MagicMock()
+    limiter.acquire = AsyncMock(return_value=0.0)
+    return limiter
+
+
+@pytest.fixture
+def guarded_client(codeforces_client, rate_limiter):
+    codeforces_client.rate_limiter = rate_limiter
+    codeforces_client.circuit_breaker = CircuitBreaker("Test", failure_threshold=2)
+    return codeforces_client
+
+
+@pytest.mark.asyncio
+async def test_call_limit_exceeded(guarded_client, mock_httpx_client, rate_limiter):
+    mock_httpx_client.get = AsyncMock(
+        return_value=_response({"status": "FAILED", "comment": "Call limit exceeded"}, 503)
+    )
+
+    with pytest.raises(CodeforcesRateLimitError):
+        await guarded_client.get_user_submissions("tourist")
+
+    rate_limiter.on_throttled.assert_called_once()
+    rate_limiter.on_success.assert_not_called()
+    assert guarded_client.circuit_breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_success_feeds_back(guarded_client, mock_httpx_client, rate_limiter):
+    mock_httpx_client.get = AsyncMock(return_value=_response({"status": "OK", "result": []}))
+
+    await guarded_client.get_user_submissions("tourist")
+
+    rate_limiter.on_success.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_html_error_page_is_unavailable(guarded_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(return_value=_response("<html>502</html>", 502))
+
+    with pytest.raises(CodeforcesUnavailableError) as exc_info:
+        await guarded_client.get_user_submissions("tourist")
+
+    assert exc_info.value.status_code == 502
+
+
+@pytest.mark.asyncio
+async def test_request_error_is_unavailable(guarded_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(side_effect=httpx.ConnectTimeout("timed out"))
+
+    with pytest.raises(CodeforcesUnavailableError):
+        await guarded_client.get_user_submissions("tourist")
+
+
+@pytest.mark.asyncio
+async def test_http_429_is_rate_limit(guarded_client, mock_httpx_client):
+    error_response = MagicMock()
+    error_response.status_code = 429
+    error_response.text = "Too Many Requests"
+    mock_httpx_client.get = AsyncMock(
+        side_effect=httpx.HTTPStatusError("429", request=MagicMock(), response=error_response)
+    )
+
+    with pytest.raises(CodeforcesRateLimitError):
+        await guarded_client.get_user_submissions("tourist")
+
+
+@pytest.mark.asyncio
+async def test_client_errors_stay_generic(guarded_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(
+        return_value=_response({"status": "FAILED", "comment": "count: bad"}, 400)
+    )
+
+    with pytest.raises(CodeforcesAPIError) as exc_info:
+        await guarded_client.get_user_submissions("tourist")
+
+    assert type(exc_info.value) is CodeforcesAPIError
+
+
+@pytest.mark.asyncio
+async def test_outage_opens_circuit(guarded_client, mock_httpx_client, rate_limiter):
+    mock_httpx_client.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+    for _ in range(2):
+        with pytest.raises(CodeforcesUnavailableError):
+            await guarded_client.get_user_submissions("tourist")
+
+    with pytest.raises(CircuitOpenError):
+        await guarded_client.get_user_submissions("tourist")
+
+    assert mock_httpx_client.get.await_count == 2
+    assert rate_limiter.acquire.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_user_not_found_counts_as_reachable(guarded_client, mock_httpx_client):
+    guarded_client.circuit_breaker.record_failure()
+    mock_httpx_client.get = AsyncMock(
+        return_value=_response(
+            {"status": "FAILED", "comment": "handle: User with handle x not found"}, 400
+        )
+    )
+
+    with pytest.raises(UserNotFoundError):
+        await guarded_client.get_user_submissions("x")
+
+    assert guarded_client.circuit_breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_contest_list_call_limit(guarded_client, mock_httpx_client, rate_limiter):
+    mock_httpx_client.get = AsyncMock(
+        return_value=_response({"status": "FAILED", "comment": "Call limit exceeded"})
+    )
+
+    with pytest.raises(CodeforcesRateLimitError):
+        await guarded_client.get_contests()
+
+    rate_limiter.on_throttled.assert_called_once()
+
+
+@pytest.fixture
+def half_open(guarded_client):
+    """Put the breaker into the state where the next call is the half-open probe."""
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "Test", failure_threshold=1, recovery_timeout=10, clock=lambda: now[0]
+    )
+    breaker.record_failure()
+    now[0] = 10
+    guarded_client.circuit_breaker = breaker
+    return breaker
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_is_released(guarded_client, mock_httpx_client, half_open):
+    started = asyncio.Event()
+
+    async def _hang(*args, **kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    mock_httpx_client.get = AsyncMock(side_effect=_hang)
+    task = asyncio.create_task(guarded_client.get_user_submissions("tourist"))
+    await started.wait()
+    assert half_open.is_open
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert not half_open.is_open
+    mock_httpx_client.get = AsyncMock(return_value=_response({"status": "OK", "result": []}))
+    await guarded_client.get_user_submissions("tourist")
+    assert half_open.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_failing_rate_limiter_releases_probe(guarded_client, rate_limiter, half_open):
+    rate_limiter.acquire.side_effect = ConnectionError("redis down")
+
+    with pytest.raises(ConnectionError):
+        await guarded_client.get_user_submissions("tourist")
+
+    assert not half_open.is_open
+    assert half_open.state is CircuitState.HALF_OPEN
+
+
+@pytest.mark.asyncio
+async def test_unexpected_error_fails_probe(guarded_client, mock_httpx_client, half_open):
+    mock_httpx_client.get = AsyncMock(side_effect=ValueError("garbage"))
+
+    with pytest.raises(ValueError):
+        await guarded_client.get_user_submissions("tourist")
+
+    assert half_open.state is CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_releases_probe(
+    guarded_client,
+    mock_httpx_client,
+    make_stream_response,
+    sample_api_response_success,
+    half_open,
+):
+    mock_httpx_client.stream = MagicMock(
+        return_value=make_stream_response(json.dumps(sample_api_response_success))
+    )
+
+    submissions = guarded_client.iter_user_submissions("tourist")
+    await anext(submissions)
+    assert half_open.is_open
+    await submissions.aclose()
+
+    assert not half_open.is_open
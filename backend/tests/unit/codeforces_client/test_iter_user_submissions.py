@@ -0,0 +1,110 @@
+"""Unit tests for CodeforcesClient.iter_user_submissions method."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from backend.domain.models.codeforces import SubmissionStatus
+from backend.infrastructure.codeforces_client import CodeforcesAPIError, UserNotFoundError
+from backend.infrastructure.http_client import endpoint_timeout
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_streams_parsed_submissions(
+    codeforces_client, mock_httpx_client, make_stream_response, sample_api_response_success
+):
+    mock_httpx_client.stream = MagicMock(
+        return_value=make_stream_response(json.dumps(sample_api_response_success))
+    )
+
+    result = await _collect(codeforces_client.iter_user_submissions("tourist"))
+
+    assert [s.id for s in result] == [123456789, 987654321]
+    assert result[0].problem.tags == ["implementation", "math"]
+    assert result[1].verdict == SubmissionStatus.WRONG_ANSWER
+    mock_httpx_client.stream.assert_called_once_with(
+        "GET",
+        "https://codeforces.com/api/user.status",
+        params={"handle": "tourist"},
+        timeout=endpoint_timeout("user.status"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_passes_paging_params(codeforces_client, mock_httpx_client, make_stream_response):
+    mock_httpx_client.stream = MagicMock(
+        return_value=make_stream_response('{"status": "OK", "result": []}')
+    )
+
+    await _collect(codeforces_client.iter_user_submissions("tourist", from_index=11, count=5))
+
+    assert mock_httpx_client.stream.call_args[1]["params"] == {
+        "handle": "tourist",
+        "from": 11,
+        "count": 5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_skips_malformed_rows(codeforces_client, mock_httpx_client, make_stream_response):
+    body = json.dumps({"status": "OK", "result": ["garbage", {"id": 5, "problem": {}}]})
+    mock_httpx_client.stream = MagicMock(return_value=make_stream_response(body, chunk_size=3))
+
+    result = await _collect(codeforces_client.iter_user_submissions("tourist"))
+
+    assert [s.id for s in result] == [5]
+
+
+@pytest.mark.asyncio
+async def test_user_not_found(
+    codeforces_client, mock_httpx_client, make_stream_response, sample_api_response_user_not_found
+):
+    mock_httpx_client.stream = MagicMock(
+        return_value=make_stream_response(
+            json.dumps(sample_api_response_user_not_found), status_code=400
+        )
+    )
+
+    with pytest.raises(UserNotFoundError):
+        await _collect(codeforces_client.iter_user_submissions("nonexistent"))
+
+
+@pytest.mark.asyncio
+async def test_truncated_body(codeforces_client, mock_httpx_client, make_stream_response):
+    mock_httpx_client.stream = MagicMock(
+        return_value=make_stream_response('{"status": "OK", "result": [{"id": 1}, {"i')
+    )
+
+    with pytest.raises(CodeforcesAPIError) as exc_info:
+        await _collect(codeforces_client.iter_user_submissions("tourist"))
+
+    assert "JSON decode error" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_request_error(codeforces_client, mock_httpx_client):
+    mock_httpx_client.stream = MagicMock(side_effect=httpx.RequestError("Connection reset"))
+
+    with pytest.raises(CodeforcesAPIError) as exc_info:
+        await _collect(codeforces_client.iter_user_submissions("tourist"))
+
+    assert "Connection reset" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_acquires_rate_limiter(codeforces_client, mock_httpx_client, make_stream_response):
+    codeforces_client.rate_limiter = MagicMock()
+    codeforces_client.rate_limiter.acquire = AsyncMock()
+    mock_httpx_client.stream = MagicMock(
+        return_value=make_stream_response('{"status": "OK", "result": []}')
+    )
+
+    await _collect(codeforces_client.iter_user_submissions("tourist"))
+
+    codeforces_client.rate_limiter.acquire.assert_awaited_once()
@@ -0,0 +1,17 @@
+"""Fixtures for Codeforces data service unit tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services import codeforces_data_service
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch):
+    monkeypatch.setattr(codeforces_data_service, "_rate_limiter", None)
+
+
+@pytest.fixture
+def mock_redis():
+    return MagicMock()
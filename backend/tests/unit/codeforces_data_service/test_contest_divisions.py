@@ -0,0 +1,24 @@
+"""Unit tests for the contest division mapping of CodeforcesDataService."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.infrastructure.contest_divisions import ContestDivisionCache
+from backend.services import codeforces_data_service
+from backend.services.codeforces_data_service import CodeforcesDataService
+
+
+@pytest.mark.asyncio
+async def test_version_follows_the_mapping(mock_redis, monkeypatch):
+    monkeypatch.setattr(codeforces_data_service, "_contest_divisions", ContestDivisionCache())
+    mock_redis.get = AsyncMock(return_value=b"3")
+    mock_redis.hgetall = AsyncMock(return_value={b"1000": b"Div. 2"})
+    service = CodeforcesDataService(mock_redis)
+
+    assert await service.get_contest_divisions() == {1000: "Div. 2"}
+    assert service.contest_divisions_version == 3
+
+
+def test_no_version_without_redis():
+    assert CodeforcesDataService().contest_divisions_version == 0
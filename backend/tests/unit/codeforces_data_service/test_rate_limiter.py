@@ -0,0 +1,15 @@
+"""Unit tests for the rate limiter of CodeforcesDataService."""
+
+from backend.services.codeforces_data_service import CodeforcesDataService
+
+
+def test_requests_share_one_rate_limiter(mock_redis):
+    first = CodeforcesDataService(mock_redis)
+    second = CodeforcesDataService(mock_redis)
+
+    assert first.codeforces_client.rate_limiter is second.codeforces_client.rate_limiter
+    assert first.codeforces_client.rate_limiter is not None
+
+
+def test_no_rate_limiter_without_redis():
+    assert CodeforcesDataService().codeforces_client.rate_limiter is None
@@ -0,0 +1,27 @@
+"""Fixtures for compression unit tests."""
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure import compression
+
+
+@pytest.fixture
+def use_compression(monkeypatch):
+    """Select a compression setting for the test and reset the cached choice."""
+
+    def _use(algorithm: str, threshold: int = 64) -> None:
+        monkeypatch.setattr(settings, "redis_compression", algorithm)
+        monkeypatch.setattr(settings, "redis_compression_threshold", threshold)
+        compression.compression_algorithm.cache_clear()
+
+    yield _use
+    compression.compression_algorithm.cache_clear()
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    """Fresh process-wide counters."""
+    fresh = compression.CompressionStats()
+    monkeypatch.setattr(compression, "compression_stats", fresh)
+    return fresh
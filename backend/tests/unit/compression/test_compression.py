@@ -0,0 +1,97 @@
+"""Unit tests for transparent value compression."""
+
+import zlib
+
+import pytest
+
+from backend.infrastructure import compression
+from backend.infrastructure.compression import (
+    ZLIB,
+    StreamCompressor,
+    compress_value,
+    decompress_value,
+    is_compressed,
+)
+
+_VALUE = b'{"verdict": "WRONG_ANSWER", "tags": ["dp", "math"]}' * 100
+
+
+def test_large_value_round_trip(use_compression, stats):
+    use_compression("zlib")
+
+    stored = compress_value(_VALUE)
+
+    assert is_compressed(stored)
+    assert len(stored) < len(_VALUE) // 10
+    assert decompress_value(stored) == _VALUE
+    assert stats.compressed == 1
+    assert stats.bytes_in == len(_VALUE)
+    assert stats.bytes_out == len(stored)
+    assert stats.decompressed == 1
+    assert stats.as_dict()["ratio"] > 10
+
+
+def test_small_value_is_stored_as_is(use_compression, stats):
+    use_compression("zlib", threshold=len(_VALUE) + 1)
+
+    assert compress_value(_VALUE) is _VALUE
+    assert stats.compressed == 0
+
+
+def test_incompressible_value_is_stored_as_is(use_compression):
+    use_compression("zlib")
+    data = bytes(range(256))
+
+    assert compress_value(data) is data
+
+
+def test_disabled(use_compression):
+    use_compression("none")
+
+    assert compress_value(_VALUE) is _VALUE
+    assert StreamCompressor.create() is None
+
+
+@pytest.mark.parametrize("raw", [b"[]", "[]", b"CFS\x01"])
+def test_uncompressed_values_are_returned_unchanged(raw):
+    assert decompress_value(raw) is raw
+
+
+def test_auto_falls_back_to_zlib_without_zstandard(use_compression, monkeypatch):
+    monkeypatch.setattr(compression, "_zstd_available", lambda: False)
+    use_compression("auto")
+
+    assert compression.compression_algorithm() == ZLIB
+
+
+def test_zstd_value_without_zstandard_is_rejected(monkeypatch):
+    monkeypatch.setattr(compression, "_zstd_available", lambda: False)
+
+    with pytest.raises(ValueError, match="zstandard"):
+        decompress_value(b"\x00Z\x02...")
+
+
+def test_unknown_algorithm_is_rejected():
+    with pytest.raises(ValueError, match="Unknown"):
+        decompress_value(b"\x00Z\x09...")
+
+
+def test_stream_compressor(use_compression, stats):
+    use_compression("zlib")
+    compressor = StreamCompressor.create()
+
+    stored = compressor.start(b"head")
+    for _ in range(10):
+        stored += compressor.compress(_VALUE)
+    stored += compressor.flush()
+
+    assert decompress_value(stored) == b"head" + _VALUE * 10
+    assert stats.compressed == 1
+    assert stats.bytes_in == 4 + len(_VALUE) * 10
+    assert stats.bytes_out == len(stored)
+
+
+def test_stored_zlib_body_is_standard(use_compression):
+    use_compression("zlib")
+
+    assert zlib.decompress(compress_value(_VALUE)[3:]) == _VALUE
@@ -0,0 +1,34 @@
+"""Fixtures for contest division metadata unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def pipeline():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+@pytest.fixture
+def mock_redis(pipeline):
+    redis = MagicMock()
+    redis.set = AsyncMock(return_value=True)
+    redis.get = AsyncMock(return_value=None)
+    redis.delete = AsyncMock()
+    redis.hgetall = AsyncMock(return_value={})
+    redis.pipeline.return_value = pipeline
+    return redis
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.get_contest_divisions = AsyncMock(
+        return_value={1000: "Div. 2", 1001: None, 1002: "Div. 1"}
+    )
+    return client
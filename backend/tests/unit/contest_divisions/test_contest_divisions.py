@@ -0,0 +1,95 @@
+"""Unit tests for contest divisions kept in Redis."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.infrastructure.codeforces_client import CodeforcesUnavailableError
+from backend.infrastructure.contest_divisions import (
+    ContestDivisionCache,
+    contest_divisions_key,
+    max_contest_id_key,
+    refresh_contest_divisions,
+)
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_writes_all_contests(mock_redis, pipeline, client):
+    assert await refresh_contest_divisions(mock_redis, client) == 3
+
+    pipeline.hset.assert_called_once_with(
+        contest_divisions_key(), mapping={1000: "Div. 2", 1001: "", 1002: "Div. 1"}
+    )
+    pipeline.set.assert_called_once_with(max_contest_id_key(), 1002)
+    pipeline.incr.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_writes_only_new_contests(mock_redis, pipeline, client):
+    mock_redis.set.side_effect = [True, False]  # Refresh lock taken, full rewrite done recently
+    mock_redis.get.return_value = b"1000"
+
+    assert await refresh_contest_divisions(mock_redis, client) == 2
+
+    pipeline.hset.assert_called_once_with(
+        contest_divisions_key(), mapping={1001: "", 1002: "Div. 1"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_no_new_contests_writes_nothing(mock_redis, pipeline, client):
+    mock_redis.set.side_effect = [True, False]
+    mock_redis.get.return_value = b"1002"
+
+    assert await refresh_contest_divisions(mock_redis, client) == 0
+    pipeline.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_refresh_runs_once_per_interval(mock_redis, client):
+    mock_redis.set.return_value = False
+
+    assert await refresh_contest_divisions(mock_redis, client) == 0
+    client.get_contest_divisions.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_releases_lock(mock_redis, client):
+    client.get_contest_divisions.side_effect = CodeforcesUnavailableError("down", 503)
+
+    with pytest.raises(CodeforcesUnavailableError):
+        await refresh_contest_divisions(mock_redis, client)
+    mock_redis.delete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_reads_hash_only_when_version_changes(mock_redis):
+    clock = MagicMock(return_value=0.0)
+    cache = ContestDivisionCache(ttl=60.0, clock=clock)
+    mock_redis.get.return_value = b"1"
+    mock_redis.hgetall.return_value = {b"1000": b"Div. 2", b"1001": b""}
+
+    assert await cache.get(mock_redis) == {1000: "Div. 2", 1001: None}
+    assert cache.version == 1
+    await cache.get(mock_redis)  # Within the TTL: no Redis access
+    assert mock_redis.get.await_count == 1
+
+    clock.return_value = 60.0
+    await cache.get(mock_redis)  # Version unchanged: hash not re-read
+    assert mock_redis.get.await_count == 2
+    assert mock_redis.hgetall.await_count == 1
+
+    clock.return_value = 120.0
+    mock_redis.get.return_value = b"2"
+    await cache.get(mock_redis)
+    assert mock_redis.hgetall.await_count == 2
+    assert cache.version == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_is_empty_before_first_refresh(mock_redis):
+    cache = ContestDivisionCache()
+
+    assert await cache.get(mock_redis) == {}
+    assert cache.version == 0
+    mock_redis.hgetall.assert_not_awaited()
@@ -0,0 +1,30 @@
+"""Fixtures for data update notification unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def pubsub():
+    """Pub/sub connection whose ``listen`` yields the messages in ``pubsub.messages``."""
+    pubsub = MagicMock()
+    pubsub.messages = []
+    pubsub.subscribe = AsyncMock()
+    pubsub.__aenter__ = AsyncMock(return_value=pubsub)
+    pubsub.__aexit__ = AsyncMock(return_value=False)
+
+    async def _listen():
+        for message in pubsub.messages:
+            yield message
+        raise ConnectionError("connection closed")
+
+    pubsub.listen = _listen
+    return pubsub
+
+
+@pytest.fixture
+def mock_redis(pubsub):
+    redis = MagicMock()
+    redis.pubsub.return_value = pubsub
+    return redis
@@ -0,0 +1,60 @@
+"""Unit tests for the data update listener."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from backend.infrastructure import data_updates
+from backend.infrastructure.data_updates import (
+    data_updates_channel,
+    listen_for_data_updates,
+    update_message,
+)
+
+
+def test_message_is_canonical_handle():
+    assert update_message(" Tourist ") == "tourist"
+
+
+@pytest.mark.asyncio
+async def test_listener_calls_handlers_and_resubscribes(mock_redis, pubsub):
+    pubsub.messages = [
+        {"type": "message", "data": b"tourist"},
+        {"type": "pong", "data": b""},
+    ]
+    received = []
+
+    async def _stop(delay):
+        raise asyncio.CancelledError
+
+    with patch("backend.infrastructure.data_updates.asyncio.sleep", side_effect=_stop):
+        with pytest.raises(asyncio.CancelledError):
+            await listen_for_data_updates(mock_redis, [received.append])
+
+    assert received == ["tourist"]
+    pubsub.subscribe.assert_awaited_once_with(data_updates_channel())
+    mock_redis.pubsub.assert_called_once_with(ignore_subscribe_messages=True)
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop_listener(monkeypatch):
+    started = asyncio.Event()
+
+    async def _listen(redis, handlers):
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(data_updates, "listen_for_data_updates", _listen)
+    monkeypatch.setattr(data_updates, "get_redis_client", lambda: None)
+
+    data_updates.start_data_update_listener()
+    listener = data_updates._listener
+    data_updates.start_data_update_listener()
+    assert data_updates._listener is listener
+    await started.wait()
+
+    await data_updates.stop_data_update_listener()
+    assert listener.cancelled()
+    assert data_updates._listener is None
+    await data_updates.stop_data_update_listener()
@@ -0,0 +1,40 @@
+"""Fixtures for handle validator unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.infrastructure.codeforces_client import UserNotFoundError
+from backend.infrastructure.handle_validator import HandleValidator
+
+
+@pytest.fixture
+def known_handles():
+    """Handles that exist on Codeforces (lowercase -> canonical spelling)."""
+    return {"tourist": "tourist", "petr": "Petr", "jiangly": "jiangly"}
+
+
+@pytest.fixture
+def client(known_handles):
+    async def _user_info(handles):
+        for handle in handles:
+            if handle.lower() not in known_handles:
+                raise UserNotFoundError(f"User '{handle}' not found on Codeforces", handle)
+        return [{"handle": known_handles[handle.lower()]} for handle in handles]
+
+    client = MagicMock()
+    client.get_user_info = AsyncMock(side_effect=_user_info)
+    return client
+
+
+@pytest.fixture
+def validator():
+    return HandleValidator(window=0.01, batch_size=100)
+
+
+@pytest.fixture
+def mock_redis():
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.setex = AsyncMock()
+    return redis
@@ -0,0 +1,119 @@
+"""Unit tests for batched handle validation."""
+
+import asyncio
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.codeforces_client import CodeforcesAPIError, UserNotFoundError
+from backend.infrastructure.handle_validator import (
+    HandleValidator,
+    handle_alias_key,
+    resolve_handle,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_handles_share_one_call(validator, client):
+    results = await asyncio.gather(
+        validator.validate(client, "tourist"),
+        validator.validate(client, "PETR"),
+        validator.validate(client, "petr"),
+    )
+
+    assert results == ["tourist", "Petr", "Petr"]
+    client.get_user_info.assert_awaited_once_with(["tourist", "PETR"])
+
+
+@pytest.mark.asyncio
+async def test_unknown_handle_is_dropped_from_batch(validator, client):
+    results = await asyncio.gather(
+        validator.validate(client, "tourist"),
+        validator.validate(client, "no_such_user"),
+        validator.validate(client, "jiangly"),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "tourist"
+    assert isinstance(results[1], UserNotFoundError)
+    assert results[2] == "jiangly"
+    assert client.get_user_info.await_count == 2
+    client.get_user_info.assert_awaited_with(["tourist", "jiangly"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("handle", ["tourist;petr", "a b", "", "x" * 25, "tourist\u2019"])
+async def test_invalid_handle_is_rejected_before_batching(validator, client, handle):
+    with pytest.raises(UserNotFoundError):
+        await validator.validate(client, handle)
+
+    client.get_user_info.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_users_are_matched_by_handle_not_position(validator, client):
+    client.get_user_info.side_effect = None
+    client.get_user_info.return_value = [{"handle": "Petr"}, {"handle": "tourist"}]
+
+    results = await asyncio.gather(
+        validator.validate(client, "tourist"),
+        validator.validate(client, "petr"),
+        validator.validate(client, "jiangly"),
+        return_exceptions=True,
+    )
+
+    assert results[:2] == ["tourist", "Petr"]
+    # Unanswered handles fail on their own instead of taking another user's answer
+    assert isinstance(results[2], UserNotFoundError)
+    assert results[2].handle == "jiangly"
+
+
+@pytest.mark.asyncio
+async def test_api_error_fails_whole_batch(validator, client):
+    client.get_user_info.side_effect = CodeforcesAPIError("down", 503)
+
+    results = await asyncio.gather(
+        validator.validate(client, "tourist"),
+        validator.validate(client, "petr"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, CodeforcesAPIError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_large_batches_are_split(client):
+    validator = HandleValidator(window=0.01, batch_size=2)
+
+    await asyncio.gather(
+        *(validator.validate(client, handle) for handle in ("tourist", "petr", "jiangly"))
+    )
+
+    assert [call.args[0] for call in client.get_user_info.await_args_list] == [
+        ["tourist", "petr"],
+        ["jiangly"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_next_request_opens_new_batch(validator, client):
+    await validator.validate(client, "tourist")
+    await validator.validate(client, "tourist")
+
+    assert client.get_user_info.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_handle_remembers_canonical_spelling(validator, client, mock_redis):
+    assert await resolve_handle(mock_redis, client, "PETR", validator) == "Petr"
+    mock_redis.setex.assert_awaited_once_with(
+        handle_alias_key("petr"), settings.handle_alias_ttl, "Petr"
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolve_handle_skips_validated_handle(validator, client, mock_redis):
+    mock_redis.get.return_value = b"Petr"
+
+    assert await resolve_handle(mock_redis, client, "petr", validator) == "Petr"
+    client.get_user_info.assert_not_awaited()
@@ -0,0 +1,20 @@
+"""Fixtures for canonical handle unit tests."""
+
+import pytest
+
+
+@pytest.fixture(params=["tourist", "Tourist", "TOURIST", " tourist "])
+def tourist_spelling(request) -> str:
+    """Spellings of the same handle that differ in case or surrounding whitespace."""
+    return request.param
+
+
+@pytest.fixture(params=["tourist", "Um_nik", "the.wizard", "-XraY-", " Petr "])
+def valid_handle(request) -> str:
+    return request.param
+
+
+@pytest.fixture(params=["", "tourist;petr", "a b", "x" * 25, "tourist&x=1"])
+def invalid_handle(request) -> str:
+    """Values that must not reach Codeforces or Redis keys."""
+    return request.param
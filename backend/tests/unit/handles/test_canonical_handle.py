@@ -0,0 +1,26 @@
+"""Unit tests for canonical handle keys."""
+
+import pytest
+
+from backend.infrastructure.handles import canonical_handle, is_valid_handle
+from backend.infrastructure.submission_cache import full_sync_key, meta_key, submissions_key
+from backend.infrastructure.task_queue import pending_task_key
+
+
+def test_canonical_handle(tourist_spelling):
+    assert canonical_handle(tourist_spelling) == "tourist"
+
+
+@pytest.mark.parametrize(
+    "key_func", [submissions_key, meta_key, full_sync_key, pending_task_key]
+)
+def test_spellings_share_keys(key_func):
+    assert key_func("Tourist") == key_func("tourist") == key_func("TOURIST")
+
+
+def test_valid_handle(valid_handle):
+    assert is_valid_handle(valid_handle)
+
+
+def test_invalid_handle(invalid_handle):
+    assert not is_valid_handle(invalid_handle)
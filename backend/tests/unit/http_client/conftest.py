@@ -0,0 +1,12 @@
+"""Fixtures for shared HTTP client unit tests."""
+
+import pytest
+
+from backend.infrastructure import http_client
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_client():
+    http_client._http_client = None
+    yield
+    http_client._http_client = None
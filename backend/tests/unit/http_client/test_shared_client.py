@@ -0,0 +1,57 @@
+"""Unit tests for the process-wide HTTP client lifecycle."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from backend.infrastructure.http_client import (
+    close_http_client,
+    create_http_client,
+    endpoint_timeout,
+    get_http_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_returns_singleton():
+    client = get_http_client()
+
+    assert get_http_client() is client
+
+    await close_http_client()
+    assert client.is_closed
+    assert get_http_client() is not client
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_close_without_client_is_noop():
+    await close_http_client()
+
+
+def test_endpoint_timeouts():
+    with patch("backend.infrastructure.http_client.settings") as settings:
+        settings.codeforces_timeout = 30.0
+        settings.codeforces_connect_timeout = 5.0
+        settings.codeforces_user_status_timeout = 120.0
+        settings.codeforces_contest_list_timeout = 60.0
+
+        user_status = endpoint_timeout("user.status")
+        default = endpoint_timeout("user.info")
+
+    assert user_status.read == 120.0
+    assert user_status.connect == 5.0
+    assert default.read == 30.0
+
+
+@pytest.mark.asyncio
+async def test_http2_falls_back_without_h2():
+    with (
+        patch("backend.infrastructure.http_client.settings.codeforces_http2", True),
+        patch("backend.infrastructure.http_client.find_spec", return_value=None),
+    ):
+        client = create_http_client()
+
+    assert isinstance(client, httpx.AsyncClient)
+    await client.aclose()
@@ -0,0 +1,54 @@
+"""Unit tests for HttpClientStats."""
+
+import httpx
+import pytest
+
+from backend.infrastructure.http_client import HttpClientStats
+
+
+@pytest.mark.asyncio
+async def test_counts_requests_and_installs_trace():
+    stats = HttpClientStats()
+    request = httpx.Request("GET", "https://codeforces.com/api/user.status")
+
+    await stats.on_request(request)
+
+    assert stats.requests == 1
+    assert callable(request.extensions["trace"])
+
+
+@pytest.mark.asyncio
+async def test_trace_counts_new_connections():
+    stats = HttpClientStats()
+    request = httpx.Request("GET", "https://codeforces.com/api/user.status")
+    await stats.on_request(request)
+    trace = request.extensions["trace"]
+
+    await trace("connection.connect_tcp.started", {})
+    await trace("connection.connect_tcp.complete", {})
+    await trace("connection.start_tls.complete", {})
+    await trace("http11.send_request_headers.complete", {})
+
+    assert stats.connections_opened == 1
+    assert stats.tls_handshakes == 1
+
+
+def test_reuse_counters():
+    stats = HttpClientStats(requests=10, connections_opened=2, tls_handshakes=2)
+
+    assert stats.reused_requests == 8
+    assert stats.reuse_ratio == 0.8
+    assert stats.as_dict() == {
+        "requests": 10,
+        "connections_opened": 2,
+        "tls_handshakes": 2,
+        "reused_requests": 8,
+        "reuse_ratio": 0.8,
+    }
+
+
+def test_empty_stats():
+    stats = HttpClientStats()
+
+    assert stats.reused_requests == 0
+    assert stats.reuse_ratio == 0.0
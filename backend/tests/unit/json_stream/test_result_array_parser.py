@@ -0,0 +1,89 @@
+"""Unit tests for ResultArrayParser."""
+
+import json
+
+import pytest
+
+from backend.infrastructure.json_stream import ResultArrayParser
+
+
+def _feed_in_chunks(parser: ResultArrayParser, text: str, size: int) -> list:
+    items = []
+    for i in range(0, len(text), size):
+        items.extend(parser.feed(text[i : i + size]))
+    return items
+
+
+DOCUMENT = {
+    "status": "OK",
+    "result": [
+        {"id": 1, "problem": {"name": "A [hard], {tricky}", "tags": ["dp", "math"]}},
+        {"id": 2, "problem": {"name": 'Quote "]"', "tags": []}},
+        {"id": 3, "problem": {"name": "Ünïcödé", "tags": ["graphs"]}},
+    ],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100_000])
+def test_items_are_extracted_for_any_chunking(chunk_size):
+    parser = ResultArrayParser()
+
+    items = _feed_in_chunks(parser, json.dumps(DOCUMENT), chunk_size)
+
+    assert items == DOCUMENT["result"]
+    assert parser.envelope() == {"status": "OK", "result": []}
+
+
+def test_items_are_returned_as_soon_as_complete():
+    parser = ResultArrayParser()
+    text = json.dumps(DOCUMENT)
+    second_item_start = text.index('{"id": 2')
+
+    items = parser.feed(text[: second_item_start + 3])
+
+    assert items == [DOCUMENT["result"][0]]
+
+
+def test_empty_result():
+    parser = ResultArrayParser()
+
+    assert _feed_in_chunks(parser, '{"status": "OK", "result": []}', 3) == []
+    assert parser.envelope() == {"status": "OK", "result": []}
+
+
+def test_failed_response_without_result():
+    parser = ResultArrayParser()
+    text = json.dumps({"status": "FAILED", "comment": "handle: User with handle x not found"})
+
+    assert _feed_in_chunks(parser, text, 5) == []
+    assert parser.envelope()["status"] == "FAILED"
+
+
+def test_fields_after_array_are_kept_in_envelope():
+    parser = ResultArrayParser()
+
+    parser.feed('{"result": [{"id": 1}], "status": "OK"}')
+
+    assert parser.envelope() == {"result": [], "status": "OK"}
+
+
+def test_truncated_body_raises():
+    parser = ResultArrayParser()
+    parser.feed('{"status": "OK", "result": [{"id": 1}, {"id"')
+
+    with pytest.raises(json.JSONDecodeError):
+        parser.envelope()
+
+
+def test_invalid_body_raises():
+    parser = ResultArrayParser()
+    parser.feed("<html>Codeforces is temporarily unavailable</html>")
+
+    with pytest.raises(json.JSONDecodeError):
+        parser.envelope()
+
+
+def test_custom_key():
+    parser = ResultArrayParser(key="rows")
+
+    assert parser.feed('{"result": 1, "rows": [1, 2, 3]}') == [1, 2, 3]
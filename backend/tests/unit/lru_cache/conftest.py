@@ -0,0 +1,10 @@
+"""Fixtures for LRU cache unit tests."""
+
+import pytest
+
+from backend.infrastructure.lru_cache import SizedLRUCache
+
+
+@pytest.fixture
+def cache() -> SizedLRUCache:
+    return SizedLRUCache(max_size=10)
@@ -0,0 +1,67 @@
+"""Unit tests for SizedLRUCache."""
+
+from backend.infrastructure.lru_cache import SizedLRUCache
+
+
+def test_get_and_put(cache):
+    cache.put("a", 1, size=3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.size == 3
+
+
+def test_evicts_least_recently_used_by_size(cache):
+    cache.put("a", 1, size=4)
+    cache.put("b", 2, size=4)
+    cache.get("a")
+
+    cache.put("c", 3, size=4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.size == 8
+
+
+def test_replacing_a_key_updates_its_size(cache):
+    cache.put("a", 1, size=4)
+    cache.put("a", 2, size=6)
+
+    assert len(cache) == 1
+    assert cache.size == 6
+    assert cache.get("a") == 2
+
+
+def test_oversized_value_is_not_cached(cache):
+    cache.put("a", 1, size=2)
+    cache.put("a", 2, size=11)
+
+    assert cache.get("a") is None
+    assert cache.size == 0
+
+
+def test_disabled():
+    cache = SizedLRUCache(max_size=0)
+    cache.put("a", 1, size=1)
+
+    assert cache.get("a") is None
+
+
+def test_discard(cache):
+    cache.put(("tourist", 1), 1, size=1)
+    cache.put(("tourist", 2), 2, size=1)
+    cache.put(("petr", 1), 3, size=1)
+
+    assert cache.discard(lambda key: key[0] == "tourist") == 2
+    assert len(cache) == 1
+    assert cache.size == 1
+
+
+def test_clear(cache):
+    cache.put("a", 1, size=5)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.size == 0
@@ -0,0 +1,42 @@
+"""Fixtures for metric response unit tests."""
+
+from datetime import datetime, timezone
+from typing import Callable
+
+import pytest
+
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def now() -> datetime:
+    return NOW
+
+
+@pytest.fixture
+def make_submission() -> Callable[..., Submission]:
+    def _create(
+        submission_id: int,
+        days_ago: float,
+        verdict: SubmissionStatus = SubmissionStatus.OK,
+        rating: int | None = 1500,
+        tags: list[str] | None = None,
+    ) -> Submission:
+        return Submission(
+            id=submission_id,
+            contest_id=1000 + submission_id,
+            creation_time_seconds=int(NOW.timestamp() - days_ago * 24 * 60 * 60),
+            problem=Problem(
+                contest_id=1000 + submission_id,
+                index="A",
+                name="Test Problem",
+                rating=rating,
+                tags=tags if tags is not None else ["dp", "math"],
+            ),
+            verdict=verdict,
+            programming_language="C++17",
+        )
+
+    return _create
@@ -0,0 +1,97 @@
+"""Unit tests for precompute_responses()."""
+
+import json
+
+from backend.domain.models.codeforces import SubmissionStatus
+from backend.domain.models.time_period import TimePeriod
+from backend.domain.services.tags_service import TagsService
+from backend.services.metric_responses import (
+    DEFAULT_WEAK_TAG_THRESHOLD,
+    division_problems_params,
+    precompute_responses,
+    tag_ratings_response,
+)
+
+ENDPOINTS = {
+    "tag-ratings",
+    "tag-ratings/weak",
+    "difficulty-distribution",
+    "division-problems",
+    "abandoned-problems/by-tags",
+    "abandoned-problems/by-ratings",
+    "daily-activity",
+}
+
+
+def _without_timestamp(body: bytes) -> dict:
+    data = json.loads(body)
+    data.pop("last_updated")
+    return data
+
+
+def test_every_endpoint_for_every_period(make_submission, now):
+    submissions = [
+        make_submission(1, days_ago=0.01),
+        make_submission(2, days_ago=100, verdict=SubmissionStatus.WRONG_ANSWER),
+        make_submission(3, days_ago=1000, rating=2000),
+    ]
+
+    responses = precompute_responses("tourist", submissions, {}, 4, now, lambda start: True)
+
+    assert len(responses) == len(ENDPOINTS) * len(TimePeriod)
+    assert {endpoint for endpoint, _, _ in responses} == ENDPOINTS
+    assert {params["period"] for _, params, _ in responses} == set(TimePeriod)
+
+
+def test_bodies_match_the_endpoint_responses(make_submission, now):
+    submissions = [make_submission(1, days_ago=10), make_submission(2, days_ago=1000)]
+
+    responses = precompute_responses("tourist", submissions, {}, 4, now, lambda start: True)
+    bodies = {(endpoint, json.dumps(params)): body for endpoint, params, body in responses}
+
+    month = tag_ratings_response(TagsService(), "tourist", submissions[:1])
+    assert _without_timestamp(
+        bodies[("tag-ratings", json.dumps({"period": TimePeriod.MONTH}))]
+    ) == _without_timestamp(month.model_dump_json().encode())
+
+    weak = json.loads(
+        bodies[
+            (
+                "tag-ratings/weak",
+                json.dumps(
+                    {"period": TimePeriod.ALL_TIME, "threshold": DEFAULT_WEAK_TAG_THRESHOLD}
+                ),
+            )
+        ]
+    )
+    assert weak["threshold_used"] == DEFAULT_WEAK_TAG_THRESHOLD
+    assert weak["total_solved"] == 2
+
+
+def test_uncovered_periods_are_skipped(make_submission, now):
+    submissions = [make_submission(1, days_ago=1)]
+    covers_from = now.timestamp() - 7 * 24 * 60 * 60
+
+    responses = precompute_responses(
+        "tourist",
+        submissions,
+        {},
+        4,
+        now,
+        lambda start: start is not None and start.timestamp() >= covers_from,
+    )
+
+    assert {params["period"] for _, params, _ in responses} == {
+        TimePeriod.HOUR,
+        TimePeriod.DAY,
+        TimePeriod.WEEK,
+    }
+
+
+def test_division_bodies_carry_the_divisions_version(make_submission, now):
+    responses = precompute_responses(
+        "tourist", [make_submission(1, days_ago=1)], {1000: "Div. 2"}, 4, now, lambda start: True
+    )
+
+    division_params = [params for name, params, _ in responses if name == "division-problems"]
+    assert division_params == [division_problems_params(period, 4) for period in TimePeriod]
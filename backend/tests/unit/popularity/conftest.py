@@ -0,0 +1,23 @@
+"""Fixtures for popularity tracking unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def pipeline():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+@pytest.fixture
+def mock_redis(pipeline):
+    redis = MagicMock()
+    redis.set = AsyncMock(return_value=True)
+    redis.zrevrangebyscore = AsyncMock(return_value=[])
+    redis.pipeline.return_value = pipeline
+    return redis
@@ -0,0 +1,90 @@
+"""Unit tests for per-handle popularity tracking."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.popularity import (
+    DECAY_INTERVAL,
+    PageViews,
+    decay_lock_key,
+    decay_popularity,
+    popular_handles,
+    record_access,
+)
+
+
+def test_record_access_increments_score(pipeline):
+    record_access(pipeline, "Tourist")
+
+    pipeline.zincrby.assert_called_once_with(settings.popularity_key, 1, "tourist")
+
+
+@pytest.mark.asyncio
+async def test_decay_scales_scores_and_prunes(mock_redis, pipeline):
+    assert await decay_popularity(mock_redis) is True
+
+    mock_redis.set.assert_awaited_once_with(decay_lock_key(), 1, nx=True, ex=DECAY_INTERVAL)
+    key = settings.popularity_key
+    factor = 0.5 ** (DECAY_INTERVAL / settings.popularity_half_life)
+    pipeline.zunionstore.assert_called_once_with(key, {key: factor})
+    pipeline.zremrangebyscore.assert_called_once_with(key, "-inf", "(0.1")
+    pipeline.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_decay_runs_once_per_interval(mock_redis, pipeline):
+    mock_redis.set.return_value = None
+
+    assert await decay_popularity(mock_redis) is False
+
+    pipeline.execute.assert_not_awaited()
+
+
+def test_half_life_halves_score():
+    steps = settings.popularity_half_life / DECAY_INTERVAL
+    factor = 0.5 ** (DECAY_INTERVAL / settings.popularity_half_life)
+
+    assert factor**steps == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_popular_handles(mock_redis):
+    mock_redis.zrevrangebyscore.return_value = [b"tourist", b"petr"]
+
+    handles = await popular_handles(mock_redis, limit=10, min_score=3.0)
+
+    assert handles == ["tourist", "petr"]
+    mock_redis.zrevrangebyscore.assert_awaited_once_with(
+        settings.popularity_key, "+inf", 3.0, start=0, num=10
+    )
+
+
+def test_page_view_is_counted_once_per_window():
+    clock = MagicMock(return_value=0.0)
+    views = PageViews(window=60, clock=clock)
+
+    # A page loads every metric of a handle at once
+    assert [views.is_new_view(handle) for handle in ("tourist", "Tourist", "petr")] == [
+        True,
+        False,
+        True,
+    ]
+
+    clock.return_value = 59.0
+    assert not views.is_new_view("tourist")
+    clock.return_value = 60.0
+    assert views.is_new_view("tourist")
+
+
+def test_ended_page_views_are_forgotten():
+    clock = MagicMock(return_value=0.0)
+    views = PageViews(window=60, clock=clock)
+    for i in range(100):
+        views.is_new_view(f"user{i}")
+
+    clock.return_value = 61.0
+    views.is_new_view("tourist")
+
+    assert list(views._counted) == ["tourist"]
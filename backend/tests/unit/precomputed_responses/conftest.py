@@ -0,0 +1,17 @@
+"""Fixtures for precomputed response unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def mock_redis():
+    redis = MagicMock()
+    redis.hmget = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    redis.pipeline.return_value = pipe
+    return redis
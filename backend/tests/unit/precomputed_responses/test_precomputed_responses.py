@@ -0,0 +1,87 @@
+"""Unit tests for precomputed metric responses in Redis."""
+
+import time
+
+import pytest
+
+from backend.infrastructure.precomputed_responses import (
+    load_precomputed_response,
+    precomputed_responses_key,
+    response_field,
+    store_precomputed_responses,
+)
+
+
+def test_field_ignores_param_order():
+    assert response_field("tag-ratings/weak", {"period": "all_time", "threshold": 200}) == (
+        response_field("tag-ratings/weak", {"threshold": 200, "period": "all_time"})
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_replaces_the_hash(mock_redis):
+    pipe = mock_redis.pipeline.return_value
+
+    await store_precomputed_responses(
+        mock_redis,
+        "Tourist",
+        version=7,
+        responses=[("tag-ratings", {"period": "all_time"}, b'{"tags":[]}')],
+        computed_at=1000.0,
+        expire=3600,
+    )
+
+    key = precomputed_responses_key("tourist")
+    pipe.delete.assert_called_once_with(key)
+    pipe.hset.assert_called_once_with(
+        key,
+        mapping={
+            response_field("tag-ratings", {"period": "all_time"}): b'{"tags":[]}',
+            "version": "7",
+            "computed_at": "1000.0",
+        },
+    )
+    pipe.expire.assert_called_once_with(key, 3600)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_load(mock_redis):
+    mock_redis.hmget.return_value = [b"7", str(time.time()).encode(), b"{}"]
+
+    body, age = await load_precomputed_response(mock_redis, "tourist", "tag-ratings", {}, 7)
+
+    assert body == b"{}"
+    assert 0 <= age < 5
+    mock_redis.hmget.assert_awaited_once_with(
+        precomputed_responses_key("tourist"),
+        ["version", "computed_at", response_field("tag-ratings", {})],
+    )
+
+
+@pytest.mark.asyncio
+async def test_other_version_is_ignored(mock_redis):
+    mock_redis.hmget.return_value = [b"6", str(time.time()).encode(), b"{}"]
+
+    assert await load_precomputed_response(mock_redis, "tourist", "tag-ratings", {}, 7) is None
+
+
+@pytest.mark.asyncio
+async def test_missing_response(mock_redis):
+    mock_redis.hmget.return_value = [None, None, None]
+
+    assert await load_precomputed_response(mock_redis, "tourist", "tag-ratings", {}, 7) is None
+
+
+@pytest.mark.asyncio
+async def test_max_age(mock_redis):
+    mock_redis.hmget.return_value = [b"7", str(time.time() - 120).encode(), b"{}"]
+
+    assert await load_precomputed_response(
+        mock_redis, "tourist", "tag-ratings", {}, 7, max_age=60
+    ) is None
+    body, age = await load_precomputed_response(
+        mock_redis, "tourist", "tag-ratings", {}, 7, max_age=600
+    )
+    assert body == b"{}"
+    assert age == pytest.approx(120, abs=5)
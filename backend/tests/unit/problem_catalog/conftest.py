@@ -0,0 +1,44 @@
+"""Fixtures for problem catalog unit tests."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.domain.models.codeforces import Problem
+
+
+@pytest.fixture
+def pipeline():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+@pytest.fixture
+def catalog_entries():
+    """Raw catalog hash as stored in Redis."""
+    return {
+        "1000/A": json.dumps({"name": "Watermelon", "rating": 800, "tags": ["math"]}),
+        "1000/B": json.dumps({"name": "Domino", "rating": None, "tags": []}),
+    }
+
+
+@pytest.fixture
+def mock_redis(pipeline, catalog_entries):
+    redis = MagicMock()
+    redis.set = AsyncMock(return_value=True)
+    redis.delete = AsyncMock()
+    redis.hset = AsyncMock()
+    redis.hmget = AsyncMock(
+        side_effect=lambda key, fields: [catalog_entries.get(field) for field in fields]
+    )
+    redis.pipeline.return_value = pipeline
+    return redis
+
+
+@pytest.fixture
+def problem():
+    return Problem(contest_id=1000, index="A", name="Watermelon", rating=800, tags=["math"])
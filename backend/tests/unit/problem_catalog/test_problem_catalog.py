@@ -0,0 +1,119 @@
+"""Unit tests for the shared problem catalog."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+from backend.infrastructure.problem_catalog import (
+    ProblemCatalog,
+    add_problems,
+    problem_catalog_key,
+    problem_ref,
+    refresh_problem_catalog,
+)
+from backend.infrastructure.submission_cache import load_submissions, serialize_submissions
+
+
+def test_problem_ref(problem):
+    assert problem_ref(problem) == "1000/A"
+
+
+@pytest.mark.asyncio
+async def test_add_problems_keeps_existing_entries(mock_redis, pipeline, problem):
+    placeholder = Problem(contest_id=1000, index="C", name="")
+
+    await add_problems(mock_redis, [problem, problem, placeholder])
+
+    pipeline.hsetnx.assert_called_once()
+    key, ref, value = pipeline.hsetnx.call_args.args
+    assert (key, ref) == (problem_catalog_key(), "1000/A")
+    assert json.loads(value) == {"name": "Watermelon", "rating": 800, "tags": ["math"]}
+
+
+@pytest.mark.asyncio
+async def test_add_problems_without_problems(mock_redis):
+    await add_problems(mock_redis, [])
+
+    mock_redis.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_rewrites_catalog(mock_redis, problem):
+    client = MagicMock()
+    client.get_problemset_problems = AsyncMock(return_value=[problem])
+
+    assert await refresh_problem_catalog(mock_redis, client) == 1
+    mapping = mock_redis.hset.await_args.kwargs["mapping"]
+    assert list(mapping) == ["1000/A"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_runs_once_per_interval(mock_redis):
+    mock_redis.set.return_value = False
+    client = MagicMock()
+    client.get_problemset_problems = AsyncMock()
+
+    assert await refresh_problem_catalog(mock_redis, client) == 0
+    client.get_problemset_problems.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_releases_lock(mock_redis):
+    client = MagicMock()
+    client.get_problemset_problems = AsyncMock(side_effect=RuntimeError("down"))
+
+    with pytest.raises(RuntimeError):
+        await refresh_problem_catalog(mock_redis, client)
+    mock_redis.delete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_resolve_caches_problems_locally(mock_redis, problem):
+    catalog = ProblemCatalog(ttl=3600)
+
+    problems = await catalog.resolve(mock_redis, ["1000/A", "1000/B", "1000/Z"])
+
+    assert problems["1000/A"] == problem
+    assert problems["1000/B"].rating is None
+    assert problems["1000/Z"] == Problem(contest_id=1000, index="Z", name="")
+
+    again = await catalog.resolve(mock_redis, ["1000/A"])
+    assert again["1000/A"] is problems["1000/A"]
+    assert mock_redis.hmget.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_reloads_after_ttl(mock_redis):
+    clock = MagicMock(return_value=0.0)
+    catalog = ProblemCatalog(ttl=60, clock=clock)
+
+    await catalog.resolve(mock_redis, ["1000/A"])
+    clock.return_value = 60.0
+    await catalog.resolve(mock_redis, ["1000/A"])
+
+    assert mock_redis.hmget.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_submissions_rehydrates_problems(mock_redis, problem):
+    submissions = [
+        Submission(
+            id=i,
+            contest_id=1000,
+            creation_time_seconds=1609459200 + i,
+            problem=problem,
+            verdict=SubmissionStatus.OK,
+            programming_language="C++17",
+        )
+        for i in (2, 1)
+    ]
+
+    with patch(
+        "backend.infrastructure.submission_cache._problem_catalog", ProblemCatalog()
+    ):
+        loaded = await load_submissions(mock_redis, serialize_submissions(submissions))
+
+    assert loaded == submissions
+    assert loaded[0].problem is loaded[1].problem
@@ -0,0 +1,18 @@
+"""Fixtures for rate limiter unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def gcra_script() -> AsyncMock:
+    """Stand-in for the registered GCRA Lua script; returns the wait in microseconds."""
+    return AsyncMock(return_value=0)
+
+
+@pytest.fixture
+def mock_redis(gcra_script) -> MagicMock:
+    redis = MagicMock()
+    redis.register_script = MagicMock(return_value=gcra_script)
+    return redis
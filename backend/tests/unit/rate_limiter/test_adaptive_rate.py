@@ -0,0 +1,48 @@
+"""Unit tests for AIMD rate adaptation in RedisRateLimiter."""
+
+import pytest
+
+from backend.infrastructure.rate_limiter import RateLimiter, RedisRateLimiter
+
+
+def test_throttling_halves_rate(mock_redis):
+    limiter = RedisRateLimiter(mock_redis, rate=4, min_rate=0.5, decrease_factor=0.5)
+
+    limiter.on_throttled()
+
+    assert limiter.rate == 2
+    assert limiter.stats.throttled == 1
+
+
+def test_rate_never_drops_below_min(mock_redis):
+    limiter = RedisRateLimiter(mock_redis, rate=4, min_rate=1, decrease_factor=0.5)
+
+    for _ in range(10):
+        limiter.on_throttled()
+
+    assert limiter.rate == 1
+
+
+def test_success_recovers_additively_up_to_max(mock_redis):
+    limiter = RedisRateLimiter(mock_redis, rate=4, min_rate=0.5, increase_step=0.5)
+    limiter.on_throttled()
+
+    limiter.on_success()
+    assert limiter.rate == pytest.approx(2.5)
+
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == 4
+
+
+def test_min_rate_is_capped_by_rate(mock_redis):
+    assert RedisRateLimiter(mock_redis, rate=0.2, min_rate=0.5).min_rate == 0.2
+
+
+def test_local_limiter_feedback_is_noop():
+    limiter = RateLimiter(max_requests=5)
+
+    limiter.on_success()
+    limiter.on_throttled()
+
+    assert limiter.max_requests == 5
@@ -0,0 +1,28 @@
+"""Unit tests for the in-process token bucket RateLimiter."""
+
+import pytest
+
+from backend.infrastructure.rate_limiter import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_burst_is_not_delayed():
+    limiter = RateLimiter(max_requests=3, time_window=1.0)
+
+    waits = [await limiter.acquire() for _ in range(3)]
+
+    assert all(wait < 0.05 for wait in waits)
+    assert limiter.stats.acquisitions == 3
+
+
+@pytest.mark.asyncio
+async def test_waits_when_bucket_is_empty():
+    limiter = RateLimiter(max_requests=20, time_window=1.0)
+    for _ in range(20):
+        await limiter.acquire()
+
+    waited = await limiter.acquire()
+
+    assert 0.02 < waited < 0.2
+    assert limiter.stats.waited_acquisitions >= 1
+    assert limiter.stats.max_wait == pytest.approx(waited, abs=0.01)
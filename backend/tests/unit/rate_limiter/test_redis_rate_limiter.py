@@ -0,0 +1,65 @@
+"""Unit tests for RedisRateLimiter."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from backend.infrastructure.rate_limiter import RedisRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_passes_interval_and_tolerance(mock_redis, gcra_script):
+    limiter = RedisRateLimiter(mock_redis, rate=4, burst=3, key="rl:test")
+
+    waited = await limiter.acquire()
+
+    assert waited == 0
+    gcra_script.assert_awaited_once_with(keys=["rl:test"], args=[250_000, 500_000])
+
+
+@pytest.mark.asyncio
+async def test_sleeps_for_reserved_slot(mock_redis, gcra_script):
+    gcra_script.return_value = 150_000
+    limiter = RedisRateLimiter(mock_redis, rate=5)
+
+    with patch("backend.infrastructure.rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+        waited = await limiter.acquire()
+
+    assert waited == 0.15
+    sleep.assert_awaited_once_with(0.15)
+    assert limiter.stats.as_dict() == {
+        "acquisitions": 1,
+        "waited_acquisitions": 1,
+        "total_wait": 0.15,
+        "max_wait": 0.15,
+        "fallbacks": 0,
+        "throttled": 0,
+        "average_wait": 0.15,
+    }
+
+
+@pytest.mark.asyncio
+async def test_rate_changes_apply_to_next_acquire(mock_redis, gcra_script):
+    limiter = RedisRateLimiter(mock_redis, rate=5)
+
+    limiter.rate = 2
+    await limiter.acquire()
+
+    assert gcra_script.call_args[1]["args"][0] == 500_000
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_limiter(mock_redis, gcra_script):
+    gcra_script.side_effect = RedisConnectionError("down")
+    limiter = RedisRateLimiter(mock_redis, rate=5)
+
+    waited = await limiter.acquire()
+
+    assert waited < 0.05
+    assert limiter.stats.fallbacks == 1
+    assert limiter.stats.acquisitions == 1
+
+
+def test_burst_is_at_least_one(mock_redis):
+    assert RedisRateLimiter(mock_redis, rate=5, burst=0).burst == 1
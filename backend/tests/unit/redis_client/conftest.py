@@ -0,0 +1,12 @@
+"""Fixtures for shared Redis client unit tests."""
+
+import pytest
+
+from backend.infrastructure import redis_client
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_client():
+    redis_client._redis_client = None
+    yield
+    redis_client._redis_client = None
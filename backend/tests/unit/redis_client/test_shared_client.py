@@ -0,0 +1,53 @@
+"""Unit tests for the process-wide Redis client lifecycle."""
+
+import pytest
+from redis.asyncio import BlockingConnectionPool
+
+from backend.api.app import create_app
+from backend.api.deps import get_redis, get_task_queue
+from backend.config import settings
+from backend.infrastructure.redis_client import (
+    close_redis_client,
+    create_redis_client,
+    get_redis_client,
+)
+
+
+def test_pool_is_bounded(monkeypatch):
+    monkeypatch.setattr(settings, "redis_max_connections", 7)
+    monkeypatch.setattr(settings, "redis_pool_timeout", 1.5)
+    monkeypatch.setattr(settings, "redis_health_check_interval", 11)
+
+    pool = create_redis_client().connection_pool
+
+    assert isinstance(pool, BlockingConnectionPool)
+    assert pool.max_connections == 7
+    assert pool.timeout == 1.5
+    assert pool.connection_kwargs["health_check_interval"] == 11
+    assert pool.connection_kwargs["decode_responses"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_redis_client_returns_singleton():
+    client = get_redis_client()
+
+    assert get_redis_client() is client
+
+    await close_redis_client()
+    assert get_redis_client() is not client
+    await close_redis_client()
+
+
+@pytest.mark.asyncio
+async def test_close_without_client_is_noop():
+    await close_redis_client()
+
+
+def test_dependencies_and_stores_share_the_client():
+    client = get_redis_client()
+    app = create_app()
+
+    assert get_redis() is client
+    assert get_task_queue().redis is client
+    assert app.stores.get("default")._redis is client
+    assert app.stores.get("rate_limit")._redis is client
@@ -0,0 +1,23 @@
+"""Fixtures for response cache unit tests."""
+
+import pytest
+
+from backend.infrastructure.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock) -> ResponseCache:
+    return ResponseCache(max_bytes=100, ttl=300, clock=clock)
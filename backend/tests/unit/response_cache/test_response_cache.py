@@ -0,0 +1,85 @@
+"""Unit tests for ResponseCache."""
+
+from backend.infrastructure.response_cache import response_key
+
+
+def test_key_ignores_handle_case_and_param_order():
+    assert response_key("tag-ratings", "Tourist", {"a": 1, "b": 2}, 7) == response_key(
+        "tag-ratings", "tourist", {"b": 2, "a": 1}, 7
+    )
+
+
+def test_key_depends_on_endpoint_params_and_version():
+    key = response_key("tag-ratings", "tourist", {"period": "month"}, 7)
+
+    assert key != response_key("daily-activity", "tourist", {"period": "month"}, 7)
+    assert key != response_key("tag-ratings", "tourist", {"period": "year"}, 7)
+    assert key != response_key("tag-ratings", "tourist", {"period": "month"}, 8)
+
+
+def test_get_and_put(cache):
+    key = response_key("tag-ratings", "tourist", {}, 1)
+    cache.put(key, b'{"tags":[]}')
+
+    assert cache.get(key) == b'{"tags":[]}'
+    assert cache.get(response_key("tag-ratings", "tourist", {}, 2)) is None
+
+
+def test_bodies_expire_after_ttl(cache, clock):
+    key = response_key("tag-ratings", "tourist", {}, 1)
+    cache.put(key, b"{}")
+
+    clock.now = 299
+    assert cache.get(key) == b"{}"
+
+    clock.now = 300
+    assert cache.get(key) is None
+    assert cache.get(key) is None
+
+
+def test_size_is_bounded_by_bytes(cache):
+    first = response_key("tag-ratings", "tourist", {}, 1)
+    second = response_key("tag-ratings", "petr", {}, 1)
+    cache.put(first, b"x" * 60)
+    cache.put(second, b"x" * 60)
+
+    assert cache.get(first) is None
+    assert cache.get(second) is not None
+
+
+def test_evict_handle(cache):
+    tourist = response_key("tag-ratings", "tourist", {}, 1)
+    petr = response_key("tag-ratings", "petr", {}, 1)
+    cache.put(tourist, b"{}")
+    cache.put(petr, b"{}")
+
+    cache.evict_handle("Tourist")
+
+    assert cache.get(tourist) is None
+    assert cache.get(petr) == b"{}"
+
+
+def test_shorter_ttl_per_body(cache, clock):
+    key = response_key("daily-activity", "tourist", {"period": "hour"}, 1)
+    cache.put(key, b"{}", ttl=36)
+
+    clock.now = 35
+    assert cache.get(key) == b"{}"
+
+    clock.now = 36
+    assert cache.get(key) is None
+
+
+def test_ttl_per_body_is_capped(cache, clock):
+    key = response_key("tag-ratings", "tourist", {}, 1)
+    cache.put(key, b"{}", ttl=10_000)
+
+    clock.now = 300
+    assert cache.get(key) is None
+
+
+def test_expired_body_is_not_cached(cache):
+    key = response_key("tag-ratings", "tourist", {}, 1)
+    cache.put(key, b"{}", ttl=-1)
+
+    assert cache.get(key) is None
@@ -0,0 +1,33 @@
+"""Fixtures for submission cache unit tests."""
+
+from typing import Callable
+
+import pytest
+
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+
+
+@pytest.fixture
+def make_submission() -> Callable[..., Submission]:
+    def _create(
+        submission_id: int,
+        verdict: SubmissionStatus = SubmissionStatus.OK,
+        rating: int | None = 1500,
+        tags: list[str] | None = None,
+    ) -> Submission:
+        return Submission(
+            id=submission_id,
+            contest_id=1000,
+            creation_time_seconds=1609459200 + submission_id,
+            problem=Problem(
+                contest_id=1000,
+                index="A",
+                name="Test Problem",
+                rating=rating,
+                tags=tags if tags is not None else ["dp", "math"],
+            ),
+            verdict=verdict,
+            programming_language="C++17",
+        )
+
+    return _create
@@ -0,0 +1,189 @@
+"""Unit tests for cached submission metadata (fetch time and fresh TTL)."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.cache_policy import CacheTtl
+from backend.infrastructure.submission_cache import (
+    CacheAge,
+    CacheEntry,
+    meta_key,
+    read_cache_entry,
+    save_cache_meta,
+    submissions_key,
+)
+
+
+@pytest.fixture
+def mock_redis():
+    redis = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    redis.pipeline.return_value = pipe
+    return redis
+
+
+def test_cache_age_staleness():
+    assert CacheAge(age=100, fresh_ttl=300).fresh_for == 200
+    assert not CacheAge(age=100, fresh_ttl=300).is_stale
+    assert CacheAge(age=301, fresh_ttl=300).is_stale
+    assert CacheAge(age=301, fresh_ttl=300).fresh_for == 0
+
+
+def test_cache_age_partial_coverage():
+    covers_from = int(datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp())
+    partial = CacheAge(age=0, fresh_ttl=300, covers_from=covers_from)
+
+    assert partial.partial
+    assert partial.covers(datetime(2024, 7, 1, tzinfo=timezone.utc))
+    assert not partial.covers(datetime(2024, 5, 1, tzinfo=timezone.utc))
+    assert not partial.covers(None)
+    assert CacheAge(age=0, fresh_ttl=300).covers(None)
+
+
+@pytest.mark.asyncio
+async def test_save_cache_meta(mock_redis):
+    await save_cache_meta(mock_redis, "tourist", CacheTtl(fresh=600, expire=3600), fetched_at=10)
+
+    pipe = mock_redis.pipeline.return_value
+    pipe.hset.assert_called_once_with(
+        meta_key("tourist"), mapping={"fetched_at": 10, "fresh_ttl": 600}
+    )
+    pipe.expire.assert_any_call(meta_key("tourist"), 3600)
+    pipe.expire.assert_any_call(submissions_key("tourist"), 3600)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_save_cache_meta_partial(mock_redis):
+    ttl = CacheTtl(fresh=600, expire=3600)
+    pipe = mock_redis.pipeline.return_value
+
+    await save_cache_meta(mock_redis, "tourist", ttl, fetched_at=10, covers_from=5)
+    pipe.hset.assert_called_with(meta_key("tourist"), "covers_from", 5)
+
+    await save_cache_meta(mock_redis, "tourist", ttl, fetched_at=20)
+    pipe.hdel.assert_called_once_with(meta_key("tourist"), "covers_from")
+
+
+@pytest.mark.asyncio
+async def test_save_cache_meta_with_payload(mock_redis):
+    ttl = CacheTtl(fresh=600, expire=3600)
+    pipe = mock_redis.pipeline.return_value
+
+    with patch("backend.infrastructure.submission_cache.time.time_ns", return_value=42):
+        await save_cache_meta(mock_redis, "tourist", ttl, fetched_at=10, payload=b"data")
+
+    mock_redis.pipeline.assert_called_once_with(transaction=True)
+    pipe.set.assert_called_once_with(submissions_key("tourist"), b"data", ex=3600)
+    pipe.hset.assert_called_once_with(
+        meta_key("tourist"), mapping={"fetched_at": 10, "fresh_ttl": 600, "version": 42}
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_cache_meta_with_version(mock_redis):
+    await save_cache_meta(
+        mock_redis, "tourist", CacheTtl(fresh=600, expire=3600), fetched_at=10, version=7
+    )
+
+    pipe = mock_redis.pipeline.return_value
+    pipe.set.assert_not_called()
+    pipe.hset.assert_called_once_with(
+        meta_key("tourist"), mapping={"fetched_at": 10, "fresh_ttl": 600, "version": 7}
+    )
+
+
+def _stored(mock_redis, payload, meta, ttl=-1):
+    mock_redis.pipeline.return_value.execute.return_value = [payload, meta, ttl]
+
+
+@pytest.mark.asyncio
+async def test_read_cache_entry_in_one_round_trip(mock_redis):
+    _stored(mock_redis, b"data", [b"1000", b"600", None, b"42"], ttl=3000)
+
+    with patch("backend.infrastructure.submission_cache.time.time", return_value=1250):
+        entry = await read_cache_entry(mock_redis, "tourist")
+
+    assert entry == CacheEntry(
+        payload=b"data", cache_age=CacheAge(age=250, fresh_ttl=600), version=42
+    )
+    pipe = mock_redis.pipeline.return_value
+    mock_redis.pipeline.assert_called_once_with(transaction=True)
+    pipe.get.assert_called_once_with(submissions_key("tourist"))
+    pipe.hmget.assert_called_once_with(
+        meta_key("tourist"), "fetched_at", "fresh_ttl", "covers_from", "version"
+    )
+    pipe.zincrby.assert_not_called()
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_read_cache_entry_counts_access_in_same_round_trip(mock_redis):
+    mock_redis.pipeline.return_value.execute.return_value = [
+        1,
+        [b"1000", b"600", None, b"1"],
+        3000,
+        1.0,
+    ]
+
+    with patch("backend.infrastructure.submission_cache.time.time", return_value=1250):
+        entry = await read_cache_entry(
+            mock_redis, "Tourist", with_payload=False, count_access=True
+        )
+
+    assert entry.cache_age.age == 250
+    pipe = mock_redis.pipeline.return_value
+    pipe.zincrby.assert_called_once_with(settings.popularity_key, 1, "tourist")
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_read_cache_entry_partial(mock_redis):
+    _stored(mock_redis, b"data", [b"1000", b"600", b"900", b"1"])
+
+    with patch("backend.infrastructure.submission_cache.time.time", return_value=1250):
+        entry = await read_cache_entry(mock_redis, "tourist")
+
+    assert entry.cache_age == CacheAge(age=250, fresh_ttl=600, covers_from=900)
+
+
+@pytest.mark.asyncio
+async def test_read_cache_entry_without_payload(mock_redis):
+    _stored(mock_redis, 1, [b"1000", b"600", None, b"1"])
+
+    with patch("backend.infrastructure.submission_cache.time.time", return_value=1250):
+        entry = await read_cache_entry(mock_redis, "tourist", with_payload=False)
+
+    assert entry.payload is None
+    assert entry.cache_age.age == 250
+    mock_redis.pipeline.return_value.exists.assert_called_once_with(submissions_key("tourist"))
+
+
+@pytest.mark.asyncio
+async def test_read_cache_entry_legacy_entry(mock_redis):
+    _stored(mock_redis, b"data", [None, None, None, None], ttl=settings.cache_stale_ttl - 500)
+
+    entry = await read_cache_entry(mock_redis, "tourist")
+
+    assert entry.cache_age == CacheAge(age=500, fresh_ttl=settings.cache_fresh_ttl)
+    assert entry.version is None
+
+
+@pytest.mark.asyncio
+async def test_read_cache_entry_without_ttl(mock_redis):
+    _stored(mock_redis, b"data", [None, None, None, None], ttl=-1)
+
+    assert await read_cache_entry(mock_redis, "tourist") is None
+
+
+@pytest.mark.asyncio
+async def test_read_cache_entry_not_cached(mock_redis):
+    _stored(mock_redis, None, [None, None, None, None], ttl=-2)
+
+    assert await read_cache_entry(mock_redis, "tourist") is None
@@ -0,0 +1,130 @@
+"""Unit tests for the process-local cache of decoded submissions."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.infrastructure import submission_cache
+from backend.infrastructure.cache_policy import CacheTtl
+from backend.infrastructure.data_updates import data_updates_channel
+from backend.infrastructure.lru_cache import SizedLRUCache
+from backend.infrastructure.submission_cache import (
+    CacheAge,
+    CacheEntry,
+    evict_local_submissions,
+    load_cached_submissions,
+    save_cache_meta,
+    serialize_submissions,
+)
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch):
+    cache = SizedLRUCache(max_size=100)
+    monkeypatch.setattr(submission_cache, "_decoded_submissions", cache)
+    return cache
+
+
+@pytest.fixture
+def mock_redis():
+    redis = MagicMock()
+    redis.hmget = AsyncMock(side_effect=lambda key, fields: [None] * len(fields))
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    redis.pipeline.return_value = pipe
+    return redis
+
+
+def _entry(version):
+    return CacheEntry(payload=None, cache_age=CacheAge(age=0, fresh_ttl=600), version=version)
+
+
+def _stored(mock_redis, submissions, version):
+    meta = [b"1000", b"600", None, str(version).encode() if version is not None else None]
+    mock_redis.pipeline.return_value.execute.return_value = [
+        serialize_submissions(submissions),
+        meta,
+        3600,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_decoded_submissions_are_reused_per_version(mock_redis, make_submission):
+    _stored(mock_redis, [make_submission(2), make_submission(1)], version=7)
+
+    first = await load_cached_submissions(mock_redis, "Tourist", _entry(7))
+    second = await load_cached_submissions(mock_redis, "tourist", _entry(7))
+
+    assert [s.id for s in first] == [2, 1]
+    assert second is first
+    mock_redis.pipeline.return_value.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_new_version_is_loaded(mock_redis, make_submission, local_cache):
+    _stored(mock_redis, [make_submission(1)], version=7)
+    await load_cached_submissions(mock_redis, "tourist", _entry(7))
+
+    _stored(mock_redis, [make_submission(2), make_submission(1)], version=8)
+    result = await load_cached_submissions(mock_redis, "tourist", _entry(8))
+
+    assert [s.id for s in result] == [2, 1]
+    assert local_cache.size == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_under_the_version_read_with_the_payload(
+    mock_redis, make_submission, local_cache
+):
+    # The worker wrote version 8 between the metadata read and the payload read
+    _stored(mock_redis, [make_submission(1)], version=8)
+
+    await load_cached_submissions(mock_redis, "tourist", _entry(7))
+
+    assert local_cache.get(("tourist", 8)) is not None
+    assert local_cache.get(("tourist", 7)) is None
+
+
+@pytest.mark.asyncio
+async def test_unversioned_entries_are_not_kept(mock_redis, make_submission, local_cache):
+    _stored(mock_redis, [make_submission(1)], version=None)
+
+    assert await load_cached_submissions(mock_redis, "tourist", _entry(None))
+    assert len(local_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_entry(mock_redis):
+    mock_redis.pipeline.return_value.execute.return_value = [None, [None] * 4, -2]
+
+    assert await load_cached_submissions(mock_redis, "tourist", _entry(7)) is None
+
+
+def test_evict_local_submissions(local_cache):
+    local_cache.put(("tourist", 1), [], size=1)
+    local_cache.put(("petr", 1), [], size=1)
+
+    evict_local_submissions("Tourist")
+
+    assert local_cache.get(("tourist", 1)) is None
+    assert local_cache.get(("petr", 1)) == []
+
+
+@pytest.mark.asyncio
+async def test_new_data_is_published(mock_redis):
+    pipe = mock_redis.pipeline.return_value
+
+    await save_cache_meta(mock_redis, "Tourist", CacheTtl(fresh=600, expire=3600), version=3)
+
+    pipe.publish.assert_called_once_with(data_updates_channel(), "tourist")
+
+
+@pytest.mark.asyncio
+async def test_unchanged_data_is_not_published(mock_redis):
+    pipe = mock_redis.pipeline.return_value
+
+    await save_cache_meta(mock_redis, "tourist", CacheTtl(fresh=600, expire=3600))
+
+    pipe.publish.assert_not_called()
@@ -0,0 +1,29 @@
+"""Unit tests for merge_submissions."""
+
+from backend.domain.models.codeforces import SubmissionStatus
+from backend.infrastructure.submission_cache import merge_submissions
+
+
+def test_new_rows_are_prepended(make_submission):
+    cached = [make_submission(3), make_submission(2)]
+    new = [make_submission(5), make_submission(4)]
+
+    result = merge_submissions(new, cached)
+
+    assert [s.id for s in result] == [5, 4, 3, 2]
+
+
+def test_fresh_rows_override_cached(make_submission):
+    cached = [make_submission(2, verdict=SubmissionStatus.WRONG_ANSWER), make_submission(1)]
+    new = [make_submission(2, verdict=SubmissionStatus.OK)]
+
+    result = merge_submissions(new, cached)
+
+    assert [s.id for s in result] == [2, 1]
+    assert result[0].verdict == SubmissionStatus.OK
+
+
+def test_empty_inputs(make_submission):
+    assert merge_submissions([], []) == []
+    assert [s.id for s in merge_submissions([], [make_submission(1)])] == [1]
+    assert [s.id for s in merge_submissions([make_submission(1)], [])] == [1]
@@ -0,0 +1,107 @@
+"""Unit tests for submission cache serialization helpers."""
+
+import json
+
+from backend.domain.models.codeforces import Problem, SubmissionStatus
+from backend.infrastructure.compression import is_compressed
+from backend.infrastructure.submission_cache import (
+    deserialize_submissions,
+    full_sync_key,
+    serialize_submissions,
+    submissions_key,
+    summarize_submissions,
+)
+
+
+def test_round_trip(make_submission):
+    submissions = [
+        make_submission(2, verdict=SubmissionStatus.WRONG_ANSWER),
+        make_submission(1),
+    ]
+    problems = {"1000/A": submissions[0].problem}
+
+    result = deserialize_submissions(serialize_submissions(submissions), problems)
+
+    assert result == submissions
+    assert result[0].problem is result[1].problem
+
+
+def test_problems_are_stored_as_references(make_submission):
+    payload = serialize_submissions([make_submission(1)])
+
+    assert b"1000/A" in payload
+    assert b"Test Problem" not in payload
+
+
+def test_unresolved_problem_keeps_reference(make_submission):
+    result = deserialize_submissions(serialize_submissions([make_submission(1)]))
+
+    assert result[0].problem == Problem(contest_id=1000, index="A", name="")
+
+
+def test_deserialize_legacy_json_reference(make_submission):
+    record = make_submission(1).to_dict()
+    record["problem"] = "1000/A"
+
+    result = deserialize_submissions(json.dumps([record]).encode())
+
+    assert result[0].id == 1
+    assert result[0].problem == Problem(contest_id=1000, index="A", name="")
+
+
+def test_deserialize_legacy_inline_problem(make_submission):
+    submission = make_submission(1, rating=None, tags=[])
+
+    assert deserialize_submissions(json.dumps([submission.to_dict()])) == [submission]
+
+
+def test_deserialize_restores_verdict_enum(make_submission):
+    result = deserialize_submissions(serialize_submissions([make_submission(1)]))
+
+    assert result[0].verdict is SubmissionStatus.OK
+    assert result[0].is_solved
+
+
+def test_deserialize_accepts_str(make_submission):
+    payload = json.dumps([make_submission(1).to_dict()])
+
+    assert deserialize_submissions(payload)[0].id == 1
+
+
+def test_empty_list():
+    assert deserialize_submissions(serialize_submissions([])) == []
+
+
+def test_keys():
+    assert submissions_key("tourist") == "submissions:tourist"
+    assert full_sync_key("tourist") == "submissions_full_sync:tourist"
+
+
+def test_large_history_is_compressed(make_submission):
+    submissions = [make_submission(i) for i in range(500, 0, -1)]
+
+    payload = serialize_submissions(submissions)
+
+    assert is_compressed(payload)
+    assert [s.id for s in deserialize_submissions(payload)] == list(range(500, 0, -1))
+
+
+def test_summary_of_compressed_history(make_submission):
+    submissions = [make_submission(i) for i in range(500, 0, -1)]
+
+    summary = summarize_submissions(serialize_submissions(submissions))
+
+    assert summary.count == 500
+    assert summary.newest_id == 500
+    assert summary.newest_verdict is SubmissionStatus.OK
+    assert summary.creation_times == [s.creation_time_seconds for s in submissions]
+
+
+def test_summary_of_legacy_json(make_submission):
+    submissions = [make_submission(1), make_submission(3, verdict=SubmissionStatus.WRONG_ANSWER)]
+
+    summary = summarize_submissions(json.dumps([s.to_dict() for s in submissions]))
+
+    assert summary.count == 2
+    assert summary.newest_id == 3
+    assert summary.newest_verdict is SubmissionStatus.WRONG_ANSWER
@@ -0,0 +1,119 @@
+"""Unit tests for store_submissions_stream."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.submission_cache import (
+    deserialize_submissions,
+    store_submissions_stream,
+)
+
+
+class _FakeRedis:
+    """Minimal string store supporting the commands used by the writer."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.expiry: dict[str, int] = {}
+        self.appends = 0
+        self.catalog: dict[str, str] = {}
+        self.pipe = MagicMock()
+        self.pipe.hsetnx = MagicMock(side_effect=self._hsetnx)
+        self.pipe.rename = MagicMock(side_effect=self._rename)
+        self.pipe.expire = MagicMock(side_effect=self._expire)
+        self.pipe.append = MagicMock(side_effect=self._append)
+        self.pipe.execute = AsyncMock()
+        self.pipe.__aenter__ = AsyncMock(return_value=self.pipe)
+        self.pipe.__aexit__ = AsyncMock(return_value=False)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expiry[key] = ex
+
+    def _append(self, key, value):
+        self.appends += 1
+        self.data[key] += value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return self.pipe
+
+    def _hsetnx(self, key, field, value):
+        self.catalog.setdefault(field, value)
+
+    def _rename(self, src, dst):
+        self.data[dst] = self.data.pop(src)
+
+    def _expire(self, key, ttl):
+        self.expiry[key] = ttl
+
+
+async def _stream(submissions):
+    for submission in submissions:
+        yield submission
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count,chunk_size", [(0, 2), (1, 2), (4, 2), (5, 2), (5, 100)])
+async def test_writes_valid_cache_entry(make_submission, count, chunk_size):
+    redis = _FakeRedis()
+    submissions = [make_submission(i) for i in range(count, 0, -1)]
+
+    result = await store_submissions_stream(
+        redis, "tourist", _stream(submissions), ttl=86400, chunk_size=chunk_size
+    )
+
+    assert result == count
+    assert list(redis.data) == ["submissions:tourist"]
+    problems = {"1000/A": submissions[0].problem} if submissions else {}
+    assert deserialize_submissions(redis.data["submissions:tourist"], problems) == submissions
+    assert list(redis.catalog) == list(problems)
+    assert redis.expiry["submissions:tourist"] == 86400
+
+
+@pytest.mark.asyncio
+async def test_writes_in_chunks(make_submission):
+    redis = _FakeRedis()
+    submissions = [make_submission(i) for i in range(10, 0, -1)]
+
+    await store_submissions_stream(redis, "tourist", _stream(submissions), ttl=60, chunk_size=3)
+
+    # One block per chunk (3 + 3 + 3 + 1) plus the end of the compressed stream
+    assert redis.appends == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_keeps_previous_entry(make_submission):
+    redis = _FakeRedis()
+    redis.data["submissions:tourist"] = b"[]"
+
+    async def _failing():
+        yield make_submission(2)
+        raise RuntimeError("connection dropped")
+
+    with pytest.raises(RuntimeError):
+        await store_submissions_stream(redis, "tourist", _failing(), ttl=60, chunk_size=1)
+
+    assert redis.data == {"submissions:tourist": b"[]"}
+
+
+@pytest.mark.asyncio
+async def test_temporary_key_expires_soon_after_last_chunk(make_submission, monkeypatch):
+    monkeypatch.setattr(settings, "worker_stream_write_ttl", 90)
+    redis = _FakeRedis()
+    tmp_expiry = []
+
+    async def _observed():
+        for submission_id in (3, 2, 1):
+            yield make_submission(submission_id)
+            tmp_expiry.extend(ttl for key, ttl in redis.expiry.items() if ":writing:" in key)
+
+    await store_submissions_stream(redis, "tourist", _observed(), ttl=86400, chunk_size=1)
+
+    # Every chunk renews the short expiry; only the final value gets the real TTL
+    assert tmp_expiry and set(tmp_expiry) == {90}
+    assert redis.expiry["submissions:tourist"] == 86400
@@ -0,0 +1,164 @@
+"""Unit tests for the columnar submission encoding."""
+
+import json
+import struct
+
+import pytest
+
+from backend.domain.models.codeforces import Problem, SubmissionStatus
+from backend.infrastructure.codeforces_client import CodeforcesClient
+from backend.infrastructure.submission_codec import (
+    MAGIC,
+    VERDICTS,
+    decode_columns,
+    decode_summary,
+    encode_block,
+    encode_submissions,
+    is_columnar,
+)
+
+
+def test_round_trip_all_verdicts(make_submission):
+    submissions = [make_submission(i, verdict=v) for i, v in enumerate(VERDICTS, start=1)]
+    problems = {"1000/A": submissions[0].problem}
+
+    assert decode_columns(encode_submissions(submissions)).to_submissions(problems) == submissions
+
+
+def test_every_verdict_has_a_code():
+    assert set(VERDICTS) == set(SubmissionStatus)
+
+
+def test_blocks_share_string_tables(make_submission):
+    first = [make_submission(3), make_submission(2)]
+    second = make_submission(1)
+    second.problem = Problem(contest_id=1001, index="B", name="")
+    second.programming_language = "PyPy 3"
+    payload = MAGIC + encode_block(first) + encode_block([second])
+
+    columns = decode_columns(payload)
+
+    assert columns.ids == [3, 2, 1]
+    assert columns.refs == ["1000/A", "1001/B"]
+    assert columns.problems == [0, 0, 1]
+    assert columns.language_names == ["C++17", "PyPy 3"]
+    assert columns.languages == [0, 0, 1]
+
+
+def test_missing_problems_become_placeholders(make_submission):
+    result = decode_columns(encode_submissions([make_submission(1)])).to_submissions({})
+
+    assert result[0].problem == Problem(contest_id=1000, index="A", name="")
+
+
+def test_empty_payload():
+    assert encode_submissions([]) == MAGIC
+    assert decode_columns(MAGIC).to_submissions({}) == []
+
+
+def test_smaller_than_json(make_submission):
+    submissions = [make_submission(i) for i in range(500, 0, -1)]
+
+    assert len(encode_submissions(submissions)) * 3 < len(
+        json.dumps([s.to_dict() for s in submissions])
+    )
+
+
+def test_is_columnar():
+    assert is_columnar(MAGIC)
+    assert not is_columnar(b"[]")
+    assert not is_columnar("[]")
+
+
+def test_unknown_version_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported"):
+        decode_columns(b"CFS\x03")
+
+
+def test_truncated_payload_is_rejected(make_submission):
+    payload = encode_submissions([make_submission(1)])
+
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_columns(payload[:-3])
+
+
+def test_summary_spans_blocks(make_submission):
+    first = [make_submission(2), make_submission(7, verdict=SubmissionStatus.WRONG_ANSWER)]
+    second = [make_submission(5)]
+    payload = MAGIC + encode_block(first) + encode_block(second)
+
+    summary = decode_summary(payload)
+
+    assert summary.count == 3
+    assert summary.newest_id == 7
+    assert summary.newest_verdict is SubmissionStatus.WRONG_ANSWER
+    assert summary.creation_times == [s.creation_time_seconds for s in first + second]
+
+
+def test_summary_of_empty_payload():
+    summary = decode_summary(MAGIC)
+
+    assert summary.count == 0
+    assert summary.newest_id is None
+    assert summary.creation_times == []
+
+
+def test_summary_rejects_truncated_payload(make_submission):
+    payload = encode_submissions([make_submission(1)])
+
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_summary(payload[:-3])
+
+
+def test_round_trip_empty_strings(make_submission):
+    raw = {
+        "id": 1,
+        "contestId": 1000,
+        "creationTimeSeconds": 1609459201,
+        "problem": {"contestId": 1000, "index": "A", "name": "Test Problem"},
+        "verdict": "",
+        "programmingLanguage": "",
+    }
+    submissions = [CodeforcesClient._parse_submission(raw)]
+    problems = {"1000/A": submissions[0].problem}
+
+    # The only language is "", so the language table encodes to zero bytes
+    payload = MAGIC + encode_block(submissions) + encode_block(submissions)
+
+    columns = decode_columns(payload)
+    assert columns.language_names == [""]
+    assert columns.to_submissions(problems) == submissions * 2
+    assert columns.to_submissions(problems)[0].verdict is SubmissionStatus.WRONG_ANSWER
+    assert decode_summary(payload).count == 2
+
+
+def test_version_1_payload_is_decoded(make_submission):
+    first = make_submission(2)
+    first.programming_language = ""
+    refs, languages = b"1000/A", b""
+    block = b"".join(
+        (
+            struct.pack("<III", 1, len(refs), len(languages)),
+            refs,
+            languages,
+            struct.pack("<q", first.id),
+            struct.pack("<i", first.contest_id),
+            struct.pack("<q", first.creation_time_seconds),
+            struct.pack("<B", 0),
+            struct.pack("<I", 0),
+            struct.pack("<H", 0),
+        )
+    )
+    payload = b"CFS\x01" + block
+
+    assert decode_columns(payload).to_submissions({"1000/A": first.problem}) == [first]
+    assert decode_summary(payload).newest_id == 2
+
+
+def test_table_entry_count_is_checked(make_submission):
+    payload = bytearray(encode_submissions([make_submission(1)]))
+    # Claim two problem table entries for a single reference
+    struct.pack_into("<I", payload, len(MAGIC) + 4, 2)
+
+    with pytest.raises(ValueError, match="Corrupt string table"):
+        decode_columns(bytes(payload))
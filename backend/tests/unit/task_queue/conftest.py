@@ -0,0 +1,40 @@
+"""Fixtures for TaskQueue unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.infrastructure.task_queue import TaskQueue
+
+
+@pytest.fixture
+def promote_script():
+    """Registered Lua script returning the number of promoted tasks."""
+    return AsyncMock(return_value=0)
+
+
+@pytest.fixture
+def mock_redis(promote_script):
+    redis = MagicMock()
+    redis.register_script.return_value = promote_script
+    redis.zadd = AsyncMock()
+    redis.setex = AsyncMock()
+    redis.expire = AsyncMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.set = AsyncMock(return_value=True)
+    for command in (
+        "rpush", "blpop", "lpop", "xadd", "xgroup_create", "xreadgroup", "xautoclaim",
+        "xack", "xdel", "xclaim",
+    ):
+        setattr(redis, command, AsyncMock())
+    return redis
+
+
+@pytest.fixture
+def task_queue(mock_redis) -> TaskQueue:
+    return TaskQueue(mock_redis, backend="list")
+
+
+@pytest.fixture
+def stream_queue(mock_redis) -> TaskQueue:
+    return TaskQueue(mock_redis, backend="stream", consumer="worker-1")
@@ -0,0 +1,213 @@
+"""Unit tests for the list and stream TaskQueue backends."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import ResponseError
+
+from backend.config import settings
+from backend.infrastructure.task_queue import QueuedTask
+
+TASK = {"task_id": "t1", "handle": "tourist"}
+QUEUE = settings.worker_queue_key
+STREAM = settings.worker_stream_key
+GROUP = settings.worker_stream_group
+
+
+@pytest.fixture(autouse=True)
+def interactive_first():
+    """Disable background-first reads unless a test enables them."""
+    with patch.object(settings, "worker_background_share", 0.0):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_list_push(task_queue, mock_redis):
+    await task_queue.push(TASK)
+
+    mock_redis.rpush.assert_awaited_once_with(QUEUE, json.dumps(TASK))
+
+
+@pytest.mark.asyncio
+async def test_list_push_background_lane(task_queue, mock_redis):
+    task = {**TASK, "priority": "background"}
+
+    await task_queue.push(task)
+
+    mock_redis.rpush.assert_awaited_once_with(f"{QUEUE}:background", json.dumps(task))
+
+
+@pytest.mark.asyncio
+async def test_list_fetch_batches_after_blocking_pop(task_queue, mock_redis):
+    second = {"task_id": "t2", "handle": "petr"}
+    mock_redis.blpop.return_value = (QUEUE.encode(), json.dumps(TASK).encode())
+    mock_redis.lpop.side_effect = [[json.dumps(second).encode(), b"not json"], []]
+
+    tasks = await task_queue.fetch(count=4, timeout=5)
+
+    assert tasks == [QueuedTask(TASK, QUEUE), QueuedTask(second, QUEUE)]
+    mock_redis.blpop.assert_awaited_once_with([QUEUE, f"{QUEUE}:background"], timeout=5)
+    assert mock_redis.lpop.await_args_list[0].args == (QUEUE, 3)
+    assert mock_redis.lpop.await_args_list[1].args == (f"{QUEUE}:background", 1)
+
+
+@pytest.mark.asyncio
+async def test_list_fetch_timeout(task_queue, mock_redis):
+    mock_redis.blpop.return_value = None
+
+    assert await task_queue.fetch(count=2) == []
+    mock_redis.lpop.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_background_share_of_reads(task_queue, mock_redis):
+    mock_redis.blpop.return_value = None
+
+    with patch.object(settings, "worker_background_share", 0.25):
+        for _ in range(8):
+            await task_queue.fetch()
+
+    first_lanes = [c.args[0][0] for c in mock_redis.blpop.await_args_list]
+    assert first_lanes.count(f"{QUEUE}:background") == 2
+    assert first_lanes[3] == f"{QUEUE}:background"
+
+
+@pytest.mark.asyncio
+async def test_list_ack_and_touch_are_noops(task_queue, mock_redis):
+    await task_queue.setup()
+    await task_queue.ack(QueuedTask(TASK, QUEUE))
+    await task_queue.touch([QueuedTask(TASK, QUEUE)])
+
+    mock_redis.xgroup_create.assert_not_awaited()
+    mock_redis.xack.assert_not_awaited()
+    mock_redis.xclaim.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stream_setup_creates_groups_once(stream_queue, mock_redis):
+    mock_redis.xgroup_create.side_effect = ResponseError("BUSYGROUP Consumer Group name exists")
+
+    await stream_queue.setup()
+
+    assert [c.args for c in mock_redis.xgroup_create.await_args_list] == [
+        (STREAM, GROUP),
+        (f"{STREAM}:background", GROUP),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_setup_propagates_other_errors(stream_queue, mock_redis):
+    mock_redis.xgroup_create.side_effect = ResponseError("WRONGTYPE")
+
+    with pytest.raises(ResponseError):
+        await stream_queue.setup()
+
+
+@pytest.mark.asyncio
+async def test_stream_push(stream_queue, mock_redis):
+    await stream_queue.push(TASK)
+
+    mock_redis.xadd.assert_awaited_once_with(STREAM, {"task": json.dumps(TASK)})
+
+
+def _entry(message_id, task=TASK):
+    return (message_id.encode(), {b"task": json.dumps(task).encode()})
+
+
+@pytest.mark.asyncio
+async def test_stream_fetch_reads_lanes_in_order(stream_queue, mock_redis):
+    background = {**TASK, "priority": "background"}
+    mock_redis.xautoclaim.return_value = [b"0-0", [], []]
+    mock_redis.xreadgroup.side_effect = [
+        [[STREAM.encode(), [_entry("1-0")]]],
+        [[f"{STREAM}:background".encode(), [_entry("2-0", background)]]],
+    ]
+
+    tasks = await stream_queue.fetch(count=4, timeout=5)
+
+    assert tasks == [
+        QueuedTask(TASK, STREAM, "1-0"),
+        QueuedTask(background, f"{STREAM}:background", "2-0"),
+    ]
+    first, second = mock_redis.xreadgroup.await_args_list
+    assert first.args == (GROUP, "worker-1", {STREAM: ">"})
+    assert first.kwargs == {"count": 4}
+    assert second.kwargs == {"count": 3}
+
+
+@pytest.mark.asyncio
+async def test_stream_fetch_blocks_on_all_lanes(stream_queue, mock_redis):
+    mock_redis.xautoclaim.return_value = [b"0-0", [], []]
+    mock_redis.xreadgroup.side_effect = [
+        [],
+        [],
+        [
+            [f"{STREAM}:background".encode(), [_entry("2-0")]],
+            [STREAM.encode(), [_entry("1-0")]],
+        ],
+    ]
+
+    tasks = await stream_queue.fetch(count=1, timeout=5)
+
+    assert tasks == [QueuedTask(TASK, STREAM, "1-0")]
+    blocking = mock_redis.xreadgroup.await_args_list[2]
+    assert blocking.args[2] == {STREAM: ">", f"{STREAM}:background": ">"}
+    assert blocking.kwargs == {"count": 1, "block": 5000}
+    # The entry that did not fit is re-queued and acknowledged
+    mock_redis.xadd.assert_awaited_once_with(STREAM, {"task": json.dumps(TASK)})
+    mock_redis.xack.assert_awaited_once_with(f"{STREAM}:background", GROUP, "2-0")
+
+
+@pytest.mark.asyncio
+async def test_stream_fetch_prefers_claimed_entries(stream_queue, mock_redis):
+    mock_redis.xautoclaim.side_effect = [
+        [b"0-0", [_entry("1-0"), (b"2-0", None)], []],
+        [b"0-0", [], []],
+    ]
+
+    tasks = await stream_queue.fetch(count=2)
+
+    assert tasks == [QueuedTask(TASK, STREAM, "1-0")]
+    mock_redis.xreadgroup.assert_not_awaited()
+    # Entry deleted from the stream while pending is acknowledged and dropped
+    mock_redis.xack.assert_awaited_once_with(STREAM, GROUP, "2-0")
+    assert mock_redis.xautoclaim.await_args.kwargs["min_idle_time"] == (
+        settings.worker_stream_claim_idle * 1000
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_claims_only_periodically(stream_queue, mock_redis):
+    mock_redis.xautoclaim.return_value = [b"0-0", [], []]
+    mock_redis.xreadgroup.return_value = []
+
+    await stream_queue.fetch()
+    await stream_queue.fetch()
+
+    assert mock_redis.xautoclaim.await_count == 2  # Once per lane, first fetch only
+    assert mock_redis.xreadgroup.await_count == 6
+
+
+@pytest.mark.asyncio
+async def test_stream_ack_removes_entry(stream_queue, mock_redis):
+    await stream_queue.ack(QueuedTask(TASK, f"{STREAM}:background", "1-0"))
+
+    mock_redis.xack.assert_awaited_once_with(f"{STREAM}:background", GROUP, "1-0")
+    mock_redis.xdel.assert_awaited_once_with(f"{STREAM}:background", "1-0")
+
+
+@pytest.mark.asyncio
+async def test_stream_touch_resets_idle_time(stream_queue, mock_redis):
+    await stream_queue.touch(
+        [
+            QueuedTask(TASK, STREAM, "1-0"),
+            QueuedTask(TASK, STREAM, "3-0"),
+            QueuedTask(TASK, f"{STREAM}:background", "4-0"),
+        ]
+    )
+
+    assert [c.args for c in mock_redis.xclaim.await_args_list] == [
+        (STREAM, GROUP, "worker-1", 0, ["1-0", "3-0"]),
+        (f"{STREAM}:background", GROUP, "worker-1", 0, ["4-0"]),
+    ]
@@ -0,0 +1,74 @@
+"""Unit tests for TaskQueue.enqueue priorities and deduplication."""
+
+import json
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.task_queue import TaskPriority
+
+QUEUE = settings.worker_queue_key
+
+
+@pytest.mark.asyncio
+async def test_enqueue_interactive_by_default(task_queue, mock_redis):
+    task_id = await task_queue.enqueue("tourist")
+
+    queued = json.loads(mock_redis.rpush.await_args.args[1])
+    assert mock_redis.rpush.await_args.args[0] == QUEUE
+    assert queued["task_id"] == task_id
+    assert queued["priority"] == "interactive"
+    mock_redis.setex.assert_any_await(f"task:{task_id}:priority", 300, "interactive")
+
+
+@pytest.mark.asyncio
+async def test_enqueue_background_lane(task_queue, mock_redis):
+    await task_queue.enqueue("tourist", priority=TaskPriority.BACKGROUND)
+
+    assert mock_redis.rpush.await_args.args[0] == f"{QUEUE}:background"
+    assert json.loads(mock_redis.rpush.await_args.args[1])["priority"] == "background"
+
+
+@pytest.mark.asyncio
+async def test_interactive_request_escalates_background_task(task_queue, mock_redis):
+    mock_redis.get.return_value = b"t1"
+    mock_redis.set.return_value = b"background"
+
+    task_id = await task_queue.enqueue("tourist")
+
+    assert task_id == "t1"
+    mock_redis.set.assert_awaited_once_with(
+        "task:t1:priority", "interactive", ex=300, get=True
+    )
+    key, payload = mock_redis.rpush.await_args.args
+    assert key == QUEUE
+    assert json.loads(payload)["task_id"] == "t1"
+
+
+@pytest.mark.asyncio
+async def test_interactive_task_is_not_pushed_twice(task_queue, mock_redis):
+    mock_redis.get.return_value = b"t1"
+    mock_redis.set.return_value = b"interactive"
+
+    assert await task_queue.enqueue("tourist") == "t1"
+
+    mock_redis.rpush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_background_request_joins_pending_task(task_queue, mock_redis):
+    mock_redis.get.return_value = b"t1"
+
+    assert await task_queue.enqueue("tourist", priority=TaskPriority.BACKGROUND) == "t1"
+
+    mock_redis.set.assert_not_awaited()
+    mock_redis.rpush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_uses_canonical_handle(task_queue, mock_redis):
+    task_id = await task_queue.enqueue("Tourist")
+
+    mock_redis.get.assert_any_await("pending_task:tourist")
+    assert json.loads(mock_redis.rpush.await_args.args[1])["handle"] == "tourist"
+    mock_redis.setex.assert_any_await(f"task:{task_id}:handle", 300, "tourist")
@@ -0,0 +1,56 @@
+"""Unit tests for delayed retries in TaskQueue."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.task_queue import retry_backoff
+
+
+@pytest.mark.parametrize("attempt", [1, 2, 3, 4])
+def test_backoff_grows_exponentially_with_jitter(attempt):
+    window = settings.worker_retry_base_delay * 2 ** (attempt - 1)
+
+    delays = [retry_backoff(attempt) for _ in range(50)]
+
+    assert all(window / 2 <= d <= window for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_backoff_is_capped():
+    assert retry_backoff(50) <= settings.worker_retry_max_delay
+
+
+@pytest.mark.asyncio
+async def test_schedule_retry_keeps_task_processing(task_queue, mock_redis):
+    task_data = {"task_id": "t1", "handle": "tourist", "attempt": 2}
+
+    with patch("backend.infrastructure.task_queue.time.time", return_value=1000.0):
+        await task_queue.schedule_retry(task_data, delay=7.5)
+
+    mock_redis.zadd.assert_awaited_once_with(
+        settings.worker_retry_key, {json.dumps(task_data): 1007.5}
+    )
+    mock_redis.setex.assert_awaited_once_with("task:t1:status", 308, "processing")
+    mock_redis.expire.assert_any_await("task:t1:handle", 308)
+    mock_redis.expire.assert_any_await("pending_task:tourist", 8 + settings.pending_task_ttl)
+
+
+@pytest.mark.asyncio
+async def test_promote_due_retries(task_queue, promote_script):
+    promote_script.return_value = 3
+
+    with patch("backend.infrastructure.task_queue.time.time", return_value=1000.0):
+        moved = await task_queue.promote_due_retries(limit=10)
+
+    assert moved == 3
+    promote_script.assert_awaited_once_with(
+        keys=[
+            settings.worker_retry_key,
+            settings.worker_queue_key,
+            f"{settings.worker_queue_key}:background",
+        ],
+        args=[1000.0, 10, "list"],
+    )
@@ -0,0 +1,35 @@
+"""Fixtures for unknown-handle cache unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.infrastructure.unknown_handles import UnknownHandleFilter
+
+
+@pytest.fixture
+def pipeline():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+@pytest.fixture
+def mock_redis(pipeline):
+    redis = MagicMock()
+    redis.mget = AsyncMock(return_value=[None, None])
+    redis.exists = AsyncMock(return_value=1)
+    redis.pipeline.return_value = pipeline
+    return redis
+
+
+@pytest.fixture
+def clock():
+    return MagicMock(return_value=0.0)
+
+
+@pytest.fixture
+def bloom(clock):
+    return UnknownHandleFilter(bits=1024, hashes=3, sync_interval=30.0, clock=clock)
@@ -0,0 +1,135 @@
+"""Unit tests for the unknown-handle negative cache and Bloom filter."""
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure import unknown_handles
+from backend.infrastructure.unknown_handles import (
+    UnknownHandleFilter,
+    bloom_generation,
+    bloom_key,
+    bloom_offsets,
+    mark_unknown_handle,
+    unknown_handle_key,
+)
+
+
+def _bitmap(*handles, bits=1024, hashes=3) -> bytes:
+    """Build a Redis-style bitmap (most significant bit first) for some handles."""
+    bitmap = bytearray(bits // 8)
+    for handle in handles:
+        for offset in bloom_offsets(handle, bits, hashes):
+            bitmap[offset >> 3] |= 0x80 >> (offset & 7)
+    return bytes(bitmap)
+
+
+def test_bloom_offsets_are_case_insensitive():
+    offsets = bloom_offsets("Tourist", 1024, 5)
+
+    assert offsets == bloom_offsets("tOURIST", 1024, 5)
+    assert len(offsets) == 5
+    assert all(0 <= offset < 1024 for offset in offsets)
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """Pin the wall clock used for Bloom filter generations."""
+    current = [10 * settings.unknown_handle_ttl + 5.0]
+    monkeypatch.setattr(unknown_handles.time, "time", lambda: current[0])
+    return current
+
+
+@pytest.mark.asyncio
+async def test_mark_unknown_handle(mock_redis, pipeline, now):
+    await mark_unknown_handle(mock_redis, "NoSuchUser")
+
+    pipeline.setex.assert_called_once_with(
+        unknown_handle_key("nosuchuser"), settings.unknown_handle_ttl, 1
+    )
+    assert pipeline.setbit.call_count == settings.unknown_handle_bloom_hashes
+    assert {call.args[0] for call in pipeline.setbit.call_args_list} == {bloom_key(10)}
+    pipeline.expireat.assert_called_once_with(bloom_key(10), 12 * settings.unknown_handle_ttl)
+    pipeline.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bits_outlive_negative_entry_marked_near_rotation(mock_redis, pipeline, now):
+    ttl = settings.unknown_handle_ttl
+    now[0] = 11 * ttl - 1  # Last second of generation 10
+
+    await mark_unknown_handle(mock_redis, "spammer")
+
+    expires_at = pipeline.expireat.call_args.args[1]
+    assert expires_at >= now[0] + ttl
+
+    # One TTL later the negative entry is still live and the bitmap still checked
+    now[0] += ttl - 1
+    assert bloom_generation() == 11
+    mock_redis.mget.return_value = [None, _bitmap("spammer")]
+    bloom = UnknownHandleFilter(bits=1024, hashes=3)
+
+    assert await bloom.contains(mock_redis, "spammer")
+    mock_redis.mget.assert_awaited_once_with(bloom_key(11), bloom_key(10))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("current,previous", [("spammer", "bot"), ("bot", "spammer")])
+async def test_sync_merges_both_generations(bloom, mock_redis, current, previous):
+    # Redis bitmaps end at their highest set byte, so the generations differ in length
+    mock_redis.mget.return_value = [
+        _bitmap(current).rstrip(b"\0"),
+        _bitmap(previous).rstrip(b"\0"),
+    ]
+
+    await bloom.sync(mock_redis)
+
+    assert bloom.might_contain("spammer")
+    assert bloom.might_contain("bot")
+    assert not bloom.might_contain("tourist")
+
+
+@pytest.mark.asyncio
+async def test_filter_miss_skips_negative_cache(bloom, mock_redis):
+    mock_redis.mget.return_value = [_bitmap("spammer"), None]
+
+    assert not await bloom.contains(mock_redis, "tourist")
+    mock_redis.exists.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_filter_hit_is_confirmed_in_redis(bloom, mock_redis):
+    mock_redis.mget.return_value = [_bitmap("spammer"), None]
+
+    assert await bloom.contains(mock_redis, "SPAMMER")
+    mock_redis.exists.assert_awaited_once_with(unknown_handle_key("spammer"))
+
+    mock_redis.exists.return_value = 0  # Negative entry expired
+    assert not await bloom.contains(mock_redis, "spammer")
+
+
+@pytest.mark.asyncio
+async def test_bitmap_is_synced_once_per_interval(bloom, mock_redis, clock):
+    await bloom.contains(mock_redis, "a")
+    await bloom.contains(mock_redis, "b")
+    assert mock_redis.mget.await_count == 1
+
+    clock.return_value = 30.0
+    await bloom.contains(mock_redis, "c")
+    assert mock_redis.mget.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_added_handle_is_visible_before_next_sync(bloom, mock_redis):
+    await bloom.sync(mock_redis)
+    assert not bloom.might_contain("spammer")
+
+    await bloom.add(mock_redis, "spammer")
+
+    assert bloom.might_contain("spammer")
+
+
+def test_local_bits_match_redis_bit_order():
+    bloom = UnknownHandleFilter(bits=1024, hashes=3)
+    bloom._add_local("spammer")
+
+    assert bytes(bloom._bitmap).ljust(128, b"\0") == _bitmap("spammer")
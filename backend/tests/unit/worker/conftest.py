@@ -0,0 +1,49 @@
+"""Fixtures for worker unit tests."""
+
+from typing import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+from backend.worker.main import Worker
+
+
+@pytest.fixture
+def make_submission() -> Callable[..., Submission]:
+    def _create(
+        submission_id: int, verdict: SubmissionStatus = SubmissionStatus.OK
+    ) -> Submission:
+        return Submission(
+            id=submission_id,
+            contest_id=1000,
+            creation_time_seconds=1609459200 + submission_id,
+            problem=Problem(contest_id=1000, index="A", name="Test", rating=1500, tags=[]),
+            verdict=verdict,
+            programming_language="C++17",
+        )
+
+    return _create
+
+
+@pytest.fixture
+def mock_redis():
+    redis = MagicMock()
+    for command in ("get", "exists", "setex", "hincrby"):
+        setattr(redis, command, AsyncMock())
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    redis.pipeline.return_value = pipe
+    return redis
+
+
+@pytest.fixture
+def worker(mock_redis) -> Worker:
+    worker = Worker()
+    worker.redis = mock_redis
+    worker.cf_client = MagicMock()
+    worker.cf_client.get_latest_submission = AsyncMock()
+    worker.cf_client.get_new_submissions = AsyncMock(return_value=[])
+    return worker
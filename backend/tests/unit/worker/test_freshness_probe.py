@@ -0,0 +1,97 @@
+"""Unit tests for the freshness probe in Worker.refresh_submissions."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.domain.models.codeforces import SubmissionStatus
+from backend.infrastructure.submission_cache import (
+    deserialize_submissions,
+    meta_key,
+    serialize_submissions,
+    submissions_key,
+)
+from backend.worker import main
+
+
+@pytest.fixture
+def cached_history(mock_redis, make_submission):
+    """Cache submissions 3, 2, 1 with a recent full sync."""
+    history = [make_submission(3), make_submission(2), make_submission(1)]
+    mock_redis.exists.return_value = 1
+    mock_redis.get.return_value = serialize_submissions(history)
+    return history
+
+
+@pytest.mark.asyncio
+async def test_unchanged_history_only_extends_validity(
+    worker, mock_redis, cached_history, make_submission, monkeypatch
+):
+    deserialize = MagicMock()
+    monkeypatch.setattr(main, "deserialize_submissions", deserialize)
+    worker.cf_client.get_latest_submission.return_value = make_submission(3)
+
+    count = await worker.refresh_submissions("tourist")
+
+    assert count == 3
+    # A hit reads the summary columns only
+    deserialize.assert_not_called()
+    worker.cf_client.get_new_submissions.assert_not_awaited()
+    mock_redis.setex.assert_not_awaited()
+    pipe = mock_redis.pipeline.return_value
+    pipe.set.assert_not_called()
+    assert pipe.hset.call_args.args[0] == meta_key("tourist")
+    # Unchanged data keeps its version
+    assert "version" not in pipe.hset.call_args.kwargs["mapping"]
+    assert worker.probe_stats.as_dict() == {"hits": 1, "misses": 0, "hit_ratio": 1.0}
+    mock_redis.hincrby.assert_awaited_once_with("stats:freshness_probe", "hits", 1)
+
+
+@pytest.mark.asyncio
+async def test_new_submission_triggers_incremental_fetch(
+    worker, mock_redis, cached_history, make_submission
+):
+    worker.cf_client.get_latest_submission.return_value = make_submission(5)
+    worker.cf_client.get_new_submissions.return_value = [make_submission(5), make_submission(4)]
+
+    count = await worker.refresh_submissions("tourist")
+
+    assert count == 5
+    worker.cf_client.get_new_submissions.assert_awaited_once_with("tourist", 3)
+    pipe = mock_redis.pipeline.return_value
+    key, payload = pipe.set.call_args.args
+    assert key == submissions_key("tourist")
+    assert [s.id for s in deserialize_submissions(payload)] == [5, 4, 3, 2, 1]
+    assert "version" in pipe.hset.call_args.kwargs["mapping"]
+    assert worker.probe_stats.misses == 1
+    mock_redis.hincrby.assert_awaited_once_with("stats:freshness_probe", "misses", 1)
+
+
+@pytest.mark.asyncio
+async def test_rejudged_newest_submission_is_updated_without_paging(
+    worker, mock_redis, cached_history, make_submission
+):
+    worker.cf_client.get_latest_submission.return_value = make_submission(
+        3, verdict=SubmissionStatus.WRONG_ANSWER
+    )
+
+    await worker.refresh_submissions("tourist")
+
+    worker.cf_client.get_new_submissions.assert_not_awaited()
+    stored = deserialize_submissions(mock_redis.pipeline.return_value.set.call_args.args[1])
+    assert stored[0].verdict == SubmissionStatus.WRONG_ANSWER
+    assert worker.probe_stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_history_stays_empty(worker, mock_redis):
+    mock_redis.exists.return_value = 1
+    mock_redis.get.return_value = b"[]"
+    worker.cf_client.get_latest_submission.return_value = None
+
+    assert await worker.refresh_submissions("newbie") == 0
+    assert worker.probe_stats.hits == 1
+
+
+def test_hit_ratio_without_probes(worker):
+    assert worker.probe_stats.hit_ratio == 0.0
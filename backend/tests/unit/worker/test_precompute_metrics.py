@@ -0,0 +1,80 @@
+"""Unit tests for Worker.precompute_metrics."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.config import settings
+from backend.domain.models.time_period import TimePeriod
+from backend.infrastructure.precomputed_responses import (
+    precomputed_responses_key,
+    response_field,
+)
+from backend.infrastructure.submission_cache import CacheAge, CacheEntry, serialize_submissions
+from backend.services.metric_responses import division_problems_params
+from backend.worker import main as worker_main
+
+
+@pytest.fixture
+def cached(monkeypatch, mock_redis, make_submission):
+    """Cache two submissions under data version 7."""
+    entry = CacheEntry(
+        payload=serialize_submissions([make_submission(2), make_submission(1)]),
+        cache_age=CacheAge(age=0, fresh_ttl=600),
+        version=7,
+    )
+    monkeypatch.setattr(worker_main, "read_cache_entry", AsyncMock(return_value=entry))
+    mock_redis.hmget = AsyncMock(return_value=[None, None])
+    mock_redis.get.return_value = b"5"  # Contest division mapping version
+    mock_redis.hgetall = AsyncMock(return_value={})
+    mock_redis.ttl = AsyncMock(return_value=3600)
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_stores_responses_under_the_data_version(worker, mock_redis, cached):
+    pipe = mock_redis.pipeline.return_value
+
+    count = await worker.precompute_metrics("tourist")
+
+    assert count > 0
+    key = precomputed_responses_key("tourist")
+    mapping = pipe.hset.call_args.kwargs["mapping"]
+    assert mapping["version"] == "7"
+    assert len(mapping) == count + 2
+    pipe.expire.assert_called_once_with(key, 3600)
+
+
+@pytest.mark.asyncio
+async def test_division_responses_carry_the_divisions_version(worker, mock_redis, cached):
+    await worker.precompute_metrics("tourist")
+
+    mapping = mock_redis.pipeline.return_value.hset.call_args.kwargs["mapping"]
+    field = response_field("division-problems", division_problems_params(TimePeriod.ALL_TIME, 5))
+    assert field in mapping
+
+
+@pytest.mark.asyncio
+async def test_unversioned_data_is_skipped(worker, mock_redis, monkeypatch):
+    entry = CacheEntry(payload=b"[]", cache_age=CacheAge(age=0, fresh_ttl=600))
+    monkeypatch.setattr(worker_main, "read_cache_entry", AsyncMock(return_value=entry))
+
+    assert await worker.precompute_metrics("tourist") == 0
+    mock_redis.pipeline.return_value.hset.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failure_does_not_fail_the_task(worker, mock_redis, monkeypatch):
+    monkeypatch.setattr(settings, "worker_precompute_metrics", True)
+    monkeypatch.setattr(worker, "refresh_submissions", AsyncMock(return_value=1))
+    monkeypatch.setattr(
+        worker, "precompute_metrics", AsyncMock(side_effect=RuntimeError("boom"))
+    )
+    worker.rate_limiter = AsyncMock()
+    worker.rate_limiter.stats.as_dict = lambda: {}
+    mock_redis.get.return_value = None
+    mock_redis.delete = AsyncMock()
+
+    await worker.process_task({"task_id": "t1", "handle": "tourist"})
+
+    mock_redis.setex.assert_any_await("task:t1:status", 300, "completed")
@@ -0,0 +1,130 @@
+"""Unit tests for the proactive refresh of popular handles in the worker."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.submission_cache import meta_key
+from backend.infrastructure.task_queue import TaskPriority
+from backend.worker import main
+
+NOW = 1_700_000_000
+
+
+def _meta(fresh_for):
+    """Raw (fetched_at, fresh_ttl) fields of data fresh for another ``fresh_for`` seconds."""
+    return [str(NOW - 3600).encode(), str(3600 + fresh_for).encode()]
+
+
+@pytest.fixture(autouse=True)
+def prefetch_settings(monkeypatch):
+    monkeypatch.setattr(settings, "worker_concurrency", 2)
+    monkeypatch.setattr(settings, "worker_prefetch_lead", 900)
+    monkeypatch.setattr(settings, "worker_prefetch_interval", 60)
+
+
+@pytest.fixture
+def prefetcher(worker, mock_redis, monkeypatch):
+    """Worker with spare budget, an empty queue and three popular handles."""
+    worker.rate_limiter = MagicMock(rate=5.0, max_rate=5.0)
+    worker.task_queue = MagicMock(consumer="worker-1")
+    worker.task_queue.backlog = AsyncMock(return_value=0)
+    worker.task_queue.enqueue = AsyncMock()
+    mock_redis.set = AsyncMock(return_value=True)
+    mock_redis.pipeline.return_value.execute.return_value = [
+        _meta(fresh_for=60),  # About to go stale
+        _meta(fresh_for=5000),  # Fresh for a while
+        [None, None],  # Not cached
+    ]
+    popular = AsyncMock(return_value=["tourist", "petr", "jiangly"])
+    monkeypatch.setattr(main, "popular_handles", popular)
+    with patch("backend.infrastructure.submission_cache.time.time", return_value=NOW):
+        yield worker
+
+
+def test_spare_budget(prefetcher):
+    assert prefetcher.has_spare_budget()
+
+
+def test_no_spare_budget_while_rate_limiter_backs_off(prefetcher):
+    prefetcher.rate_limiter.rate = 2.5
+
+    assert not prefetcher.has_spare_budget()
+
+
+def test_no_spare_budget_with_open_circuit(prefetcher):
+    for _ in range(settings.codeforces_breaker_failure_threshold):
+        prefetcher.circuit_breaker.before_call()
+        prefetcher.circuit_breaker.record_failure()
+
+    assert not prefetcher.has_spare_budget()
+
+
+@pytest.mark.asyncio
+async def test_no_spare_budget_without_free_slots(prefetcher):
+    tasks = [asyncio.create_task(asyncio.sleep(1)) for _ in range(settings.worker_concurrency)]
+    prefetcher.in_flight.update({task: MagicMock() for task in tasks})
+
+    assert not prefetcher.has_spare_budget()
+    for task in tasks:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_refreshes_popular_handles_about_to_go_stale(prefetcher, mock_redis):
+    assert await prefetcher.prefetch_popular() == 1
+
+    prefetcher.task_queue.enqueue.assert_awaited_once_with(
+        "tourist", priority=TaskPriority.BACKGROUND
+    )
+    mock_redis.set.assert_awaited_once_with("prefetch_lock", "worker-1", nx=True, ex=60)
+    main.popular_handles.assert_awaited_once_with(
+        mock_redis, settings.popularity_top_handles, settings.popularity_min_score
+    )
+    pipe = mock_redis.pipeline.return_value
+    assert [call.args[0] for call in pipe.hmget.call_args_list] == [
+        meta_key("tourist"),
+        meta_key("petr"),
+        meta_key("jiangly"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refreshes_at_most_free_slots(prefetcher, mock_redis):
+    mock_redis.pipeline.return_value.execute.return_value = [_meta(fresh_for=0)] * 3
+
+    assert await prefetcher.prefetch_popular() == settings.worker_concurrency
+
+
+@pytest.mark.asyncio
+async def test_skips_scan_with_queue_backlog(prefetcher, mock_redis):
+    prefetcher.task_queue.backlog.return_value = 3
+
+    assert await prefetcher.prefetch_popular() == 0
+    mock_redis.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_skips_scan_without_spare_budget(prefetcher, mock_redis):
+    prefetcher.rate_limiter.rate = 1.0
+
+    assert await prefetcher.prefetch_popular() == 0
+    prefetcher.task_queue.backlog.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_one_scan_per_interval(prefetcher, mock_redis):
+    mock_redis.set.return_value = None  # Another worker holds the lock
+
+    assert await prefetcher.prefetch_popular() == 0
+    main.popular_handles.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_no_popular_handles(prefetcher, mock_redis):
+    main.popular_handles.return_value = []
+
+    assert await prefetcher.prefetch_popular() == 0
+    mock_redis.pipeline.assert_not_called()
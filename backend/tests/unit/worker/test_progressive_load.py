@@ -0,0 +1,102 @@
+"""Unit tests for the progressive first load in Worker.refresh_submissions."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.submission_cache import (
+    deserialize_submissions,
+    full_sync_key,
+    submissions_key,
+)
+from backend.worker import main as worker_main
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    """Capture the stream written by store_submissions_stream."""
+    written = []
+
+    async def _store(redis, handle, submissions, ttl, chunk_size):
+        async for submission in submissions:
+            written.append(submission)
+        return len(written)
+
+    monkeypatch.setattr(worker_main, "store_submissions_stream", _store)
+    return written
+
+
+@pytest.fixture
+def small_pages(monkeypatch):
+    monkeypatch.setattr(settings, "worker_page_size", 3)
+
+
+async def _iterate(submissions):
+    for submission in submissions:
+        yield submission
+
+
+@pytest.mark.asyncio
+async def test_first_page_is_cached_as_partial_before_backfill(
+    worker, mock_redis, make_submission, stored, small_pages
+):
+    mock_redis.exists.return_value = 0
+    first_page = [make_submission(9), make_submission(8), make_submission(7)]
+    worker.cf_client.get_user_submissions = AsyncMock(return_value=first_page)
+    # A submission made in between shifts the offsets: 7 reappears on page two
+    worker.cf_client.iter_user_submissions.return_value = _iterate(
+        [make_submission(7), make_submission(6), make_submission(5)]
+    )
+
+    count = await worker.refresh_submissions("tourist")
+
+    assert count == 5
+    assert [s.id for s in stored] == [9, 8, 7, 6, 5]
+    worker.cf_client.get_user_submissions.assert_awaited_once_with(
+        "tourist", from_index=1, count=3
+    )
+    worker.cf_client.iter_user_submissions.assert_called_once_with("tourist", from_index=4)
+
+    pipe = mock_redis.pipeline.return_value
+    key, payload = pipe.set.call_args.args
+    assert key == submissions_key("tourist")
+    assert [s.id for s in deserialize_submissions(payload)] == [9, 8, 7]
+
+    covers_from = first_page[-1].creation_time_seconds
+    pipe.hset.assert_any_call("submissions_meta:tourist", "covers_from", covers_from)
+    pipe.hdel.assert_called_with("submissions_meta:tourist", "covers_from")
+    assert mock_redis.setex.await_args_list[-1].args[0] == full_sync_key("tourist")
+
+
+@pytest.mark.asyncio
+async def test_short_history_is_cached_in_one_pass(
+    worker, mock_redis, make_submission, stored, small_pages
+):
+    mock_redis.exists.return_value = 0
+    worker.cf_client.get_user_submissions = AsyncMock(
+        return_value=[make_submission(2), make_submission(1)]
+    )
+
+    count = await worker.refresh_submissions("newbie")
+
+    assert count == 2
+    worker.cf_client.iter_user_submissions.assert_not_called()
+    pipe = mock_redis.pipeline.return_value
+    pipe.hdel.assert_called_once_with("submissions_meta:newbie", "covers_from")
+    assert [call.args[0] for call in mock_redis.setex.await_args_list] == [
+        full_sync_key("newbie")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cached_history_without_full_sync_is_streamed(
+    worker, mock_redis, make_submission, stored
+):
+    mock_redis.exists.side_effect = [0, 1]  # No recent full sync, but a cached blob
+    worker.cf_client.get_user_submissions = AsyncMock()
+    worker.cf_client.iter_user_submissions.return_value = _iterate([make_submission(1)])
+
+    assert await worker.refresh_submissions("tourist") == 1
+    worker.cf_client.get_user_submissions.assert_not_awaited()
+    worker.cf_client.iter_user_submissions.assert_called_once_with("tourist")
@@ -0,0 +1,116 @@
+"""Unit tests for delayed retries of failed tasks in Worker.process_task."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.circuit_breaker import CircuitOpenError
+from backend.infrastructure.codeforces_client import (
+    CodeforcesRateLimitError,
+    CodeforcesUnavailableError,
+)
+from backend.infrastructure.task_queue import pending_task_key
+from backend.worker import main
+
+TASK = {"task_id": "t1", "handle": "tourist"}
+
+
+@pytest.fixture(autouse=True)
+def retry_settings(monkeypatch):
+    monkeypatch.setattr(settings, "worker_retry_max_attempts", 3)
+    monkeypatch.setattr(settings, "worker_retry_base_delay", 10.0)
+    monkeypatch.setattr(settings, "worker_retry_max_delay", 300.0)
+    monkeypatch.setattr(settings, "worker_precompute_metrics", False)
+
+
+@pytest.fixture
+def failing(worker, mock_redis, monkeypatch):
+    """Worker whose refresh raises ``failing.error``; returns the refresh mock."""
+    mock_redis.get.return_value = None
+    mock_redis.delete = AsyncMock()
+    worker.rate_limiter = MagicMock()
+    worker.task_queue = MagicMock()
+    worker.task_queue.schedule_retry = AsyncMock()
+    refresh = AsyncMock()
+    monkeypatch.setattr(worker, "refresh_submissions", refresh)
+    return refresh
+
+
+def _statuses(mock_redis):
+    return {call.args[0]: call.args[2] for call in mock_redis.setex.await_args_list}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error", [CodeforcesRateLimitError("slow down", 429), CodeforcesUnavailableError("down", 503)]
+)
+async def test_transient_error_schedules_retry_with_backoff(
+    worker, mock_redis, failing, monkeypatch, error
+):
+    failing.side_effect = error
+    backoff = MagicMock(return_value=7.5)
+    monkeypatch.setattr(main, "retry_backoff", backoff)
+
+    await worker.process_task(TASK)
+
+    backoff.assert_called_once_with(1)
+    worker.task_queue.schedule_retry.assert_awaited_once_with({**TASK, "attempt": 1}, 7.5)
+    assert "task:t1:status" not in _statuses(mock_redis)
+    mock_redis.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_backoff_grows_with_attempts(worker, failing, monkeypatch):
+    failing.side_effect = CodeforcesUnavailableError("down", 503)
+    backoff = MagicMock(return_value=20.0)
+    monkeypatch.setattr(main, "retry_backoff", backoff)
+
+    await worker.process_task({**TASK, "attempt": 1})
+
+    backoff.assert_called_once_with(2)
+    worker.task_queue.schedule_retry.assert_awaited_once_with({**TASK, "attempt": 2}, 20.0)
+
+
+@pytest.mark.asyncio
+async def test_last_attempt_fails_task(worker, mock_redis, failing):
+    failing.side_effect = CodeforcesUnavailableError("still down", 503)
+
+    await worker.process_task({**TASK, "attempt": 2})
+
+    worker.task_queue.schedule_retry.assert_not_awaited()
+    statuses = _statuses(mock_redis)
+    assert statuses["task:t1:status"] == "failed"
+    assert statuses["task:t1:error"] == "still down"
+    mock_redis.delete.assert_awaited_once_with(pending_task_key("tourist"))
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_requeues_without_using_an_attempt(worker, failing, monkeypatch):
+    failing.side_effect = CircuitOpenError("Codeforces circuit open", retry_after=42.0)
+    monkeypatch.setattr(main, "retry_backoff", MagicMock(return_value=5.0))
+
+    await worker.process_task({**TASK, "attempt": 2})
+
+    # Waits at least until the breaker lets a probe through
+    worker.task_queue.schedule_retry.assert_awaited_once_with({**TASK, "attempt": 2}, 42.0)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_keeps_backoff_if_longer(worker, failing, monkeypatch):
+    failing.side_effect = CircuitOpenError("Codeforces circuit open", retry_after=1.0)
+    monkeypatch.setattr(main, "retry_backoff", MagicMock(return_value=5.0))
+
+    await worker.process_task(TASK)
+
+    worker.task_queue.schedule_retry.assert_awaited_once_with({**TASK, "attempt": 0}, 5.0)
+
+
+@pytest.mark.asyncio
+async def test_unexpected_error_fails_without_retry(worker, mock_redis, failing):
+    failing.side_effect = RuntimeError("bug")
+
+    await worker.process_task(TASK)
+
+    worker.task_queue.schedule_retry.assert_not_awaited()
+    assert _statuses(mock_redis)["task:t1:status"] == "failed"
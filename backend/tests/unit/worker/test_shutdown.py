@@ -0,0 +1,151 @@
+"""Unit tests for concurrent task processing and graceful shutdown in Worker.run."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.config import settings
+from backend.infrastructure.task_queue import QueuedTask
+
+
+def _queued(task_id):
+    return QueuedTask({"task_id": task_id, "handle": task_id}, "queue:interactive")
+
+
+@pytest.fixture(autouse=True)
+def fast_shutdown(monkeypatch):
+    monkeypatch.setattr(settings, "worker_concurrency", 3)
+    monkeypatch.setattr(settings, "worker_shutdown_timeout", 0.1)
+    monkeypatch.setattr(settings, "worker_fetch_timeout", 0.2)
+
+
+@pytest.fixture
+def task_queue():
+    queue = MagicMock()
+    queue.consumer = "worker-1"
+    queue.backend = "list"
+    queue.push = AsyncMock()
+    queue.ack = AsyncMock()
+    return queue
+
+
+@pytest.fixture
+def runner(worker, task_queue, monkeypatch):
+    """Worker with a mocked queue; tasks sleep for ``durations[task_id]`` seconds."""
+    worker.task_queue = task_queue
+    monkeypatch.setattr(worker, "run_scheduler", AsyncMock())
+    monkeypatch.setattr(worker, "run_metadata_refresh", AsyncMock())
+    durations = {}
+    finished = []
+
+    async def _process(task_data):
+        await asyncio.sleep(durations[task_data["task_id"]])
+        finished.append(task_data["task_id"])
+
+    monkeypatch.setattr(worker, "process_task", _process)
+    return worker, durations, finished
+
+
+def _serve(task_queue, *batches):
+    """Return the batches from fetch, then block like an empty queue."""
+    pending = list(batches)
+
+    async def _fetch(count, timeout):
+        if pending:
+            return pending.pop(0)
+        await asyncio.sleep(timeout)
+        return []
+
+    task_queue.fetch = AsyncMock(side_effect=_fetch)
+
+
+async def _until(condition):
+    while not condition():
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_stop_finishes_fast_tasks_and_requeues_slow_ones(runner, task_queue):
+    worker, durations, finished = runner
+    durations.update(fast=0.02, slow=60)
+    fast, slow = _queued("fast"), _queued("slow")
+    _serve(task_queue, [fast, slow])
+
+    run = asyncio.create_task(worker.run())
+    await _until(lambda: len(worker.in_flight) == 2)
+    worker.stop()
+    await asyncio.wait_for(run, timeout=1)
+
+    assert finished == ["fast"]
+    task_queue.push.assert_awaited_once_with(slow.data)
+    acked = [call.args[0].data["task_id"] for call in task_queue.ack.await_args_list]
+    assert sorted(acked) == ["fast", "slow"]
+    assert worker.in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_stop_wakes_loop_waiting_for_a_free_slot(runner, task_queue, monkeypatch):
+    monkeypatch.setattr(settings, "worker_concurrency", 1)
+    worker, durations, finished = runner
+    durations["slow"] = 60
+    slow = _queued("slow")
+    _serve(task_queue, [slow])
+
+    run = asyncio.create_task(worker.run())
+    await _until(lambda: worker.in_flight)
+    await asyncio.sleep(0.05)  # The loop now waits for the only slot
+    worker.stop()
+    await asyncio.wait_for(run, timeout=1)
+
+    assert finished == []
+    task_queue.push.assert_awaited_once_with(slow.data)
+    task_queue.fetch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stop_during_blocking_fetch_hands_tasks_back(runner, task_queue):
+    worker, durations, finished = runner
+    queued = _queued("late")
+    fetching = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _fetch(count, timeout):
+        fetching.set()
+        await release.wait()
+        return [queued]
+
+    task_queue.fetch = AsyncMock(side_effect=_fetch)
+
+    run = asyncio.create_task(worker.run())
+    await fetching.wait()
+    worker.stop()
+    await asyncio.sleep(0.05)
+    assert not run.done()  # The read is awaited, not cancelled
+    release.set()
+    await asyncio.wait_for(run, timeout=1)
+
+    # Taken off the queue after the stop signal, so handed back unprocessed
+    assert finished == []
+    task_queue.push.assert_awaited_once_with(queued.data)
+    task_queue.ack.assert_awaited_once_with(queued)
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_tasks_within_timeout(runner, task_queue):
+    worker, durations, finished = runner
+    durations.update(a=0.01, b=0.03)
+    _serve(task_queue, [_queued("a"), _queued("b")])
+
+    run = asyncio.create_task(worker.run())
+    await _until(lambda: len(worker.in_flight) == 2)
+    worker.stop()
+    await asyncio.wait_for(run, timeout=1)
+
+    assert sorted(finished) == ["a", "b"]
+    task_queue.push.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_drain_without_tasks_returns_at_once(worker):
+    await asyncio.wait_for(worker.drain(), timeout=0.05)
@@ -1,17 +1,72 @@
 """Worker process for fetching Codeforces submissions with rate limiting."""
 
 import asyncio
+import contextlib
 import json
 import logging
 import signal
 import sys
 import time
-from typing import Optional
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from redis.asyncio import Redis
 
-from backend.infrastructure.codeforces_client import CodeforcesClient, UserNotFoundError
-from backend.infrastructure.redis_client import create_redis_client
+from backend.config import settings
+from backend.domain.models.codeforces import Submission
+from backend.infrastructure.cache_policy import (
+    SubmissionCadence,
+    cache_ttl_for,
+    cache_ttl_for_times,
+)
+from backend.infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from backend.infrastructure.codeforces_client import (
+    CodeforcesClient,
+    CodeforcesRateLimitError,
+    CodeforcesUnavailableError,
+    UserNotFoundError,
+)
+from backend.infrastructure.compression import compression_stats
+from backend.infrastructure.contest_divisions import (
+    ContestDivisionCache,
+    refresh_contest_divisions,
+)
+from backend.infrastructure.http_client import (
+    close_http_client,
+    get_http_client,
+    http_client_stats,
+)
+from backend.infrastructure.popularity import decay_popularity, popular_handles
+from backend.infrastructure.precomputed_responses import store_precomputed_responses
+from backend.infrastructure.problem_catalog import add_problems, refresh_problem_catalog
+from backend.infrastructure.rate_limiter import RedisRateLimiter
+from backend.infrastructure.redis_client import close_redis_client, get_redis_client
+from backend.infrastructure.task_queue import (
+    QueuedTask,
+    TaskPriority,
+    TaskQueue,
+    pending_task_key,
+    retry_backoff,
+)
+from backend.infrastructure.submission_cache import (
+    deserialize_submissions,
+    full_sync_key,
+    load_submissions,
+    merge_submissions,
+    meta_key,
+    new_data_version,
+    parse_cache_meta,
+    read_cache_entry,
+    save_cache_meta,
+    serialize_submissions,
+    store_submissions_stream,
+    submissions_key,
+    summarize_submissions,
+)
+from backend.infrastructure.submission_codec import SubmissionSummary
+from backend.infrastructure.unknown_handles import mark_unknown_handle
+from backend.services.metric_responses import precompute_responses
 
 # Configure logging
 logging.basicConfig(
@@ -21,54 +76,50 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class RateLimiter:
+async def _chain_history(
+    first_page: List[Submission], rest: Optional[AsyncIterator[Submission]]
+) -> AsyncIterator[Submission]:
     """
-    Token bucket rate limiter.
+    Yield a first page followed by the older submissions streamed after it.
+
+    Submissions made between the two requests shift the API's offsets, so the
+    stream may start with rows already in the first page; those are skipped.
+
+    Args:
+        first_page: Newest submissions, newest first
+        rest: Stream of the submissions after the first page (None if there are none)
 
-    Allows max 5 requests per second to Codeforces API.
+    Yields:
+        The whole history, newest first
     """
+    for submission in first_page:
+        yield submission
 
-    def __init__(self, max_requests: int = 5, time_window: float = 1.0):
-        """
-        Initialize rate limiter.
+    if rest is None:
+        return
 
-        Args:
-            max_requests: Maximum requests allowed per time window
-            time_window: Time window in seconds
-        """
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.tokens = max_requests
-        self.last_update = time.time()
-        self.lock = asyncio.Lock()
+    oldest_id = min(submission.id for submission in first_page)
+    async for submission in rest:
+        if submission.id < oldest_id:
+            yield submission
 
-    async def acquire(self) -> None:
-        """
-        Acquire a token, blocking if necessary.
 
-        This method will block until a token is available.
-        """
-        async with self.lock:
-            while True:
-                now = time.time()
-                elapsed = now - self.last_update
+@dataclass
+class ProbeStats:
+    """Outcomes of the count=1 freshness probe run before incremental refreshes."""
 
-                # Refill tokens based on elapsed time
-                self.tokens = min(
-                    self.max_requests,
-                    self.tokens + (elapsed * self.max_requests / self.time_window),
-                )
-                self.last_update = now
+    hits: int = 0  # Cached history was current, only its validity was extended
+    misses: int = 0  # New or rejudged submissions, the history was refetched
 
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    logger.debug(f"Token acquired. Remaining tokens: {self.tokens:.2f}")
-                    return
+    @property
+    def hit_ratio(self) -> float:
+        """Share of probes that made a refetch unnecessary."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
 
-                # Wait for next token
-                wait_time = (1 - self.tokens) * self.time_window / self.max_requests
-                logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert counters to a dictionary, including derived values."""
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 3)}
 
 
 class Worker:
@@ -82,27 +133,296 @@ class Worker:
         """Initialize worker."""
         self.redis: Optional[Redis] = None
         self.cf_client: Optional[CodeforcesClient] = None
-        self.rate_limiter: Optional[RateLimiter] = None
-        self.queue_key = "fetch_queue"
+        self.rate_limiter: Optional[RedisRateLimiter] = None
+        self.task_queue: Optional[TaskQueue] = None
+        self.circuit_breaker = CircuitBreaker(
+            "Codeforces",
+            failure_threshold=settings.codeforces_breaker_failure_threshold,
+            recovery_timeout=settings.codeforces_breaker_recovery_timeout,
+        )
         self.running = True
+        self.stopping = asyncio.Event()
+        self.probe_stats = ProbeStats()
+        self.contest_divisions = ContestDivisionCache(ttl=settings.contest_divisions_local_ttl)
+        self.in_flight: dict[asyncio.Task, QueuedTask] = {}
 
     async def setup(self) -> None:
         """Initialize Redis client, CF client, and rate limiter."""
         logger.info("Setting up worker...")
-        self.redis = await create_redis_client()
-        self.cf_client = CodeforcesClient()
-        self.rate_limiter = RateLimiter(max_requests=5, time_window=1.0)
+        self.redis = get_redis_client()
+        self.task_queue = TaskQueue(self.redis)
+        await self.task_queue.setup()
+        self.rate_limiter = RedisRateLimiter(
+            self.redis,
+            rate=settings.worker_rate_limit,
+            burst=settings.worker_rate_limit_burst,
+            key=settings.worker_rate_limit_key,
+            min_rate=settings.worker_rate_limit_min,
+            increase_step=settings.worker_rate_limit_increase,
+            decrease_factor=settings.worker_rate_limit_decrease,
+        )
+        self.cf_client = CodeforcesClient(
+            http_client=get_http_client(),
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+        )
         logger.info("Worker setup complete")
 
     async def cleanup(self) -> None:
         """Cleanup resources."""
         logger.info("Cleaning up worker...")
-        if self.cf_client:
-            await self.cf_client.close()
-        if self.redis:
-            await self.redis.close()
+        await close_http_client()
+        await close_redis_client()
         logger.info("Worker cleanup complete")
 
+    async def refresh_submissions(self, handle: str) -> int:
+        """
+        Fetch a handle's submission history and store it in the cache.
+
+        If the handle is cached and a full refetch happened within
+        ``settings.worker_full_refresh_interval``, a ``count=1`` probe checks
+        whether the newest submission is still the cached one. If so, only the
+        cache validity is extended; otherwise only submissions newer than the
+        highest cached id are downloaded and merged into the cached history.
+        Otherwise the whole history is streamed from the API straight into the
+        cache in chunks, which doubles as a periodic consistency pass (rejudges,
+        deleted submissions) and keeps memory bounded for huge accounts.
+
+        On a handle's first load, the newest ``settings.worker_page_size``
+        submissions are cached right away (marked as partial), so requests for
+        recent periods can be answered while the rest is backfilled.
+
+        How long the data stays fresh and cached is derived from the handle's
+        submission cadence (see ``SubmissionCadence``).
+
+        Args:
+            handle: Codeforces handle
+
+        Returns:
+            Number of cached submissions
+        """
+        assert self.redis is not None, "Redis client not initialized"
+        assert self.cf_client is not None, "Codeforces client not initialized"
+
+        cached = None
+        if await self.redis.exists(full_sync_key(handle)):
+            cached = await self.redis.get(submissions_key(handle))
+
+        if cached:
+            # A hit only needs the newest row and the creation times, not the whole history
+            summary = summarize_submissions(cached)
+
+            latest = await self.cf_client.get_latest_submission(handle)
+            if await self.record_probe(handle, summary, latest):
+                ttl = cache_ttl_for_times(summary.creation_times)
+                await save_cache_meta(self.redis, handle, ttl)
+                logger.info(f"Cache of {handle} unchanged, fresh for another {ttl.fresh}s")
+                return summary.count
+
+            cached_submissions = deserialize_submissions(cached)
+            new_submissions = []
+            if latest is not None and latest.id != summary.newest_id:
+                since_id = summary.newest_id or 0
+                logger.info(f"Fetching submissions for {handle} newer than {since_id}")
+                new_submissions = await self.cf_client.get_new_submissions(handle, since_id)
+                logger.info(f"Fetched {len(new_submissions)} new submissions for {handle}")
+
+            # The probed row may be a rejudge of the newest cached submission
+            if latest is not None:
+                new_submissions.append(latest)
+            await add_problems(self.redis, (s.problem for s in new_submissions))
+            submissions = merge_submissions(new_submissions, cached_submissions)
+            ttl = cache_ttl_for(submissions)
+            await save_cache_meta(
+                self.redis, handle, ttl, payload=serialize_submissions(submissions)
+            )
+            logger.info(f"Cache of {handle}: fresh {ttl.fresh}s, expires in {ttl.expire}s")
+            return len(submissions)
+
+        if await self.redis.exists(submissions_key(handle)):
+            history = self.cf_client.iter_user_submissions(handle)
+        else:
+            history = await self.load_first_page(handle)
+
+        logger.info(f"Streaming full submission history for {handle}")
+        cadence = SubmissionCadence()
+        count = await store_submissions_stream(
+            self.redis,
+            handle,
+            cadence.observe(history),
+            ttl=settings.cache_expire_max,
+            chunk_size=settings.worker_encode_chunk_size,
+        )
+        ttl = cadence.cache_ttl()
+        await save_cache_meta(self.redis, handle, ttl, version=new_data_version())
+        logger.info(f"Cache of {handle}: fresh {ttl.fresh}s, expires in {ttl.expire}s")
+        await self.redis.setex(
+            full_sync_key(handle), settings.worker_full_refresh_interval, int(time.time())
+        )
+        return count
+
+    async def load_first_page(self, handle: str) -> AsyncIterator[Submission]:
+        """
+        Cache the newest page of a handle that has no cached submissions yet.
+
+        A full page is cached as a partial history (``covers_from`` in the
+        cache metadata), so requests for recent periods can be answered while
+        older submissions are still being fetched.
+
+        Args:
+            handle: Codeforces handle
+
+        Returns:
+            Stream of the whole history, starting with the first page
+        """
+        assert self.redis is not None, "Redis client not initialized"
+        assert self.cf_client is not None, "Codeforces client not initialized"
+
+        page_size = settings.worker_page_size
+        first_page = await self.cf_client.get_user_submissions(
+            handle, from_index=1, count=page_size
+        )
+        if len(first_page) < page_size:  # The whole history fits into one page
+            return _chain_history(first_page, None)
+
+        ttl = cache_ttl_for(first_page)
+        await add_problems(self.redis, (s.problem for s in first_page))
+        covers_from = min(submission.creation_time_seconds for submission in first_page)
+        await save_cache_meta(
+            self.redis,
+            handle,
+            ttl,
+            covers_from=covers_from,
+            payload=serialize_submissions(first_page),
+        )
+        logger.info(f"Cached {len(first_page)} recent submissions of {handle}, backfilling")
+
+        rest = self.cf_client.iter_user_submissions(handle, from_index=page_size + 1)
+        return _chain_history(first_page, rest)
+
+    async def precompute_metrics(self, handle: str) -> int:
+        """
+        Precompute the default responses of all metric endpoints for every period.
+
+        The responses are computed from the cached submissions (off the event
+        loop) and stored under their data version, so the API can serve them
+        without analysing anything. Periods relative to the current time are
+        recomputed by every refresh of the handle; in between, the API
+        computes them itself once they lag behind the clock by more than
+        ``settings.precomputed_metrics_drift`` of their length.
+
+        Args:
+            handle: Codeforces handle
+
+        Returns:
+            Number of stored responses
+        """
+        assert self.redis is not None, "Redis client not initialized"
+
+        entry = await read_cache_entry(self.redis, handle)
+        if entry is None or entry.payload is None or entry.version is None:
+            return 0
+        submissions = await load_submissions(self.redis, entry.payload)
+        contest_divisions = await self.contest_divisions.get(self.redis)
+        expire = await self.redis.ttl(submissions_key(handle))
+        if expire <= 0:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        responses = await asyncio.to_thread(
+            precompute_responses,
+            handle,
+            submissions,
+            contest_divisions,
+            self.contest_divisions.version,
+            now,
+            entry.cache_age.covers,
+        )
+        await store_precomputed_responses(
+            self.redis, handle, entry.version, responses, computed_at=now.timestamp(), expire=expire
+        )
+        return len(responses)
+
+    async def record_probe(
+        self, handle: str, cached: SubmissionSummary, latest: Optional[Submission]
+    ) -> bool:
+        """
+        Compare the probed newest submission with the cached one and count the outcome.
+
+        Hits and misses are kept per process in ``self.probe_stats`` and
+        cluster-wide in the ``stats:freshness_probe`` hash.
+
+        Args:
+            handle: Codeforces handle
+            cached: Summary of the cached history
+            latest: Newest submission according to the API (None if none)
+
+        Returns:
+            True if the cached history is still current
+        """
+        assert self.redis is not None, "Redis client not initialized"
+
+        if cached.newest_id is None or latest is None:
+            unchanged = cached.newest_id is None and latest is None
+        else:
+            unchanged = (
+                latest.id == cached.newest_id and latest.verdict == cached.newest_verdict
+            )
+
+        if unchanged:
+            self.probe_stats.hits += 1
+        else:
+            self.probe_stats.misses += 1
+        await self.redis.hincrby("stats:freshness_probe", "hits" if unchanged else "misses", 1)
+        logger.debug(f"Freshness probe for {handle}: {'hit' if unchanged else 'miss'}")
+        return unchanged
+
+    async def retry_task(
+        self, task_data: dict, error: str, count_attempt: bool = True, min_delay: float = 0.0
+    ) -> None:
+        """
+        Schedule a delayed retry of a task that hit a transient error.
+
+        The delay grows exponentially (with jitter) per failed attempt; after
+        ``settings.worker_retry_max_attempts`` attempts the task fails.
+
+        Args:
+            task_data: Task data from queue
+            error: Error message, shown to the client if no attempts are left
+            count_attempt: Whether this failure uses up an attempt (False when
+                the request was never sent, e.g. rejected by the circuit breaker)
+            min_delay: Lower bound of the delay in seconds
+        """
+        assert self.task_queue is not None, "Task queue not initialized"
+
+        task_id = task_data["task_id"]
+        handle = task_data["handle"]
+        attempt = task_data.get("attempt", 0) + (1 if count_attempt else 0)
+
+        if attempt >= settings.worker_retry_max_attempts:
+            logger.error(f"Task {task_id} for {handle} failed after {attempt} attempts: {error}")
+            await self.fail_task(task_id, handle, error)
+            return
+
+        delay = max(retry_backoff(max(attempt, 1)), min_delay)
+        await self.task_queue.schedule_retry({**task_data, "attempt": attempt}, delay)
+        logger.info(f"Task {task_id} for {handle} retrying in {delay:.1f}s (attempt {attempt})")
+
+    async def fail_task(self, task_id: str, handle: str, error: str) -> None:
+        """
+        Mark a task as failed and release the handle's pending lock.
+
+        Args:
+            task_id: UUID of the task
+            handle: Codeforces handle
+            error: Error message shown to the client
+        """
+        assert self.redis is not None, "Redis client not initialized"
+
+        await self.redis.setex(f"task:{task_id}:status", 300, "failed")
+        await self.redis.setex(f"task:{task_id}:error", 300, error)
+        await self.redis.delete(pending_task_key(handle))
+
     async def process_task(self, task_data: dict) -> None:
         """
         Process a single task.
@@ -121,33 +441,39 @@ class Worker:
             logger.error(f"Invalid task data: {task_data}")
             return
 
-        logger.info(f"Processing task {task_id} for handle: {handle}")
-
-        try:
-            # Rate limiting
-            await self.rate_limiter.acquire()
+        # A background task escalated to the interactive lane exists twice; skip the later copy
+        status = await self.redis.get(f"task:{task_id}:status")
+        if status is not None and status.decode() in ("completed", "failed"):
+            logger.info(f"Task {task_id} for {handle} already finished, skipping")
+            return
 
-            # Fetch from CF API
-            logger.info(f"Fetching submissions for {handle}")
-            submissions = await self.cf_client.get_user_submissions(handle)
-            logger.info(f"Fetched {len(submissions)} submissions for {handle}")
+        priority = task_data.get("priority", TaskPriority.INTERACTIVE.value)
+        logger.info(f"Processing {priority} task {task_id} for handle: {handle}")
 
-            # Store in cache (24h TTL)
-            submissions_json = json.dumps([s.to_dict() for s in submissions])
-            await self.redis.setex(f"submissions:{handle}", 86400, submissions_json)
-            logger.info(f"Cached submissions for {handle} (24h TTL)")
+        try:
+            # Fetch from CF API (rate limited per request by the client) and cache
+            submission_count = await self.refresh_submissions(handle)
+            logger.info(f"Cached {submission_count} submissions for {handle}")
+
+            if settings.worker_precompute_metrics:
+                try:
+                    precomputed = await self.precompute_metrics(handle)
+                    logger.info(f"Precomputed {precomputed} metric responses for {handle}")
+                except Exception as e:
+                    # The API computes the responses itself
+                    logger.warning(f"Precomputing metrics for {handle} failed: {e}")
 
             # Update THIS task
             await self.redis.setex(f"task:{task_id}:status", 300, "completed")
             await self.redis.setex(
                 f"task:{task_id}:result",
                 300,
-                json.dumps({"handle": handle, "submission_count": len(submissions)}),
+                json.dumps({"handle": handle, "submission_count": submission_count}),
             )
             logger.info(f"Task {task_id} marked as completed")
 
             # Check for other pending tasks (deduplication level 3)
-            current_pending = await self.redis.get(f"pending_task:{handle}")
+            current_pending = await self.redis.get(pending_task_key(handle))
             if current_pending and current_pending.decode() != task_id:
                 # Update related task
                 other_task_id = current_pending.decode()
@@ -158,7 +484,7 @@ class Worker:
                     json.dumps(
                         {
                             "handle": handle,
-                            "submission_count": len(submissions),
+                            "submission_count": submission_count,
                             "completed_by": task_id,
                         }
                     ),
@@ -166,59 +492,326 @@ class Worker:
                 logger.info(f"Related task {other_task_id} marked as completed")
 
             # Remove pending_task lock
-            await self.redis.delete(f"pending_task:{handle}")
+            await self.redis.delete(pending_task_key(handle))
             logger.info(f"Removed pending_task lock for {handle}")
 
+            stats = http_client_stats
+            logger.info(
+                f"Codeforces connections: {stats.reused_requests}/{stats.requests} "
+                f"requests reused a pooled connection"
+            )
+            logger.info(f"Rate limiter: {self.rate_limiter.stats.as_dict()}")
+            logger.info(f"Freshness probe: {self.probe_stats.as_dict()}")
+            logger.info(f"Compression: {compression_stats.as_dict()}")
+
         except UserNotFoundError:
             logger.warning(f"User not found: {handle}")
-            await self.redis.setex(f"task:{task_id}:status", 300, "failed")
-            await self.redis.setex(
-                f"task:{task_id}:error", 300, f"User '{handle}' not found on Codeforces"
-            )
-            await self.redis.delete(f"pending_task:{handle}")
+            await mark_unknown_handle(self.redis, handle)
+            await self.fail_task(task_id, handle, f"User '{handle}' not found on Codeforces")
+
+        except CircuitOpenError as e:
+            logger.warning(f"Codeforces circuit open for task {task_id}: {e}")
+            await self.retry_task(task_data, str(e), count_attempt=False, min_delay=e.retry_after)
+
+        except (CodeforcesRateLimitError, CodeforcesUnavailableError) as e:
+            logger.warning(f"Transient Codeforces error for task {task_id}: {e}")
+            await self.retry_task(task_data, str(e))
 
         except Exception as e:
             logger.error(f"Error processing task {task_id}: {e}", exc_info=True)
-            await self.redis.setex(f"task:{task_id}:status", 300, "failed")
-            await self.redis.setex(f"task:{task_id}:error", 300, str(e))
-            await self.redis.delete(f"pending_task:{handle}")
+            await self.fail_task(task_id, handle, str(e))
+
+    async def _run_task(self, queued: QueuedTask, slots: asyncio.Semaphore) -> None:
+        """
+        Process a task in the background, acknowledge it and free its concurrency slot.
+
+        If the task is cancelled (shutdown drain timed out), it is pushed back
+        to the queue so another worker picks it up instead of losing it.
+
+        Args:
+            queued: Task taken off the queue
+            slots: Semaphore bounding the number of in-flight tasks
+        """
+        assert self.task_queue is not None, "Task queue not initialized"
+
+        try:
+            await self.process_task(queued.data)
+        except asyncio.CancelledError:
+            logger.warning(f"Task {queued.data.get('task_id')} interrupted, requeueing")
+            await self.task_queue.push(queued.data)
+            raise
+        finally:
+            try:
+                await self.task_queue.ack(queued)
+            finally:
+                slots.release()
+
+    def has_spare_budget(self) -> bool:
+        """Check whether Codeforces is healthy and the rate limiter is not backing off."""
+        assert self.rate_limiter is not None, "Rate limiter not initialized"
+
+        return (
+            not self.circuit_breaker.is_open
+            and self.rate_limiter.rate >= self.rate_limiter.max_rate
+            and len(self.in_flight) < settings.worker_concurrency
+        )
+
+    async def prefetch_popular(self) -> int:
+        """
+        Refresh popular handles shortly before their cached data turns stale.
+
+        Runs only with spare capacity: the queue is empty, Codeforces is not
+        throttling and this worker has free slots. One worker per
+        ``settings.worker_prefetch_interval`` performs the scan. Refreshes are
+        enqueued as background tasks, so they never delay interactive ones.
+
+        Returns:
+            Number of refreshes enqueued
+        """
+        assert self.redis is not None, "Redis client not initialized"
+        assert self.task_queue is not None, "Task queue not initialized"
+
+        if not self.has_spare_budget() or await self.task_queue.backlog() > 0:
+            return 0
+        if not await self.redis.set(
+            "prefetch_lock", self.task_queue.consumer, nx=True, ex=settings.worker_prefetch_interval
+        ):
+            return 0
+
+        handles = await popular_handles(
+            self.redis, settings.popularity_top_handles, settings.popularity_min_score
+        )
+        if not handles:
+            return 0
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for handle in handles:
+                pipe.hmget(meta_key(handle), "fetched_at", "fresh_ttl")
+            metas = await pipe.execute()
+
+        budget = settings.worker_concurrency - len(self.in_flight)
+        enqueued = 0
+
+        for handle, meta in zip(handles, metas):
+            cache_age = parse_cache_meta(*meta)
+            # Not cached (the next request fetches it) or not close to stale yet
+            if cache_age is None or cache_age.fresh_for > settings.worker_prefetch_lead:
+                continue
+            await self.task_queue.enqueue(handle, priority=TaskPriority.BACKGROUND)
+            enqueued += 1
+            if enqueued >= budget:
+                break
+
+        if enqueued:
+            logger.info(f"Enqueued proactive refresh of {enqueued} popular handle(s)")
+        return enqueued
+
+    async def run_scheduler(self) -> None:
+        """
+        Periodic housekeeping next to the main loop.
+
+        Moves due delayed retries back onto the fetch queue every second and,
+        with the stream backend, keeps in-flight entries from looking idle so
+        other workers do not claim them. Popular handles are refreshed ahead
+        of staleness and their popularity scores decayed.
+        """
+        assert self.redis is not None, "Redis client not initialized"
+        assert self.task_queue is not None, "Task queue not initialized"
+
+        touch_interval = settings.worker_stream_claim_idle / 4
+        next_touch = time.monotonic() + touch_interval
+        next_prefetch = time.monotonic()
+
+        while self.running:
+            try:
+                moved = await self.task_queue.promote_due_retries()
+                if moved:
+                    logger.info(f"Moved {moved} delayed task(s) back to the queue")
+
+                if time.monotonic() >= next_touch:
+                    next_touch = time.monotonic() + touch_interval
+                    await self.task_queue.touch(self.in_flight.values())
+
+                if time.monotonic() >= next_prefetch:
+                    next_prefetch = time.monotonic() + settings.worker_prefetch_interval
+                    await decay_popularity(self.redis)
+                    await self.prefetch_popular()
+            except Exception as e:
+                logger.error(f"Error in worker scheduler: {e}", exc_info=True)
+            await asyncio.sleep(1)
+
+    async def run_metadata_refresh(self) -> None:
+        """
+        Keep contest divisions and the problem catalog in Redis up to date.
+
+        Runs apart from the scheduler because contest.list and
+        problemset.problems downloads can take long enough to delay due retries.
+        """
+        assert self.redis is not None, "Redis client not initialized"
+        assert self.cf_client is not None, "Codeforces client not initialized"
+
+        while self.running:
+            try:
+                await refresh_contest_divisions(self.redis, self.cf_client)
+            except Exception as e:
+                logger.error(f"Error refreshing contest divisions: {e}", exc_info=True)
+            try:
+                await refresh_problem_catalog(self.redis, self.cf_client)
+            except Exception as e:
+                logger.error(f"Error refreshing problem catalog: {e}", exc_info=True)
+            await asyncio.sleep(60)
+
+    async def drain(self) -> None:
+        """
+        Wait for in-flight tasks to finish.
+
+        Tasks still running after ``settings.worker_shutdown_timeout`` seconds
+        are cancelled (and requeued by ``_run_task``).
+        """
+        if not self.in_flight:
+            return
+
+        logger.info(f"Draining {len(self.in_flight)} in-flight task(s)...")
+        _, pending = await asyncio.wait(
+            set(self.in_flight), timeout=settings.worker_shutdown_timeout
+        )
+
+        if pending:
+            logger.warning(f"Cancelling {len(pending)} task(s) still running after timeout")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _wait_or_stop(self, task: asyncio.Task) -> bool:
+        """
+        Wait for a task unless ``stop()`` is called first.
+
+        Args:
+            task: Task to wait for (left running if the worker stops first)
+
+        Returns:
+            True if the task finished
+        """
+        stopping = asyncio.ensure_future(self.stopping.wait())
+        try:
+            await asyncio.wait({task, stopping}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopping.cancel()
+        return task.done()
+
+    async def _requeue_fetched(self, fetch: asyncio.Task) -> None:
+        """
+        Hand back the tasks of a queue read that was still blocking when the worker stopped.
+
+        The read is awaited rather than cancelled: a blocking pop cancelled
+        after Redis already removed a task would lose that task.
+
+        Args:
+            fetch: Pending ``TaskQueue.fetch`` call
+        """
+        assert self.task_queue is not None, "Task queue not initialized"
+
+        try:
+            queued_tasks = await fetch
+        except Exception as e:
+            logger.warning(f"Queue read during shutdown failed: {e}")
+            return
+        for queued in queued_tasks:
+            logger.info(f"Requeueing task {queued.data.get('task_id')} fetched during shutdown")
+            try:
+                await self.task_queue.push(queued.data)
+            finally:
+                await self.task_queue.ack(queued)
 
     async def run(self) -> None:
         """
         Main worker loop.
 
-        Continuously polls Redis queue for tasks.
+        Continuously polls the task queue and processes up to
+        ``settings.worker_concurrency`` tasks at once, reading as many tasks
+        per round trip as there are free slots. All in-flight tasks share the
+        same rate limiter, so slow downloads no longer stall the queue while
+        the API budget sits idle. A background scheduler moves delayed retries
+        back onto the queue once they are due. ``stop()`` wakes the loop even
+        while it waits for a free slot or for the queue; in-flight tasks are
+        then drained before returning.
         """
-        assert self.redis is not None, "Redis client not initialized"
+        assert self.task_queue is not None, "Task queue not initialized"
+
+        slots = asyncio.Semaphore(settings.worker_concurrency)
+        scheduler = asyncio.create_task(self.run_scheduler())
+        metadata_refresher = asyncio.create_task(self.run_metadata_refresh())
+        late_fetch: Optional[asyncio.Task] = None
 
-        logger.info("Worker started. Waiting for tasks...")
+        logger.info(
+            f"Worker {self.task_queue.consumer} started with concurrency "
+            f"{settings.worker_concurrency} ({self.task_queue.backend} queue). Waiting for tasks..."
+        )
 
         while self.running:
+            # Stop burning requests while Codeforces is down
+            if self.circuit_breaker.is_open:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self.stopping.wait(), min(self.circuit_breaker.retry_after, 5) or 0.5
+                    )
+                continue
+
+            # Only take tasks off the queue once there is capacity to run them
+            acquire = asyncio.create_task(slots.acquire())
+            if not await self._wait_or_stop(acquire):
+                acquire.cancel()
+                break
+            started = 0
+
             try:
-                # BLPOP: blocking left pop with timeout
-                result = await self.redis.blpop([self.queue_key], timeout=5)  # type: ignore[misc]
-
-                if result:
-                    _, task_json = result
-                    task_data = json.loads(task_json)
-                    await self.process_task(task_data)
-                else:
+                if not self.running:
+                    break
+
+                free = max(settings.worker_concurrency - len(self.in_flight), 1)
+                fetch = asyncio.create_task(
+                    self.task_queue.fetch(count=free, timeout=settings.worker_fetch_timeout)
+                )
+                if not await self._wait_or_stop(fetch):
+                    late_fetch = asyncio.create_task(self._requeue_fetched(fetch))
+                    break
+                queued_tasks = fetch.result()
+
+                if not queued_tasks:
                     # Timeout - continue loop
                     logger.debug("No tasks in queue, waiting...")
 
+                for queued in queued_tasks:
+                    # The first slot is already held; the others are free by construction
+                    if started:
+                        await slots.acquire()
+                    task = asyncio.create_task(self._run_task(queued, slots))
+                    self.in_flight[task] = queued
+                    task.add_done_callback(lambda t: self.in_flight.pop(t, None))
+                    started += 1
+
             except asyncio.CancelledError:
                 logger.info("Worker cancelled")
                 break
             except Exception as e:
                 logger.error(f"Error in worker loop: {e}", exc_info=True)
                 await asyncio.sleep(1)  # Avoid tight loop on errors
-
+            finally:
+                if not started:
+                    slots.release()
+
+        scheduler.cancel()
+        metadata_refresher.cancel()
+        await asyncio.gather(scheduler, metadata_refresher, return_exceptions=True)
+        # Drain right away; a queue read still blocking hands its tasks back meanwhile
+        await asyncio.gather(self.drain(), *([late_fetch] if late_fetch else []))
         logger.info("Worker stopped")
 
     def stop(self) -> None:
-        """Signal worker to stop."""
+        """Signal worker to stop, waking the main loop if it is waiting."""
         logger.info("Stop signal received")
         self.running = False
+        self.stopping.set()
 
 
 async def main() -> None:
@@ -37,6 +37,11 @@ function App() {
       (m) => m.metadata.isStale
     )?.metadata ?? null;
 
+  const partialMetadata =
+    [dailyActivity, difficulty, tagRatingsRadar, tagRatingsBar, abandonedTags, abandonedRatings, divisionProblems].find(
+      (m) => m.metadata.isPartial
+    )?.metadata ?? null;
+
   const handleRefresh = () => {
     dailyActivity.refresh();
     difficulty.refresh();
@@ -122,6 +127,29 @@ function App() {
           </div>
         )}
 
+        {!initialLoading && !error && partialMetadata && (
+          <div className="bg-blue-50 dark:bg-blue-900/30 border-2 border-blue-300 dark:border-blue-700 rounded-lg p-6 mb-8 flex items-center gap-3">
+            <svg
+              className="w-6 h-6 text-blue-600 dark:text-blue-400 animate-spin"
+              fill="none"
+              strokeLinecap="round"
+              strokeLinejoin="round"
+              strokeWidth="2"
+              viewBox="0 0 24 24"
+              stroke="currentColor"
+            >
+              <path d="M4 4v5h.582m15.356 2A8.001 8.001 0 004.582 9m0 0H9m11 11v-5h-.581m0 0a8.003 8.003 0 01-15.357-2m15.357 2H15" />
+            </svg>
+            <div>
+              <h3 className="text-blue-900 dark:text-blue-300 font-semibold text-lg">Loading Full History</h3>
+              <p className="text-blue-800 dark:text-blue-400">
+                Showing the most recent submissions while older ones are fetched. The charts update
+                automatically once the full history is available.
+              </p>
+            </div>
+          </div>
+        )}
+
         {!initialLoading && !error && difficulty.data && tagRatingsRadar.data && (
           <>
             <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-8 mb-8">
@@ -1,6 +1,9 @@
 import { useState, useEffect, useCallback, useRef } from 'react';
 import type { DataMetadata, TimePeriod } from '../types/api';
 
+// How often to re-fetch data computed before the full history was fetched
+const PARTIAL_REFETCH_INTERVAL = 5000;
+
 interface UseMetricDataReturn<T> {
   data: T | null;
   allTimeData: T | null;
@@ -75,6 +78,33 @@ export function useMetricData<T>(
     };
   }, [handle, period, fetchFn]);
 
+  useEffect(() => {
+    if (!handle || !metadata.isPartial) return;
+
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      fetchFn(handle, false, period)
+        .then((result) => {
+          if (!cancelled) {
+            setData(result.data);
+            setMetadata(result.metadata);
+            if (period === 'all_time') {
+              setAllTimeData(result.data);
+            }
+          }
+        })
+        .catch(() => {
+          // Keep showing the partial data and try again on the next interval
+          if (!cancelled) setMetadata((current) => ({ ...current }));
+        });
+    }, PARTIAL_REFETCH_INTERVAL);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [handle, period, fetchFn, metadata]);
+
   const refresh = useCallback(() => {
     if (!handle) return;
 
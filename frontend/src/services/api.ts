@@ -1,4 +1,4 @@
-import axios, { AxiosError } from 'axios';
+import axios, { AxiosError, type AxiosResponse } from 'axios';
 import type {
   AbandonedProblemByTagsResponse,
   AbandonedProblemByRatingsResponse,
@@ -32,7 +32,17 @@ function isTaskResponse(data: unknown): data is TaskResponse {
   );
 }
 
-async function pollTask<T>(taskId: string, maxAttempts = 30): Promise<T> {
+function readMetadata(response: AxiosResponse): DataMetadata {
+  return {
+    isStale: response.headers['x-data-stale'] === 'true',
+    isPartial: response.headers['x-data-partial'] === 'true',
+    dataAge: response.headers['x-data-age']
+      ? parseInt(response.headers['x-data-age'], 10)
+      : undefined,
+  };
+}
+
+async function pollTask(taskId: string, stopOnPartial = false, maxAttempts = 30): Promise<void> {
   let attempt = 0;
   let delay = 2000;
 
@@ -47,10 +57,14 @@ async function pollTask<T>(taskId: string, maxAttempts = 30): Promise<T> {
       const response = await apiClient.get<TaskStatusResponse>(`/tasks/${taskId}`);
 
       if (response.status === 200) {
-        return response.data as unknown as T;
+        return;
       }
 
       if (response.status === 202) {
+        // Recent periods can be served while older history is still loading
+        if (stopOnPartial && response.data.partial) {
+          return;
+        }
         delay = Math.min(delay * 1.5, 10000);
         continue;
       }
@@ -108,30 +122,19 @@ async function fetchWithPolling<T>(
       const response = await apiClient.get<T | TaskResponse>(url);
 
       if (response.status === 202 && isTaskResponse(response.data)) {
-        const taskData = response.data;
-
-        await pollTask(taskData.task_id);
+        await pollTask(response.data.task_id, 'period' in params);
 
-        const dataResponse = await apiClient.get<T>(endpoint);
-
-        const metadata: DataMetadata = {
-          isStale: dataResponse.headers['x-data-stale'] === 'true',
-          dataAge: dataResponse.headers['x-data-age']
-            ? parseInt(dataResponse.headers['x-data-age'], 10)
-            : undefined,
-        };
+        let dataResponse = await apiClient.get<T | TaskResponse>(url);
+        if (dataResponse.status === 202 && isTaskResponse(dataResponse.data)) {
+          // The partial history does not cover this period yet; wait for the full load
+          await pollTask(dataResponse.data.task_id);
+          dataResponse = await apiClient.get<T | TaskResponse>(url);
+        }
 
-        return { data: dataResponse.data, metadata };
+        return { data: dataResponse.data as T, metadata: readMetadata(dataResponse) };
       }
 
-      const metadata: DataMetadata = {
-        isStale: response.headers['x-data-stale'] === 'true',
-        dataAge: response.headers['x-data-age']
-          ? parseInt(response.headers['x-data-age'], 10)
-          : undefined,
-      };
-
-      return { data: response.data as T, metadata };
+      return { data: response.data as T, metadata: readMetadata(response) };
     } catch (error) {
       if (axios.isAxiosError(error)) {
         const axiosError = error as AxiosError;
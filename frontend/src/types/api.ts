@@ -93,11 +93,13 @@ export interface TaskStatusResponse {
   submission_count?: number;
   message?: string;
   error?: string;
+  partial?: boolean; // Older history is still being fetched
 }
 
-// Metadata for stale data
+// Metadata for stale or partial data
 export interface DataMetadata {
   isStale: boolean;
+  isPartial?: boolean; // Computed before the full history was fetched
   dataAge?: number; // Age in seconds
 }
 